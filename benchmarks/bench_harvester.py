@@ -0,0 +1,109 @@
+"""
+EYE - Harvester micro-benchmark
+Measures DataHarvester.extract() throughput on large synthetic pages
+
+Usage:
+    python benchmarks/bench_harvester.py [--size-kb 2048] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.harvester import DataHarvester
+
+
+def pricing_page(size: int, rng: random.Random) -> str:
+    """
+    Number-heavy HTML table: prices, dates, SKUs, versions and a few phones
+    """
+    rows = []
+    length = 0
+    while length < size:
+        row = (
+            f"<tr><td>SKU-{rng.randint(10000, 99999)}</td>"
+            f"<td>${rng.randint(1, 9999)}.{rng.randint(0, 99):02d}</td>"
+            f"<td>2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}</td>"
+            f"<td>v{rng.randint(0, 9)}.{rng.randint(0, 20)}.{rng.randint(0, 99)}</td>"
+            f"<td>{rng.randint(1000, 9999)}-{rng.randint(100, 999)}</td>"
+        )
+        if rng.random() < 0.02:
+            row += f"<td>+1 ({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}</td>"
+        if rng.random() < 0.02:
+            row += f"<td>sales{rng.randint(1, 50)}@example.com</td>"
+        row += "</tr>\n"
+        rows.append(row)
+        length += len(row)
+    return "<table>\n" + "".join(rows) + "</table>"
+
+
+def js_bundle(size: int, rng: random.Random) -> str:
+    """
+    Minified-JS-like text: long identifiers, numeric literals and hex blobs
+    """
+    parts = []
+    length = 0
+    while length < size:
+        part = (
+            f"var a{rng.randint(0, 99999)}=[{','.join(str(rng.randint(0, 65535)) for _ in range(12))}];"
+            f"function f{rng.randint(0, 9999)}(e,t){{return e*{rng.random():.6f}+t-{rng.randint(0, 10 ** 9)}}}"
+            f"\"{''.join(rng.choice('0123456789abcdef') for _ in range(64))}\";"
+        )
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)
+
+
+def prose_page(size: int, rng: random.Random) -> str:
+    """
+    Text-heavy page with contact details scattered through it
+    """
+    words = ['contact', 'our', 'team', 'at', 'office', 'support', 'hours', 'call', 'us', 'today']
+    parts = []
+    length = 0
+    while length < size:
+        part = ' '.join(rng.choice(words) for _ in range(30))
+        if rng.random() < 0.1:
+            part += f" info{rng.randint(1, 500)}@company.org +44 20 {rng.randint(1000, 9999)} {rng.randint(1000, 9999)}"
+        parts.append(f"<p>{part}</p>\n")
+        length += len(parts[-1])
+    return "".join(parts)
+
+
+def bench(name: str, text: str, harvester: DataHarvester, repeat: int):
+    """
+    Time extract() on one page and print throughput
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        emails, phones = harvester.extract(text)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    size_mb = len(text) / (1024 * 1024)
+    print(f"{name:<10} {size_mb:7.2f} MB  best {best * 1000:8.1f} ms  "
+          f"{size_mb / best:7.1f} MB/s  emails={len(emails)} phones={len(phones)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DataHarvester extraction benchmark')
+    parser.add_argument('--size-kb', type=int, default=2048, help='Size of each synthetic page in KB')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per page (best is reported)')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    size = args.size_kb * 1024
+    harvester = DataHarvester()
+
+    bench('pricing', pricing_page(size, rng), harvester, args.repeat)
+    bench('js_bundle', js_bundle(size, rng), harvester, args.repeat)
+    bench('prose', prose_page(size, rng), harvester, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -17,38 +17,22 @@ CRITICAL_PORTS = [22, 3306, 5432, 27017, 6379]
 # API URLs
 CRT_SH_URL = "https://crt.sh/?q=%.{domain}&output=json"
 
+# Certificate Transparency index (incremental sync between runs)
+CT_INDEX_DIR = "output/ct_index"
+
+# Signature packs: user packs extend the built-in ones in modules/signatures
+SIGNATURE_PACK_DIR = "packs"
+PACK_CACHE_DIR = ".cache/packs"
+
+# Social profile verification verdicts (--verify-socials), reused until they expire
+SOCIAL_CACHE_FILE = "output/social_profiles_cache.json"
+
 # HTTP Headers
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
-# Sensitive File Paths
-SENSITIVE_PATHS = [
-    "/.env",
-    "/.git/HEAD",
-    "/.git/config",
-    "/admin",
-    "/admin.php",
-    "/phpinfo.php",
-    "/config.php",
-    "/config.json",
-    "/backup.zip",
-    "/backup.sql",
-    "/db_backup.sql",
-    "/.htaccess",
-    "/.htpasswd",
-    "/web.config",
-    "/robots.txt",
-    "/sitemap.xml",
-    "/.DS_Store",
-    "/composer.json",
-    "/package.json",
-    "/.env.local",
-    "/.env.production",
-    "/credentials.json",
-    "/settings.py",
-    "/config.yml",
-    "/docker-compose.yml",
-    "/Dockerfile",
-]
+# Sensitive File Paths: modules/signatures/sensitive_paths.json, extended by
+# packs/sensitive_paths.json. Paths listed here are checked as well.
+# SENSITIVE_PATHS = ["/your-custom-path"]
 
 # Screenshot Configuration
 SCREENSHOT_DIR = "output/screenshots"
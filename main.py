@@ -12,6 +12,7 @@ import asyncio
 import sys
 import os
 import shutil
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 from rich.console import Console
 
@@ -27,17 +28,26 @@ if not os.path.exists("config.py"):
 from rich.panel import Panel
 from modules.banner import show_logo
 from modules.subdomain import SubdomainHunter
+from modules.ct_index import CTIndex
+from modules.sources import build_sources
+from modules.permutations import find_permutations
 from modules.scanner import PortScanner
 from modules.fuzzer import SensitiveFileFuzzer
 from modules.harvester import DataHarvester
+from modules.contacts import ContactIndex
 from modules.cors import CORSScanner
 from modules.exporter import DataExporter
 from modules.socials import SocialHunter
+from modules.profiles import ProfileVerifier
+from modules.crawler import SiteCrawler
+from modules.offload import parse_executor
 from modules.springboot import hunt_actuators_multiple
 from modules.bypass_403 import attempt_bypass_multiple
 from modules.reporter import HTMLReporter
 from modules.watcher import AssetWatcher
-from modules.os_detect import detect_os_multiple, get_os_icon
+from modules.workers import scan_sharded
+from modules.resolver import host_resolver
+from modules.os_detect import detect_os_multiple, classify_hosts, get_os_icon
 from modules.tech_stack import identify_tech_multiple, get_tech_summary, get_tech_icon
 from modules import audit
 from config import CRITICAL_PORTS
@@ -347,6 +357,8 @@ Examples:
   python eye.py --domain target.com
   python eye.py -d 192.168.1.1
   python eye.py -d example.com --monitor --interval 3600
+  python eye.py -d example.com --workers 4
+  python eye.py -d example.com --offline --zone-file example.com.zone
 
 Note: This tool is for authorized security testing only.
         """
@@ -378,65 +390,73 @@ Note: This tool is for authorized security testing only.
         help='Monitoring interval in seconds (default: 21600 = 6 hours)'
     )
     
-    return parser.parse_args()
-
-
-async def main(domain, skip_fuzz=False, is_monitoring=False):
-    """
-    Main reconnaissance workflow
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Shard hosts across N processes, each with its own event loop (default: 1)'
+    )
     
-    Args:
-        domain (str): Target domain to scan
-        skip_fuzz (bool): Skip sensitive file fuzzing
-        is_monitoring (bool): Whether running in monitoring mode
-    """
-    # Display banner
-    show_logo()
+    parser.add_argument(
+        '--permute',
+        action='store_true',
+        help='Generate and resolve permutations of discovered subdomains'
+    )
     
-    # Display target information
-    import socket
-    target_display = f"[bold cyan]Target:[/bold cyan] {domain}"
+    parser.add_argument(
+        '--verify-socials',
+        action='store_true',
+        help='Check that discovered social profiles exist (rate-limited, cached on disk)'
+    )
     
-    # Try to resolve IP if domain provided
-    try:
-        # Check if input is already an IP
-        socket.inet_aton(domain)
-        is_ip = True
-        target_display = f"[bold cyan]Target IP:[/bold cyan] {domain}"
-    except socket.error:
-        # It's a domain, try to resolve IP
-        is_ip = False
-        try:
-            ip_address = socket.gethostbyname(domain)
-            target_display = f"[bold cyan]Target:[/bold cyan] {domain}\n[bold yellow]IP Address:[/bold yellow] {ip_address}"
-        except:
-            target_display = f"[bold cyan]Target:[/bold cyan] {domain}\n[bold yellow]IP Address:[/bold yellow] Unable to resolve"
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Skip network subdomain sources and use only local ones'
+    )
     
-    console.print(Panel.fit(
-        target_display,
-        border_style="bright_blue"
-    ))
-    console.print()
+    parser.add_argument(
+        '--zone-file',
+        action='append',
+        default=[],
+        help='DNS zone file to read subdomains from (repeatable)'
+    )
     
-    # Phase 1: Subdomain Discovery
-    console.print("[bold yellow]═══ Phase 1: Subdomain Discovery ═══[/bold yellow]")
-    hunter = SubdomainHunter()
-    subdomains = await hunter.find_subdomains(domain)
+    parser.add_argument(
+        '--import-scan',
+        action='append',
+        default=[],
+        help='Previous EYE JSON export or watcher state file to reuse subdomains from (repeatable)'
+    )
     
-    if not subdomains:
-        console.print("[!] [yellow]No subdomains discovered via Certificate Transparency[/yellow]")
-        console.print(f"[*] [cyan]Continuing scan with main domain: {domain}[/cyan]")
-        subdomains = {domain}  # Use main domain as fallback
+    parser.add_argument(
+        '--ct-dump',
+        action='append',
+        default=[],
+        help='Saved crt.sh JSON response to read certificates from (repeatable)'
+    )
     
-    console.print()
+    return parser.parse_args()
+
+
+async def scan_hosts(subdomains, skip_fuzz=False):
+    """
+    Run the per-host phases (port scan, OS detection, advanced scanning)
     
+    Args:
+        subdomains (set/list): Hosts to scan
+        skip_fuzz (bool): Skip sensitive file fuzzing
+        
+    Returns:
+        dict: Phase results keyed like the export_data sections
+    """
     # Phase 2: Port Scanning
     console.print("[bold yellow]═══ Phase 2: Port Scanning ═══[/bold yellow]")
     console.print("[*] Starting port scanning...")
     console.print()
     
     # Initialize scanner
-    scanner = PortScanner()
+    scanner = PortScanner(capture_ttl=True)
     
     # Run port scanning
     scan_results = await scanner.scan_multiple(subdomains)
@@ -446,51 +466,23 @@ async def main(domain, skip_fuzz=False, is_monitoring=False):
     console.print()
     console.print("[bold yellow]═══ Phase 2.5: Operating System Detection ═══[/bold yellow]")
     
-    # Extract IP addresses from scan results
-    active_ips = []
+    # Map active hosts to IPs once: the scan's peer address when known,
+    # otherwise a (cached) async lookup
+    active_hosts = [result['host'] for result in scan_results if result.get('open_ports')]
     for result in scan_results:
-        if result.get('open_ports'):
-            host = result['host']
-            # Try to resolve to IP if it's a domain
-            try:
-                import socket
-                socket.inet_aton(host)
-                # Already an IP
-                active_ips.append(host)
-            except socket.error:
-                # It's a domain, resolve it
-                try:
-                    ip = socket.gethostbyname(host)
-                    active_ips.append(ip)
-                except:
-                    pass
+        if result.get('open_ports') and result.get('ip'):
+            host_resolver.remember(result['host'], result['ip'])
+    host_map = await host_resolver.resolve_many(active_hosts)
+    
+    # SYN-ACK fingerprints captured during the port scan, keyed by IP
+    passive_fingerprints = {}
+    for result in scan_results:
+        if result.get('fingerprint') and result['host'] in host_map:
+            passive_fingerprints[host_map[result['host']]] = result['fingerprint']
     
     os_detection_results = {}
-    if active_ips:
-        # Remove duplicates
-        active_ips = list(set(active_ips))
-        os_detection_results = await detect_os_multiple(active_ips)
-        
-        # Map back to hostnames
-        os_by_host = {}
-        for result in scan_results:
-            host = result['host']
-            try:
-                import socket
-                socket.inet_aton(host)
-                # It's an IP
-                if host in os_detection_results:
-                    os_by_host[host] = os_detection_results[host]
-            except socket.error:
-                # It's a domain, get its IP
-                try:
-                    ip = socket.gethostbyname(host)
-                    if ip in os_detection_results:
-                        os_by_host[host] = os_detection_results[ip]
-                except:
-                    pass
-        
-        os_detection_results = os_by_host
+    if host_map:
+        os_detection_results = await detect_os_multiple(sorted(set(host_map.values())), passive_fingerprints, host_map)
     else:
         console.print("[*] [dim]No active hosts for OS detection[/dim]")
     
@@ -510,6 +502,7 @@ async def main(domain, skip_fuzz=False, is_monitoring=False):
     # Phase 3: Advanced Scanning (Parallel execution for speed)
     sensitive_findings = []
     harvest_results = {}
+    contact_index = ContactIndex()
     cors_vulnerabilities = []
     audit_results = {}
     social_profiles = {}
@@ -527,25 +520,43 @@ async def main(domain, skip_fuzz=False, is_monitoring=False):
         harvester = DataHarvester()
         cors_scanner = CORSScanner()
         social_hunter = SocialHunter()
+        crawler = SiteCrawler()
+        
+        # One crawl per site feeds both the harvester and the social hunter
+        console.print(f"[*] Crawling [cyan]{len(web_hosts)}[/cyan] sites for contact data and social profiles...")
         
         # Run all scans in parallel for better performance
         results = await asyncio.gather(
             fuzzer.fuzz_multiple(web_hosts),
-            harvester.harvest_multiple(web_hosts),
+            crawler.crawl_multiple(web_hosts, [harvester.harvest_page, social_hunter.hunt_page]),
             cors_scanner.scan_multiple(web_hosts),
             audit.audit_multiple(web_hosts),
-            social_hunter.hunt_multiple(web_hosts),
             identify_tech_multiple(web_hosts),
             return_exceptions=True
         )
         
         # Extract results
         sensitive_findings = results[0] if not isinstance(results[0], Exception) else []
-        harvest_results = results[1] if not isinstance(results[1], Exception) else {}
+        if not isinstance(results[1], Exception):
+            console.print(f"[*] Crawled [cyan]{crawler.pages_fetched}[/cyan] pages")
+        harvest_results = harvester.collect(web_hosts)
+        contact_index = harvester.index
         cors_vulnerabilities = results[2] if not isinstance(results[2], Exception) else []
         audit_results = results[3] if not isinstance(results[3], Exception) else {}
-        social_profiles = results[4] if not isinstance(results[4], Exception) else []
-        tech_stack_results = results[5] if not isinstance(results[5], Exception) else {}
+        social_profiles = social_hunter.collect(web_hosts)
+        tech_stack_results = results[4] if not isinstance(results[4], Exception) else {}
+        
+        # Refine OS guesses now that HTTP Server headers are known
+        if os_detection_results:
+            servers = {}
+            for url, tech in tech_stack_results.items():
+                host = urlparse(url).hostname
+                if tech.get('server') and host in os_detection_results:
+                    servers.setdefault(host, tech['server'])
+            fingerprints = {r['host']: r['fingerprint'] for r in scan_results if r.get('fingerprint')}
+            if servers:
+                classify_hosts(os_detection_results, fingerprints, servers)
+                console.print(f"[*] OS fingerprints refined with Server headers for [cyan]{len(servers)}[/cyan] hosts")
         
         # Phase 3.5: Red Team - Spring Boot Actuator Hunt
         console.print()
@@ -569,19 +580,133 @@ async def main(domain, skip_fuzz=False, is_monitoring=False):
             bypass_results = await attempt_bypass_multiple(bypass_targets)
         else:
             console.print("[*] No 403/401 responses to attempt bypass on")
+        
+        # Parsing is done for this scan; release the worker processes
+        parse_executor.shutdown()
     
     elif not web_hosts:
         console.print()
         console.print("[!] [yellow]No web services found for advanced scanning[/yellow]")
     
+    return {
+        'scan_results': scan_results,
+        'os_detection': os_detection_results,
+        'technology_stack': tech_stack_results,
+        'sensitive_files': sensitive_findings,
+        'harvest_results': harvest_results,
+        'contact_index': contact_index,
+        'cors_vulnerabilities': cors_vulnerabilities,
+        'security_audit': audit_results,
+        'social_profiles': social_profiles,
+        'redteam_actuators': actuator_findings,
+        'redteam_bypasses': bypass_results
+    }
+
+
+async def main(domain, skip_fuzz=False, is_monitoring=False, workers=1, source_options=None, permute=False,
+               verify_socials=False):
+    """
+    Main reconnaissance workflow
+    
+    Args:
+        domain (str): Target domain to scan
+        skip_fuzz (bool): Skip sensitive file fuzzing
+        is_monitoring (bool): Whether running in monitoring mode
+        workers (int): Number of processes to shard the host list across
+        source_options (dict): Keyword arguments for build_sources (offline, zone_files, ...)
+        permute (bool): Resolve permutations of discovered subdomains
+        verify_socials (bool): Verify discovered social profiles and drop dead ones
+    """
+    # Display banner
+    show_logo()
+    
+    # Display target information
+    import socket
+    target_display = f"[bold cyan]Target:[/bold cyan] {domain}"
+    
+    # Try to resolve IP if domain provided
+    try:
+        # Check if input is already an IP
+        socket.inet_aton(domain)
+        is_ip = True
+        target_display = f"[bold cyan]Target IP:[/bold cyan] {domain}"
+    except socket.error:
+        # It's a domain, try to resolve IP
+        is_ip = False
+        try:
+            ip_address = socket.gethostbyname(domain)
+            target_display = f"[bold cyan]Target:[/bold cyan] {domain}\n[bold yellow]IP Address:[/bold yellow] {ip_address}"
+        except:
+            target_display = f"[bold cyan]Target:[/bold cyan] {domain}\n[bold yellow]IP Address:[/bold yellow] Unable to resolve"
+    
+    console.print(Panel.fit(
+        target_display,
+        border_style="bright_blue"
+    ))
+    console.print()
+    
+    # Phase 1: Subdomain Discovery
+    console.print("[bold yellow]═══ Phase 1: Subdomain Discovery ═══[/bold yellow]")
+    # Local CT index lets repeat runs and watcher cycles skip already-seen certificates
+    ct_index = None if is_ip else CTIndex(domain)
+    sources = build_sources(index=ct_index, **(source_options or {}))
+    hunter = SubdomainHunter(index=ct_index, sources=sources)
+    subdomains = await hunter.find_subdomains(domain)
+    
+    # Phase 1.5: Permutations of discovered names
+    if permute and subdomains and hunter.trie.apex:
+        console.print()
+        console.print("[bold yellow]═══ Phase 1.5: Subdomain Permutations ═══[/bold yellow]")
+        for name in await find_permutations(hunter.trie):
+            name = hunter.trie.add(name)
+            if name:
+                subdomains.add(name)
+    
+    if not subdomains:
+        console.print("[!] [yellow]No subdomains discovered from passive sources[/yellow]")
+        console.print(f"[*] [cyan]Continuing scan with main domain: {domain}[/cyan]")
+        subdomains = {domain}  # Use main domain as fallback
+    else:
+        # Scan hosts in the densest parts of the namespace first
+        subdomains = hunter.trie.prioritized()
+    
+    console.print()
+    
+    # Phases 2-3.6: per-host scanning (optionally sharded across processes)
+    if workers > 1 and len(subdomains) > 1:
+        phase_results = await scan_sharded(scan_hosts, subdomains, workers, skip_fuzz)
+    else:
+        phase_results = await scan_hosts(subdomains, skip_fuzz)
+    
+    scan_results = phase_results['scan_results']
+    os_detection_results = phase_results['os_detection']
+    tech_stack_results = phase_results['technology_stack']
+    sensitive_findings = phase_results['sensitive_files']
+    harvest_results = phase_results['harvest_results']
+    contact_index = phase_results.get('contact_index') or ContactIndex()
+    cors_vulnerabilities = phase_results['cors_vulnerabilities']
+    audit_results = phase_results['security_audit']
+    social_profiles = phase_results['social_profiles']
+    actuator_findings = phase_results['redteam_actuators']
+    bypass_results = phase_results['redteam_bypasses']
+    
+    # Phase 3.7: Social profile verification, once for all hosts (and shards)
+    social_verification = {}
+    if verify_socials and social_profiles:
+        console.print()
+        console.print("[bold yellow]═══ Phase 3.7: Social Profile Verification ═══[/bold yellow]")
+        social_verification = await ProfileVerifier().verify_hunt(social_profiles)
+        social_profiles = ProfileVerifier.prune(social_profiles, social_verification)
+    
     # Display final summary
     console.print()
     console.print("[bold green]═══ Scan Complete ═══[/bold green]")
     
     active_hosts = len([r for r in scan_results if r.get('open_ports')])
     total_open_ports = sum(len(r.get('open_ports', [])) for r in scan_results)
-    total_emails = sum(len(data.get('emails', set())) for data in harvest_results.values())
-    total_phones = sum(len(data.get('phones', set())) for data in harvest_results.values())
+    # Unique across all hosts
+    total_emails = len(contact_index.emails)
+    total_phones = len(contact_index.phones)
     ssl_warnings = sum(1 for data in audit_results.values() if data.get('ssl_status') in ['WARNING', 'EXPIRED'])
     total_socials = sum(len(links) for url_data in social_profiles.values() for links in url_data.values())
     total_actuators = sum(len(data.get('actuators_found', [])) for data in actuator_findings.values())
@@ -613,7 +738,9 @@ async def main(domain, skip_fuzz=False, is_monitoring=False):
         'technology_stack': tech_stack_results,
         'sensitive_files': sensitive_findings,
         'harvest_data': {url: {'emails': list(data.get('emails', set())), 'phones': list(data.get('phones', set()))} for url, data in harvest_results.items()},
+        'contacts': contact_index.to_dict(),
         'social_profiles': {url: {platform: list(links) for platform, links in profiles.items()} for url, profiles in social_profiles.items()},
+        'social_verification': social_verification,
         'cors_vulnerabilities': cors_vulnerabilities,
         'security_audit': audit_results,
         'redteam_actuators': actuator_findings,
@@ -688,11 +815,24 @@ def run():
         domain = domain.replace('http://', '').replace('https://', '')
         domain = domain.rstrip('/')
         
+        if args.workers < 1:
+            console.print("[!] [red]--workers must be at least 1[/red]")
+            sys.exit(1)
+        
+        source_options = {
+            'offline': args.offline,
+            'zone_files': args.zone_file,
+            'scan_exports': args.import_scan,
+            'ct_dumps': args.ct_dump
+        }
+        
         # Check if monitoring mode is enabled
         if args.monitor:
             # Create a wrapper function for the watcher
-            async def scan_wrapper(target, skip_f):
-                return await main(target, skip_f, is_monitoring=True)
+            async def scan_wrapper(target, _, skip_f):
+                return await main(target, skip_f, is_monitoring=True, workers=args.workers,
+                                  source_options=source_options, permute=args.permute,
+                                  verify_socials=args.verify_socials)
             
             # Initialize and run watcher
             async def run_watcher():
@@ -702,7 +842,8 @@ def run():
             asyncio.run(run_watcher())
         else:
             # Run normal single scan
-            asyncio.run(main(domain, args.no_fuzz))
+            asyncio.run(main(domain, args.no_fuzz, workers=args.workers, source_options=source_options,
+                             permute=args.permute, verify_socials=args.verify_socials))
         
     except KeyboardInterrupt:
         console.print("\n[!] [yellow]Scan interrupted by user[/yellow]")
@@ -0,0 +1,213 @@
+"""
+EYE - Response Baseline Module
+Cheap response fingerprints compared against per-host baselines to spot
+homepage echoes and soft errors before any expensive parsing
+"""
+
+import asyncio
+import hashlib
+import re
+import uuid
+from collections import Counter
+from functools import cached_property
+from typing import Dict, Iterable, Optional
+from urllib.parse import unquote, urljoin, urlparse
+import aiohttp
+from modules.document import Document
+
+# Body characters fingerprinted (enough to tell pages apart)
+FINGERPRINT_BODY_LIMIT = 64 * 1024
+
+# Simhashes of the same page differ in at most this many of their 64 bits
+SIMHASH_DISTANCE = 3
+
+# Most frequent distinct tokens hashed per page (bounds the simhash cost)
+SIMHASH_MAX_TOKENS = 512
+
+# Alphabetic words only: numbers, hex tokens and timestamps change on every request
+TOKEN_PATTERN = re.compile(r"(?<![a-z0-9_])[a-z]{2,}(?![a-z0-9_])")
+
+# Baseline names, in the order a candidate is compared against them
+BASELINES = ('homepage', 'not_found', 'forbidden')
+
+
+def simhash(text: str, ignore: Iterable[str] = ()) -> int:
+    """
+    64-bit simhash of the word tokens of a text (count-weighted)
+
+    Near-identical texts (a changing date or CSRF token) get hashes
+    differing in only a few bits. Only the SIMHASH_MAX_TOKENS most
+    frequent tokens are hashed.
+
+    Args:
+        text: Lowercased text
+        ignore: Tokens left out (e.g. those of a reflected request path)
+    """
+    counts = Counter(TOKEN_PATTERN.findall(text))
+    for token in ignore:
+        counts.pop(token, None)
+    weights = [0] * 64
+    for token, count in counts.most_common(SIMHASH_MAX_TOKENS):
+        value = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            weights[bit] += count if value >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def redirect_target(location: str, base_url: str = '') -> str:
+    """
+    Comparable form of a redirect target: host and path, no trailing slash
+
+    Args:
+        location: Location header value
+        base_url: URL the redirect came from (resolves relative locations)
+    """
+    parsed = urlparse(urljoin(base_url, location))
+    return parsed.netloc.lower() + (parsed.path.rstrip('/') or '/')
+
+
+class Fingerprint:
+    """
+    Summary of one response for comparison against baselines
+
+    Status, length bucket, title and redirect target are cheap and taken
+    up front; the simhash of the visible text is computed only when a
+    comparison gets past them.
+    """
+
+    def __init__(self, status: int, content: str = '', location: Optional[str] = None, base_url: str = ''):
+        """
+        Fingerprint one response
+
+        Args:
+            status: HTTP status
+            content: Response body
+            location: Location header of redirects
+            base_url: URL the response came from (resolves relative redirects;
+                its path tokens are left out of the simhash, since error pages
+                often echo the requested path)
+        """
+        self.status = status
+        self.bucket = len(content).bit_length()
+        self.target = redirect_target(location, base_url) if location else None
+        self._document = Document(content[:FINGERPRINT_BODY_LIMIT])
+        self._base_url = base_url
+
+    @cached_property
+    def title(self) -> Optional[str]:
+        return self._document.title
+
+    @cached_property
+    def simhash(self) -> int:
+        reflected = TOKEN_PATTERN.findall(unquote(urlparse(self._base_url).path).lower())
+        return simhash(self._document.visible_text.lower(), reflected)
+
+
+def fingerprint(status: int, content: str = '', location: Optional[str] = None, base_url: str = '') -> Fingerprint:
+    """
+    Fingerprint one response (see Fingerprint)
+    """
+    return Fingerprint(status, content, location, base_url)
+
+
+def similar(candidate: Fingerprint, baseline: Fingerprint) -> bool:
+    """
+    Whether two fingerprints describe the same page
+
+    Redirects match on their target. Other responses must share the
+    status when the baseline succeeded (an echoed error page comes back
+    as 200), be one length bucket apart at most and have the same title;
+    only then are their simhashes compared.
+    """
+    if candidate.target or baseline.target:
+        return candidate.target == baseline.target
+    if baseline.status < 400 and candidate.status != baseline.status:
+        return False
+    if abs(candidate.bucket - baseline.bucket) > 1 or candidate.title != baseline.title:
+        return False
+    return bin(candidate.simhash ^ baseline.simhash).count('1') <= SIMHASH_DISTANCE
+
+
+class HostBaseline:
+    """
+    What a host answers when nothing was bypassed: its homepage, a random
+    missing path and the original 403/401 page
+
+    A bypass candidate resembling any of them is an echo or a soft error,
+    not restricted content. Redirects are echoes when they lead to the
+    site root or wherever the homepage itself redirects.
+    """
+
+    def __init__(self, fingerprints: Dict[str, Fingerprint] = None, redirects: Dict[str, str] = None):
+        """
+        Initialize baseline
+
+        Args:
+            fingerprints: Baseline name (see BASELINES) -> fingerprint
+            redirects: Redirect target (see redirect_target) -> baseline name
+        """
+        self.fingerprints = fingerprints or {}
+        self.redirects = redirects or {}
+        self.rejected = Counter()
+
+    @classmethod
+    async def build(cls, session: aiohttp.ClientSession, url: str, limit: asyncio.Semaphore) -> 'HostBaseline':
+        """
+        Fetch the baseline responses for the host of a restricted URL
+
+        Args:
+            session: Shared client session
+            url: Restricted URL (its response is the 'forbidden' baseline)
+            limit: Semaphore bounding in-flight requests to the host
+
+        Returns:
+            HostBaseline (missing baselines are skipped when comparing)
+        """
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        # Homepage after redirects (what an echo would contain); the others as sent
+        requests = {
+            'homepage': (origin + '/', True),
+            'not_found': (f"{origin}/{uuid.uuid4().hex}", False),
+            'forbidden': (url, False)
+        }
+
+        # Redirects to the site root, or to where the homepage redirects, lead back to the homepage
+        redirects = {redirect_target(origin + '/'): 'homepage'}
+
+        async def fetch(target: str, follow: bool) -> Optional[Fingerprint]:
+            try:
+                async with limit:
+                    async with session.get(target, ssl=False, allow_redirects=follow) as response:
+                        for hop in response.history[:1]:
+                            location = hop.headers.get('Location')
+                            if location:
+                                redirects.setdefault(redirect_target(location, target), 'homepage')
+                        content = await response.text(errors='replace')
+                        return fingerprint(response.status, content, response.headers.get('Location'), target)
+            except Exception:
+                return None
+
+        results = await asyncio.gather(*(fetch(target, follow) for target, follow in requests.values()))
+        return cls({name: result for name, result in zip(requests, results) if result is not None}, redirects)
+
+    def match(self, candidate: Fingerprint) -> Optional[str]:
+        """
+        Name of the baseline a candidate response resembles
+
+        Args:
+            candidate: Fingerprint of a bypass response
+
+        Returns:
+            'homepage', 'not_found' or 'forbidden', or None for a new page
+        """
+        name = self.redirects.get(candidate.target) if candidate.target else None
+        if name is not None:
+            self.rejected[name] += 1
+            return name
+        for name in BASELINES:
+            baseline = self.fingerprints.get(name)
+            if baseline is not None and similar(candidate, baseline):
+                self.rejected[name] += 1
+                return name
+        return None
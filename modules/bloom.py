@@ -0,0 +1,68 @@
+"""
+EYE - Bloom Filter Module
+Fixed-memory probabilistic set for deduplicating large candidate streams
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Classic Bloom filter using double hashing over a single blake2b digest
+
+    Membership tests may return false positives (at roughly error_rate
+    once capacity items are stored) but never false negatives.
+    """
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001):
+        """
+        Size the filter for an expected number of items
+
+        Args:
+            capacity: Expected number of distinct items
+            error_rate: Target false positive probability at capacity
+        """
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> bool:
+        """
+        Insert an item
+
+        Args:
+            item: Item to add
+
+        Returns:
+            True if the item was (probably) not present before
+        """
+        added = False
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            mask = 1 << bit
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self.count
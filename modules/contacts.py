@@ -0,0 +1,337 @@
+"""
+EYE - Contact Index Module
+Scan-wide index of normalized emails and phone numbers with counts and provenance
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+try:
+    import phonenumbers
+except ImportError:
+    phonenumbers = None
+
+# Region assumed for national-format numbers (e.g. "US"); None keeps them as digits
+DEFAULT_PHONE_REGION = None
+
+# E.164 numbers carry at most 15 digits
+E164_MAX_DIGITS = 15
+E164_MIN_DIGITS = 8
+
+NON_DIGIT_PATTERN = re.compile(r"\D")
+
+# NANP number written nationally: NXX NXX XXXX
+NANP_PATTERN = re.compile(r"1?[2-9]\d{2}[2-9]\d{6}")
+
+
+def normalize_email(email: str) -> Optional[str]:
+    """
+    Canonical form of an email address
+
+    Args:
+        email: Raw email address
+
+    Returns:
+        Lowercased address without surrounding punctuation, or None if invalid
+    """
+    email = email.strip().strip('.,;:<>()[]"\'').lower()
+    local, _, domain = email.rpartition('@')
+    if not local or '.' not in domain:
+        return None
+    return email
+
+
+def normalize_phone(phone: str, region: Optional[str] = DEFAULT_PHONE_REGION) -> Optional[str]:
+    """
+    Canonical form of a phone number, E.164 where the country is known
+
+    Uses the phonenumbers package when installed; otherwise numbers written
+    with "+" or "00", and NANP numbers when region is US/CA, become E.164.
+    Other national numbers are kept as plain digits.
+
+    Args:
+        phone: Raw phone number
+        region: ISO country code assumed for national numbers
+
+    Returns:
+        "+<digits>" (E.164), plain digits, or None if it cannot be a phone
+    """
+    phone = phone.strip()
+    if phonenumbers is not None:
+        try:
+            parsed = phonenumbers.parse(phone, region)
+            if phonenumbers.is_possible_number(parsed):
+                return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+        except phonenumbers.NumberParseException:
+            pass
+
+    digits = ''.join(str(int(c)) for c in NON_DIGIT_PATTERN.sub('', phone))
+    if not digits:
+        return None
+    if phone.startswith('+'):
+        international = digits
+    elif digits.startswith('00'):
+        international = digits[2:]
+    elif region in ('US', 'CA') and NANP_PATTERN.fullmatch(digits):
+        international = digits if len(digits) == 11 else '1' + digits
+    else:
+        return digits
+    if E164_MIN_DIGITS <= len(international) <= E164_MAX_DIGITS:
+        return '+' + international
+    return digits
+
+
+def _host(url: str) -> str:
+    """
+    Lowercased host name of a URL (a bare host is returned as is)
+    """
+    return (urlparse(url).hostname or url).lower()
+
+
+def domain_suffixes(domain: str) -> List[str]:
+    """
+    The domain and each parent with at least two labels
+
+    e.g. "mail.eu.example.com" -> ["mail.eu.example.com", "eu.example.com", "example.com"]
+    """
+    labels = domain.split('.')
+    return ['.'.join(labels[i:]) for i in range(max(1, len(labels) - 1))]
+
+
+class ContactIndex:
+    """
+    Deduplicated emails and phones across a whole scan
+
+    Each contact keeps an occurrence count and the set of pages it was seen
+    on. Source URLs are interned once and referenced by small integer ids,
+    and secondary indexes answer lookups by email domain and by host
+    without scanning every entry. A site crawled under one host but served
+    by another (e.g. example.com redirecting to www.example.com) is looked
+    up under both through host aliases.
+    """
+
+    def __init__(self, region: Optional[str] = DEFAULT_PHONE_REGION):
+        """
+        Initialize an empty index
+
+        Args:
+            region: ISO country code assumed for national phone numbers
+        """
+        self.region = region
+        # Interned source URLs
+        self.sources: List[str] = []
+        self._source_ids: Dict[str, int] = {}
+        # Normalized contact -> [count, source ids]
+        self.emails: Dict[str, list] = {}
+        self.phones: Dict[str, list] = {}
+        # Normalized phone -> first raw form seen (for display)
+        self.phone_labels: Dict[str, str] = {}
+        # Secondary indexes
+        self._by_domain: Dict[str, Set[str]] = {}
+        self._by_host: Dict[str, Tuple[Set[str], Set[str]]] = {}
+        # Host a site was crawled as -> other hosts that served its pages
+        self.aliases: Dict[str, Set[str]] = {}
+
+    def _source_id(self, source: str) -> int:
+        source_id = self._source_ids.get(source)
+        if source_id is None:
+            source_id = self._source_ids[source] = len(self.sources)
+            self.sources.append(source)
+        return source_id
+
+    def _host_entry(self, source: str) -> Tuple[Set[str], Set[str]]:
+        host = _host(source)
+        entry = self._by_host.get(host)
+        if entry is None:
+            entry = self._by_host[host] = (set(), set())
+        return entry
+
+    def add_email(self, email: str, source: str, count: int = 1) -> Optional[str]:
+        """
+        Record an email seen on a page
+
+        Args:
+            email: Raw email address
+            source: URL of the page it was found on
+            count: Occurrences to add
+
+        Returns:
+            Normalized email, or None if it was rejected
+        """
+        key = normalize_email(email)
+        if key is None:
+            return None
+        entry = self.emails.get(key)
+        if entry is None:
+            entry = self.emails[key] = [0, set()]
+            for suffix in domain_suffixes(key.rpartition('@')[2]):
+                self._by_domain.setdefault(suffix, set()).add(key)
+        entry[0] += count
+        entry[1].add(self._source_id(source))
+        self._host_entry(source)[0].add(key)
+        return key
+
+    def add_phone(self, phone: str, source: str, count: int = 1) -> Optional[str]:
+        """
+        Record a phone number seen on a page
+
+        Args:
+            phone: Raw phone number
+            source: URL of the page it was found on
+            count: Occurrences to add
+
+        Returns:
+            Normalized phone number, or None if it was rejected
+        """
+        key = normalize_phone(phone, self.region)
+        if key is None:
+            return None
+        entry = self.phones.get(key)
+        if entry is None:
+            entry = self.phones[key] = [0, set()]
+            self.phone_labels[key] = phone.strip()
+        entry[0] += count
+        entry[1].add(self._source_id(source))
+        self._host_entry(source)[1].add(key)
+        return key
+
+    def add_page(self, source: str, emails: Iterable[str] = (), phones: Iterable[str] = ()):
+        """
+        Record everything extracted from one page
+
+        Args:
+            source: URL of the page
+            emails: Raw emails found on it
+            phones: Raw phone numbers found on it
+        """
+        for email in emails:
+            self.add_email(email, source)
+        for phone in phones:
+            self.add_phone(phone, source)
+
+    def add_alias(self, site: str, source: str):
+        """
+        Record that a page of a site was served by another host
+
+        Args:
+            site: URL or host the site was crawled as
+            source: URL of one of its pages (after redirects)
+        """
+        site_host, page_host = _host(site), _host(source)
+        if site_host != page_host:
+            self.aliases.setdefault(site_host, set()).add(page_host)
+
+    def emails_for_domain(self, domain: str) -> Set[str]:
+        """
+        Emails at a domain or any of its subdomains
+
+        Args:
+            domain: Mail domain (e.g. "example.com")
+
+        Returns:
+            Set of normalized emails
+        """
+        return set(self._by_domain.get(domain.lower().strip('.'), ()))
+
+    def contacts_for_host(self, host: str) -> Tuple[Set[str], Set[str]]:
+        """
+        Emails and phones found on pages served by a host or its aliases
+
+        Args:
+            host: Host name
+
+        Returns:
+            Tuple of (normalized emails, normalized phones)
+        """
+        host = host.lower()
+        emails, phones = set(), set()
+        for name in (host, *self.aliases.get(host, ())):
+            entry = self._by_host.get(name)
+            if entry is not None:
+                emails |= entry[0]
+                phones |= entry[1]
+        return emails, phones
+
+    def sources_of(self, contact: str) -> List[str]:
+        """
+        Pages a normalized email or phone was found on
+        """
+        entry = self.emails.get(contact) or self.phones.get(contact)
+        return [self.sources[i] for i in sorted(entry[1])] if entry else []
+
+    def count_of(self, contact: str) -> int:
+        """
+        Occurrences of a normalized email or phone
+        """
+        entry = self.emails.get(contact) or self.phones.get(contact)
+        return entry[0] if entry else 0
+
+    def merge(self, other: 'ContactIndex'):
+        """
+        Add another index's contacts to this one (e.g. from a worker shard)
+
+        Args:
+            other: Index to merge in
+        """
+        for contacts, add in ((other.emails, self.add_email), (other.phones, self.add_phone)):
+            for key, (count, source_ids) in contacts.items():
+                label = other.phone_labels.get(key, key)
+                sources = [other.sources[i] for i in source_ids]
+                # Count once, then attach the remaining sources
+                add(label, sources[0], count)
+                for source in sources[1:]:
+                    add(label, source, 0)
+        for site, hosts in other.aliases.items():
+            self.aliases.setdefault(site, set()).update(hosts)
+
+    def to_dict(self) -> Dict[str, Dict[str, dict]]:
+        """
+        JSON-friendly form
+
+        Returns:
+            {'emails': {email: {'count', 'sources'}}, 'phones': {phone: {'count', 'display', 'sources'}},
+             'aliases': {host: [hosts]}}
+        """
+        return {
+            'emails': {
+                key: {'count': count, 'sources': [self.sources[i] for i in sorted(ids)]}
+                for key, (count, ids) in sorted(self.emails.items())
+            },
+            'phones': {
+                key: {'count': count, 'display': self.phone_labels[key],
+                      'sources': [self.sources[i] for i in sorted(ids)]}
+                for key, (count, ids) in sorted(self.phones.items())
+            },
+            'aliases': {site: sorted(hosts) for site, hosts in sorted(self.aliases.items())}
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, region: Optional[str] = DEFAULT_PHONE_REGION) -> 'ContactIndex':
+        """
+        Rebuild an index from to_dict() output
+        """
+        index = cls(region)
+        for email, entry in (data.get('emails') or {}).items():
+            for position, source in enumerate(entry.get('sources') or []):
+                index.add_email(email, source, entry.get('count', 1) if position == 0 else 0)
+        for phone, entry in (data.get('phones') or {}).items():
+            for position, source in enumerate(entry.get('sources') or []):
+                index.add_phone(entry.get('display', phone), source, entry.get('count', 1) if position == 0 else 0)
+        for site, hosts in (data.get('aliases') or {}).items():
+            for host in hosts:
+                index.add_alias(site, host)
+        return index
+
+    @classmethod
+    def from_harvest(cls, harvest_data: Dict[str, dict], region: Optional[str] = DEFAULT_PHONE_REGION) -> 'ContactIndex':
+        """
+        Build an index from per-site harvest results (site URL as the source)
+        """
+        index = cls(region)
+        for url, data in harvest_data.items():
+            index.add_page(url, data.get('emails', ()), data.get('phones', ()))
+        return index
+
+    def __len__(self) -> int:
+        return len(self.emails) + len(self.phones)
@@ -0,0 +1,303 @@
+"""
+EYE - Site Crawler Module
+Bounded same-site crawl feeding pages to several extractors at once
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import re
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, urlunparse
+import aiohttp
+from modules.bloom import BloomFilter
+from modules.document import Document
+
+# Pages fetched per site and link depth followed from the homepage
+CRAWL_MAX_PAGES = 10
+CRAWL_MAX_DEPTH = 2
+
+# Requests allowed per site, failures included, as a multiple of the page budget
+CRAWL_ATTEMPTS_PER_PAGE = 3
+
+# Sites crawled at once, and concurrent page fetches within one site
+CRAWL_CONCURRENCY = 50
+CRAWL_HOST_CONCURRENCY = 4
+
+# Per-request timeout and bytes read from each page
+CRAWL_TIMEOUT = 10
+CRAWL_BODY_LIMIT = 2 * 1024 * 1024
+
+# Consumer calls in flight before the crawl waits for them
+CRAWL_CONSUMER_BACKLOG = 64
+
+# Queued URLs per site; once full only priority links are still queued
+CRAWL_FRONTIER_LIMIT = 500
+
+# Path keywords of pages likely to hold contact details, crawled first
+PRIORITY_KEYWORDS = re.compile(
+    r"contact|about|team|staff|people|company|impressum|imprint|kontakt|legal|support",
+    re.IGNORECASE
+)
+
+# Links to these file types are never fetched
+SKIP_EXTENSIONS = frozenset((
+    'jpg', 'jpeg', 'png', 'gif', 'svg', 'webp', 'ico', 'bmp', 'css', 'js', 'json', 'xml',
+    'pdf', 'zip', 'gz', 'tar', 'rar', '7z', 'exe', 'dmg', 'mp3', 'mp4', 'avi', 'mov', 'webm',
+    'woff', 'woff2', 'ttf', 'eot', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx'
+))
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Page: (site URL the crawl started from, fetched document)
+Page = Tuple[str, Document]
+
+
+def normalize_url(url: str) -> Optional[str]:
+    """
+    Canonical form of a URL for deduplication
+
+    Lowercases scheme and host, drops default ports, fragments and
+    trailing slashes.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Normalized URL, or None for non-HTTP URLs
+    """
+    try:
+        parsed = urlparse(url)
+        port = parsed.port
+    except ValueError:
+        return None
+    scheme = parsed.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parsed.hostname:
+        return None
+    netloc = parsed.hostname.lower()
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc += f":{port}"
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse((scheme, netloc, path, '', parsed.query, ''))
+
+
+def site_key(host: str) -> str:
+    """
+    Host name with any leading "www." removed, so both count as the same site
+    """
+    host = (host or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class SiteCrawler:
+    """
+    Crawls each site within a page budget and depth limit, contact and
+    about pages first, streaming every page to a list of consumers
+    """
+
+    def __init__(self, max_pages: int = CRAWL_MAX_PAGES, max_depth: int = CRAWL_MAX_DEPTH,
+                 concurrency: int = CRAWL_CONCURRENCY, host_concurrency: int = CRAWL_HOST_CONCURRENCY):
+        """
+        Initialize crawler
+
+        Args:
+            max_pages: Pages fetched per site (1 = homepage only)
+            max_depth: Link depth followed from the homepage
+            concurrency: Sites crawled at once
+            host_concurrency: Concurrent page fetches within one site
+        """
+        self.max_pages = max(1, max_pages)
+        self.max_depth = max_depth
+        self.concurrency = concurrency
+        self.host_concurrency = host_concurrency
+        self.pages_fetched = 0
+
+    @staticmethod
+    def priority(url: str) -> int:
+        """
+        Crawl priority of a URL (lower is fetched first)
+        """
+        return 0 if PRIORITY_KEYWORDS.search(urlparse(url).path) else 1
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str) -> Optional[Document]:
+        """
+        Fetch an HTML page as a Document (URL after redirects), or None
+        """
+        try:
+            async with session.get(url, ssl=False, allow_redirects=True) as response:
+                if response.status != 200:
+                    return None
+                content_type = response.headers.get('Content-Type', 'text/html').lower()
+                if 'html' not in content_type:
+                    return None
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    body.extend(chunk)
+                    if len(body) >= CRAWL_BODY_LIMIT:
+                        del body[CRAWL_BODY_LIMIT:]
+                        break
+                try:
+                    encoding = response.get_encoding()
+                except (LookupError, RuntimeError):
+                    encoding = 'utf-8'
+                try:
+                    text = body.decode(encoding, errors='replace')
+                except LookupError:
+                    text = body.decode('utf-8', errors='replace')
+                return Document(text, str(response.url), response.headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError, ValueError):
+            return None
+
+    async def crawl_site(self, session: aiohttp.ClientSession, start_url: str) -> AsyncIterator[Document]:
+        """
+        Crawl one site, yielding pages as they arrive
+
+        Args:
+            session: Shared client session
+            start_url: Homepage URL
+
+        Yields:
+            Documents of the fetched pages
+        """
+        frontier = []
+        sequence = itertools.count()
+        seen = BloomFilter(capacity=max(1000, CRAWL_FRONTIER_LIMIT * 4), error_rate=0.001)
+        sites = {site_key(urlparse(start_url).hostname)}
+
+        def enqueue(url: str, depth: int):
+            normalized = normalize_url(url)
+            if normalized is None:
+                return
+            parsed = urlparse(normalized)
+            if site_key(parsed.hostname) not in sites:
+                return
+            filename = parsed.path.rsplit('/', 1)[-1]
+            if '.' in filename and filename.rpartition('.')[2].lower() in SKIP_EXTENSIONS:
+                return
+            priority = self.priority(normalized)
+            if len(frontier) >= CRAWL_FRONTIER_LIMIT and priority:
+                return
+            if seen.add(normalized):
+                heapq.heappush(frontier, (priority, depth, next(sequence), url))
+
+        enqueue(start_url, 0)
+        # Only pages actually fetched count against max_pages; dead links
+        # and non-HTML responses use up the separate attempt budget
+        fetched = 0
+        attempts = 0
+        max_attempts = self.max_pages * CRAWL_ATTEMPTS_PER_PAGE
+        pending = {}
+        try:
+            while frontier or pending:
+                while (frontier and len(pending) < self.host_concurrency
+                       and fetched + len(pending) < self.max_pages and attempts < max_attempts):
+                    _, depth, _, url = heapq.heappop(frontier)
+                    attempts += 1
+                    pending[asyncio.ensure_future(self._fetch(session, url))] = depth
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    depth = pending.pop(task)
+                    document = task.result()
+                    if document is None:
+                        continue
+                    fetched += 1
+                    self.pages_fetched += 1
+
+                    final = normalize_url(document.url)
+                    if depth == 0 and final:
+                        # The homepage may redirect to another host (e.g. www.)
+                        sites.add(site_key(urlparse(final).hostname))
+                    if final:
+                        seen.add(final)
+                    if depth < self.max_depth and fetched < self.max_pages:
+                        for link in document.links:
+                            enqueue(link, depth + 1)
+
+                    yield document
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def iter_pages(self, urls: List[str]) -> AsyncIterator[Page]:
+        """
+        Crawl several sites with a fixed pool of workers sharing one session
+
+        Args:
+            urls: Homepage URLs
+
+        Yields:
+            Tuple of (site URL, document) as pages arrive
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return
+
+        queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        iterator = iter(urls)
+        timeout = aiohttp.ClientTimeout(total=CRAWL_TIMEOUT)
+        connector = aiohttp.TCPConnector(limit=self.concurrency * self.host_concurrency, ssl=False)
+        done = object()
+
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            async def worker():
+                for site_url in iterator:
+                    try:
+                        async for document in self.crawl_site(session, site_url):
+                            await queue.put((site_url, document))
+                    except Exception:
+                        continue
+                await queue.put(done)
+
+            workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, len(urls)))]
+            try:
+                remaining = len(workers)
+                while remaining:
+                    item = await queue.get()
+                    if item is done:
+                        remaining -= 1
+                        continue
+                    yield item
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+    async def crawl_multiple(self, urls: List[str], consumers: List[Callable[[str, Document], Any]]) -> Dict[str, int]:
+        """
+        Crawl several sites once and hand every page to each consumer
+
+        Every consumer receives the same Document, so views one of them
+        computes (links, lowercased text, ...) are reused by the others.
+        Consumers may be coroutine functions; their calls run concurrently
+        with the crawl (at most CRAWL_CONSUMER_BACKLOG at once).
+
+        Args:
+            urls: Homepage URLs
+            consumers: Callables taking (site URL, document)
+
+        Returns:
+            Dictionary mapping site URL -> pages crawled
+        """
+        pages = {}
+        backlog = set()
+        async for site_url, document in self.iter_pages(urls):
+            pages[site_url] = pages.get(site_url, 0) + 1
+            for consumer in consumers:
+                try:
+                    result = consumer(site_url, document)
+                except Exception:
+                    continue
+                if inspect.isawaitable(result):
+                    backlog.add(asyncio.ensure_future(result))
+            if len(backlog) >= CRAWL_CONSUMER_BACKLOG:
+                done, backlog = await asyncio.wait(backlog, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    # Consumer errors are ignored, like those of plain callables
+                    task.exception()
+        if backlog:
+            await asyncio.gather(*backlog, return_exceptions=True)
+        return pages
@@ -0,0 +1,146 @@
+"""
+EYE - Certificate Transparency Index Module
+Local per-domain index of seen CT entry IDs and names for incremental sync
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Iterable, Optional, Set
+from rich.console import Console
+import config
+
+console = Console()
+
+# Index location (config.py files created before the CT index lack the setting)
+CT_INDEX_DIR = getattr(config, 'CT_INDEX_DIR', "output/ct_index")
+
+
+class CTIndex:
+    """
+    Remembers the highest CT entry ID and every name seen for a domain
+
+    CT log entry IDs are assigned in increasing order, so a single
+    high-water mark is enough to tell old entries from new ones without
+    storing every ID ever seen.
+    """
+
+    def __init__(self, domain: str, index_dir: str = CT_INDEX_DIR):
+        """
+        Initialize the index and load any previous state from disk
+
+        Args:
+            domain: Target domain the index belongs to
+            index_dir: Directory holding per-domain index files
+        """
+        self.domain = domain
+        self.index_dir = index_dir
+        self.index_file = os.path.join(
+            index_dir, f"ct_{domain.replace('/', '_').replace(':', '_')}.json"
+        )
+        self.last_id = 0
+        self.names: Set[str] = set()
+        self.new_names: Set[str] = set()
+        self.entries_seen = 0
+        self.entries_new = 0
+        self._sync_max_id = 0
+        self.load()
+
+    def load(self):
+        """
+        Load index state from disk (missing or corrupt files start empty)
+        """
+        if not os.path.exists(self.index_file):
+            return
+
+        try:
+            with open(self.index_file, 'r') as f:
+                state = json.load(f)
+
+            self.last_id = int(state.get('last_id', 0))
+            self.names = set(state.get('names', []))
+        except Exception as e:
+            console.print(f"[!] [yellow]Ignoring unreadable CT index {self.index_file}: {str(e)}[/yellow]")
+            self.last_id = 0
+            self.names = set()
+
+    def save(self):
+        """
+        Persist the index atomically
+        """
+        try:
+            os.makedirs(self.index_dir, exist_ok=True)
+            state = {
+                'domain': self.domain,
+                'timestamp': datetime.now().isoformat(),
+                'last_id': self.last_id,
+                'names': sorted(self.names)
+            }
+
+            tmp_file = self.index_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_file, self.index_file)
+
+        except Exception as e:
+            console.print(f"[!] [red]Failed to save CT index: {str(e)}[/red]")
+
+    def begin_sync(self):
+        """
+        Reset per-sync counters before processing a new batch of entries
+        """
+        self.new_names = set()
+        self.entries_seen = 0
+        self.entries_new = 0
+        self._sync_max_id = self.last_id
+
+    def is_new_entry(self, entry_id: Optional[int]) -> bool:
+        """
+        Check whether a CT entry is newer than anything already indexed
+
+        Args:
+            entry_id: CT entry ID (None when the source does not provide one)
+
+        Returns:
+            True if the entry must be processed
+        """
+        self.entries_seen += 1
+        if entry_id is None:
+            return True
+        try:
+            return int(entry_id) > self.last_id
+        except (TypeError, ValueError):
+            return True
+
+    def record(self, entry_id: Optional[int], names: Iterable[str]) -> Set[str]:
+        """
+        Record a processed entry and its normalized names
+
+        Args:
+            entry_id: CT entry ID, if known
+            names: Normalized names found in the entry
+
+        Returns:
+            Names not previously present in the index
+        """
+        self.entries_new += 1
+        if entry_id is not None:
+            try:
+                self._sync_max_id = max(self._sync_max_id, int(entry_id))
+            except (TypeError, ValueError):
+                pass
+
+        added = set()
+        for name in names:
+            if name not in self.names:
+                self.names.add(name)
+                added.add(name)
+        self.new_names |= added
+        return added
+
+    def commit_sync(self):
+        """
+        Advance the high-water mark and save, once a sync completed successfully
+        """
+        self.last_id = self._sync_max_id
+        self.save()
@@ -0,0 +1,213 @@
+"""
+EYE - Parsed Document Module
+One object per HTTP response whose derived views are computed at most once
+"""
+
+import html
+import re
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+
+HREF_PATTERN = re.compile(r"""<a\s[^>]*?(?<![\w-])href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+TITLE_PATTERN = re.compile(r"<title[^>]*>(.*?)</title\s*>", re.IGNORECASE | re.DOTALL)
+META_TAG_PATTERN = re.compile(r"<meta\s[^>]*>", re.IGNORECASE)
+SCRIPT_TAG_PATTERN = re.compile(r"<script\s[^>]*>", re.IGNORECASE)
+ATTRIBUTE_PATTERN = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+BODY_PATTERN = re.compile(r"<body[^>]*>(.*?)(?:</body\s*>|$)", re.IGNORECASE | re.DOTALL)
+INVISIBLE_PATTERN = re.compile(
+    r"<(script|style|noscript|template)\b[^>]*>.*?</\1\s*>|<!--.*?-->",
+    re.IGNORECASE | re.DOTALL
+)
+TAG_PATTERN = re.compile(r"<[^>]+>")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Links with these prefixes never lead to another page
+NON_PAGE_PREFIXES = ('#', 'javascript:', 'mailto:', 'tel:', 'data:')
+
+
+def iter_hrefs(content: str) -> Iterator[str]:
+    """
+    Stream the href values of a page's <a> tags without building a DOM
+
+    Args:
+        content: Page HTML
+
+    Yields:
+        Unescaped, stripped href values in document order
+    """
+    for found in HREF_PATTERN.finditer(content):
+        href = found.group(1)
+        if href is None:
+            href = found.group(2) if found.group(2) is not None else found.group(3)
+        yield html.unescape(href).strip() if '&' in href else href.strip()
+
+
+def resolve_links(page_url: str, hrefs) -> List[str]:
+    """
+    Absolute URLs of the hrefs that lead to other pages
+
+    Args:
+        page_url: URL the page was served from
+        hrefs: href values (see iter_hrefs)
+
+    Returns:
+        List of absolute URLs in document order
+    """
+    return [
+        urljoin(page_url, href) for href in hrefs
+        if href and not href.startswith(NON_PAGE_PREFIXES)
+    ]
+
+
+def extract_links(page_url: str, content: str) -> List[str]:
+    """
+    Absolute URLs of the <a href> links of a page
+
+    Args:
+        page_url: URL the page was served from
+        content: Page HTML
+
+    Returns:
+        List of absolute URLs in document order
+    """
+    return resolve_links(page_url, iter_hrefs(content))
+
+
+def _attributes(tag: str) -> Dict[str, str]:
+    """
+    Attributes of one start tag, names lowercased and values unescaped
+    """
+    attributes = {}
+    for found in ATTRIBUTE_PATTERN.finditer(tag):
+        value = next(group for group in found.groups()[1:] if group is not None)
+        attributes.setdefault(found.group(1).lower(), html.unescape(value) if '&' in value else value)
+    return attributes
+
+
+class Document:
+    """
+    A response body shared by every analyzer of a page
+
+    Views (lowercased text, hrefs, links, title, meta tags, script srcs,
+    visible text) are computed on first access and memoized, so each
+    transformation happens at most once however many consumers ask.
+    """
+
+    # Views derived from the text, dropped when the text grows
+    VIEWS = ('lower', 'hrefs', 'links', 'title', 'meta', 'script_srcs', 'visible_text')
+
+    def __init__(self, text: str = '', url: str = '', headers=None):
+        """
+        Initialize document
+
+        Args:
+            text: Decoded response body (may be fed later with append())
+            url: URL the response was served from
+            headers: Response headers
+        """
+        self.text = text
+        self.url = url
+        self.headers = headers if headers is not None else {}
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def is_cached(self, view: str) -> bool:
+        """
+        Whether a view has already been computed
+        """
+        return view in self.__dict__
+
+    def append(self, chunk: str) -> str:
+        """
+        Add the next chunk of a streamed body
+
+        The lowercased view is extended in place; other views are
+        recomputed on their next access.
+
+        Args:
+            chunk: Decoded text
+
+        Returns:
+            The chunk lowercased
+        """
+        lowered = chunk.lower()
+        cached = self.__dict__
+        lower = cached.get('lower')
+        if lower is None and not self.text:
+            lower = ''
+        self.text += chunk
+        for view in self.VIEWS:
+            cached.pop(view, None)
+        if lower is not None:
+            cached['lower'] = lower + lowered
+        return lowered
+
+    @cached_property
+    def lower(self) -> str:
+        """
+        The text lowercased, for case-insensitive keyword searches
+        """
+        return self.text.lower()
+
+    @cached_property
+    def hrefs(self) -> List[str]:
+        """
+        href values of the <a> tags in document order (see iter_hrefs)
+        """
+        return list(iter_hrefs(self.text))
+
+    @cached_property
+    def links(self) -> List[str]:
+        """
+        Absolute URLs of the links leading to other pages
+        """
+        return resolve_links(self.url, self.hrefs)
+
+    @cached_property
+    def title(self) -> Optional[str]:
+        """
+        Contents of the first <title>, or None if missing or empty
+        """
+        found = TITLE_PATTERN.search(self.text)
+        if not found:
+            return None
+        title = WHITESPACE_PATTERN.sub(' ', html.unescape(found.group(1))).strip()
+        return title or None
+
+    @cached_property
+    def meta(self) -> Dict[str, str]:
+        """
+        Meta tags: lowercased name, property or http-equiv -> content (first wins)
+        """
+        metas = {}
+        for tag in META_TAG_PATTERN.findall(self.text):
+            attributes = _attributes(tag)
+            name = attributes.get('name') or attributes.get('property') or attributes.get('http-equiv')
+            if name and 'content' in attributes:
+                metas.setdefault(name.lower(), attributes['content'])
+        return metas
+
+    @cached_property
+    def script_srcs(self) -> List[str]:
+        """
+        Unique src attributes of the <script> tags in document order
+        """
+        srcs = []
+        for tag in SCRIPT_TAG_PATTERN.findall(self.text):
+            src = _attributes(tag).get('src', '').strip()
+            if src and src not in srcs:
+                srcs.append(src)
+        return srcs
+
+    @cached_property
+    def visible_text(self) -> str:
+        """
+        Text a browser would render: the body (or whole document) without
+        scripts, styles, comments and tags, whitespace collapsed
+        """
+        found = BODY_PATTERN.search(self.text)
+        content = found.group(1) if found else self.text
+        content = TAG_PATTERN.sub(' ', INVISIBLE_PATTERN.sub(' ', content))
+        return WHITESPACE_PATTERN.sub(' ', html.unescape(content)).strip()
@@ -8,6 +8,7 @@ import csv
 import os
 from datetime import datetime
 from rich.console import Console
+from modules.contacts import ContactIndex
 
 console = Console()
 
@@ -80,7 +81,11 @@ class DataExporter:
             
             # Extract data from results
             scan_results = data.get('scan_results', [])
-            email_data = data.get('emails', {})
+            # Contacts by host (older exports only carry per-site harvest data)
+            if data.get('contacts'):
+                contact_index = ContactIndex.from_dict(data['contacts'])
+            else:
+                contact_index = ContactIndex.from_harvest(data.get('harvest_data', {}))
             cors_data = data.get('cors_vulnerabilities', [])
             sensitive_files = data.get('sensitive_files', [])
             
@@ -101,11 +106,8 @@ class DataExporter:
                 ports_str = ','.join(map(str, open_ports)) if open_ports else 'None'
                 
                 # Check for emails
-                emails_found = []
-                for url, emails in email_data.items():
-                    if host in url:
-                        emails_found.extend(emails)
-                emails_str = ','.join(set(emails_found)) if emails_found else 'None'
+                emails_found, _ = contact_index.contacts_for_host(host)
+                emails_str = ','.join(sorted(emails_found)) if emails_found else 'None'
                 
                 # Check CORS status
                 cors_status = 'SAFE'
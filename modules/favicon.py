@@ -0,0 +1,182 @@
+"""
+EYE - Favicon Fingerprinting Module
+Shodan-compatible favicon hashes looked up in a local product index
+"""
+
+import asyncio
+import base64
+import hashlib
+from typing import Dict, Optional
+from urllib.parse import urljoin
+import aiohttp
+from modules.packs import register_pack, get_pack
+
+try:
+    import mmh3
+except ImportError:
+    mmh3 = None
+
+# Concurrent favicon downloads
+FAVICON_CONCURRENCY = 20
+
+# Favicons larger than this are not hashed
+FAVICON_MAX_BYTES = 256 * 1024
+
+
+def murmur3_32(data: bytes, seed: int = 0) -> int:
+    """
+    MurmurHash3 x86 32-bit, signed like mmh3.hash()
+
+    Args:
+        data: Bytes to hash
+        seed: Hash seed
+
+    Returns:
+        Signed 32-bit hash
+    """
+    if mmh3 is not None:
+        return mmh3.hash(data, seed)
+
+    c1, c2 = 0xcc9e2d51, 0x1b873593
+    length = len(data)
+    h = seed & 0xFFFFFFFF
+    rounded = length & ~3
+
+    for i in range(0, rounded, 4):
+        k = int.from_bytes(data[i:i + 4], 'little')
+        k = (k * c1) & 0xFFFFFFFF
+        k = ((k << 15) | (k >> 17)) & 0xFFFFFFFF
+        k = (k * c2) & 0xFFFFFFFF
+        h ^= k
+        h = ((h << 13) | (h >> 19)) & 0xFFFFFFFF
+        h = (h * 5 + 0xe6546b64) & 0xFFFFFFFF
+
+    k = 0
+    tail = length & 3
+    if tail:
+        k = int.from_bytes(data[rounded:], 'little')
+        k = (k * c1) & 0xFFFFFFFF
+        k = ((k << 15) | (k >> 17)) & 0xFFFFFFFF
+        k = (k * c2) & 0xFFFFFFFF
+        h ^= k
+
+    h ^= length
+    h ^= h >> 16
+    h = (h * 0x85ebca6b) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * 0xc2b2ae35) & 0xFFFFFFFF
+    h ^= h >> 16
+
+    return h - 0x100000000 if h & 0x80000000 else h
+
+
+def favicon_hash(content: bytes) -> int:
+    """
+    Shodan-style favicon hash: mmh3 of the MIME base64 encoding (76-char lines)
+
+    Args:
+        content: Raw favicon bytes
+
+    Returns:
+        Signed 32-bit hash
+    """
+    return murmur3_32(base64.encodebytes(content))
+
+
+def compile_favicon_index(data: dict) -> Dict[int, dict]:
+    """
+    Compile the 'favicons' pack into a hash -> product dict
+
+    Args:
+        data: Merged pack data
+
+    Returns:
+        Dictionary mapping hash -> {'name': ..., 'category': ...}
+    """
+    return {int(value): product for value, product in data.get('hashes', {}).items()}
+
+
+# Hash -> product index (same hash values as Shodan's http.favicon.hash)
+register_pack('favicons', 'favicons.json', compile_favicon_index)
+
+# sha1(content) -> favicon hash, shared by every host serving the same icon
+_HASH_CACHE: Dict[bytes, int] = {}
+
+
+class FaviconHasher:
+    """
+    Fetches favicons with bounded concurrency and identifies products by hash
+    """
+
+    def __init__(self, index: Optional[Dict[int, dict]] = None, concurrency: int = FAVICON_CONCURRENCY):
+        """
+        Initialize hasher
+
+        Args:
+            index: Hash -> product index (default: the 'favicons' pack)
+            concurrency: Maximum concurrent favicon downloads
+        """
+        self.index = get_pack('favicons') if index is None else index
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    async def _download(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+        """
+        Download an icon, returning None for errors, HTML pages and oversized files
+        """
+        async with self.semaphore:
+            try:
+                async with session.get(url, ssl=False, allow_redirects=True) as response:
+                    if response.status != 200 or 'html' in response.headers.get('Content-Type', '').lower():
+                        return None
+                    if response.content_length and response.content_length > FAVICON_MAX_BYTES:
+                        return None
+                    # One byte past the limit is enough to tell an oversized icon
+                    content = bytearray()
+                    async for chunk in response.content.iter_chunked(16 * 1024):
+                        content.extend(chunk)
+                        if len(content) > FAVICON_MAX_BYTES:
+                            break
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                return None
+        if not content or len(content) > FAVICON_MAX_BYTES:
+            return None
+        return bytes(content)
+
+    async def fingerprint(self, session: aiohttp.ClientSession, page_url: str,
+                          icon_href: Optional[str] = None) -> Optional[dict]:
+        """
+        Hash a site's favicon and look it up
+
+        Args:
+            session: Shared client session
+            page_url: URL of the page the icon belongs to
+            icon_href: href of a <link rel="icon"> tag, if one was seen
+
+        Returns:
+            Dictionary with url, hash and product (None if unknown), or None if no icon
+        """
+        candidates = []
+        if icon_href and not icon_href.startswith('data:'):
+            candidates.append(urljoin(page_url, icon_href))
+        default = urljoin(page_url, '/favicon.ico')
+        if default not in candidates:
+            candidates.append(default)
+
+        for url in candidates:
+            content = await self._download(session, url)
+            if content is None:
+                continue
+
+            digest = hashlib.sha1(content).digest()
+            value = _HASH_CACHE.get(digest)
+            if value is None:
+                value = _HASH_CACHE[digest] = favicon_hash(content)
+
+            product = self.index.get(value)
+            return {
+                'url': url,
+                'hash': value,
+                'product': product['name'] if product else None,
+                'category': product.get('category') if product else None
+            }
+        return None
@@ -7,11 +7,29 @@ import aiohttp
 import asyncio
 from rich.console import Console
 from rich.table import Table
-from config import SENSITIVE_PATHS, USER_AGENT
+import config
+from config import USER_AGENT
+from modules.packs import register_pack, get_pack
 
 console = Console()
 
 
+class SensitivePaths:
+    """
+    Compiled 'sensitive_paths' pack (modules/signatures/sensitive_paths.json)
+    """
+    
+    def __init__(self, paths):
+        self.paths = list(dict.fromkeys(paths))
+    
+    @classmethod
+    def from_pack(cls, data: dict) -> 'SensitivePaths':
+        return cls(data.get('paths', []))
+
+
+register_pack('sensitive_paths', 'sensitive_paths.json', SensitivePaths.from_pack)
+
+
 class SensitiveFileFuzzer:
     """
     Checks for publicly accessible sensitive files
@@ -27,7 +45,9 @@ class SensitiveFileFuzzer:
         """
         self.timeout = timeout
         self.semaphore = asyncio.Semaphore(max_concurrent)
-        self.sensitive_paths = SENSITIVE_PATHS
+        # The 'sensitive_paths' pack plus any extra paths listed in config.py
+        extra = getattr(config, 'SENSITIVE_PATHS', None) or []
+        self.sensitive_paths = list(dict.fromkeys(get_pack('sensitive_paths').paths + list(extra)))
         self.findings = []
     
     async def check_sensitive_files(self, url):
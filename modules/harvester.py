@@ -4,27 +4,190 @@ Extracts emails and phone numbers from web pages
 """
 
 import re
-import aiohttp
-import asyncio
-from typing import List, Dict, Set
+import string
+from typing import List, Dict, Set, Tuple
 from rich.console import Console
+from modules.crawler import SiteCrawler
+from modules.offload import parse_executor
+from modules.contacts import ContactIndex
+from modules.document import Document
 
 console = Console()
 
 
+# One scan finds both kinds of contact data: every "@" (emails are read
+# around it) and every run of phone characters holding at least 7 digits.
+# Both branches start with a fixed character class, so the regex engine
+# skips plain text quickly instead of trying the phone pattern everywhere.
+CONTACT_SCAN_PATTERN = re.compile(r"\d(?:[-+().\s]*\d){6}[-+().\s\d]*|@")
+EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+EMAIL_DOMAIN_PATTERN = re.compile(r"[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+PHONE_PATTERN = re.compile(r"\+?\d{1,4}?[-.\s]?\(?\d{1,3}?\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}")
+
+# Phone candidate validators
+DIGIT_RUN_PATTERN = re.compile(r"\d+")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# Port numbers/ranges (+8080-8081, +2000-206), dates, times, versions, decimals and IPs
+NOT_PHONE_PATTERN = re.compile(
+    r"\+?\d{1,5}-\d{1,5}$"
+    r"|\+?\d{4,6}-\d{1,4}$"
+    r"|\d{4}[-./]\d{1,2}[-./]\d{1,2}$"
+    r"|\d{1,2}[-./]\d{1,2}[-./]\d{2,4}$"
+    r"|\d{1,2}:\d{2}(?::\d{2})?$"
+    r"|\d+\.\d+(?:\.\d+|$)"
+)
+
+# Phone numbers have 7-15 digits
+PHONE_MIN_DIGITS = 7
+PHONE_MAX_DIGITS = 15
+
+
+def validate_phone(match: str) -> str:
+    """
+    Check a phone candidate, filtering out dates/timestamps/port numbers
+    
+    Args:
+        match: Raw phone regex match
+        
+    Returns:
+        Cleaned phone number, or an empty string if it is not a phone
+    """
+    stripped = match.strip()
+    # Cheapest rejection first: too short to hold 7 digits
+    if len(stripped) < PHONE_MIN_DIGITS:
+        return ''
+    
+    groups = DIGIT_RUN_PATTERN.findall(stripped)
+    digit_count = sum(map(len, groups))
+    if digit_count < PHONE_MIN_DIGITS or digit_count > PHONE_MAX_DIGITS:
+        return ''
+    
+    # Needs at least two digit groups, e.g. (123) 456-7890, +1-234-567-8900
+    if len(groups) < 2:
+        return ''
+    
+    if NOT_PHONE_PATTERN.match(stripped):
+        return ''
+    
+    # Skip if it's all the same digit repeated (000-000-0000)
+    digits = ''.join(groups)
+    if digits.count(digits[0]) == digit_count:
+        return ''
+    
+    # A "country code" longer than 3 digits needs a full number after it
+    if stripped[0] == '+' and stripped[1:2].isdigit():
+        country_code = groups[0]
+        if len(country_code) > 3 and digit_count - len(country_code) < 6:
+            return ''
+    
+    # Two short dash-separated parts are a range, not a phone (e.g. 2000-206)
+    if stripped.count('-') == 1:
+        first, second = stripped.replace('+', '').split('-')
+        if sum(c.isdigit() for c in first) <= 4 and sum(c.isdigit() for c in second) <= 4:
+            return ''
+    
+    return WHITESPACE_PATTERN.sub(' ', stripped)
+
+
+def count_contacts(html_content: str) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Extract emails and phone numbers in a single pass over the content
+    
+    Gives the same results as running the email and phone patterns
+    separately: an email is the longest address-like run before an "@"
+    plus the domain after it, and the phone pattern only runs inside
+    digit runs long enough to hold a phone number.
+    
+    Args:
+        html_content: HTML source code as string
+        
+    Returns:
+        Tuple of (email -> occurrences, valid phone -> occurrences)
+    """
+    emails = {}
+    phones = {}
+    if not html_content:
+        return emails, phones
+    
+    # Raw candidate -> cleaned phone ('' if rejected), so repeats are validated once
+    validated = {}
+    email_floor = 0
+    for found in CONTACT_SCAN_PATTERN.finditer(html_content):
+        start = found.start()
+        
+        if html_content[start] == '@':
+            local_start = start
+            while local_start > email_floor and html_content[local_start - 1] in EMAIL_LOCAL_CHARS:
+                local_start -= 1
+            if local_start == start:
+                continue
+            domain = EMAIL_DOMAIN_PATTERN.match(html_content, start + 1)
+            if domain:
+                email = html_content[local_start:domain.end()]
+                emails[email] = emails.get(email, 0) + 1
+                email_floor = domain.end()
+            continue
+        
+        # Phone matches start with a digit or a '+'
+        if start and html_content[start - 1] == '+':
+            start -= 1
+        for candidate in PHONE_PATTERN.findall(html_content, start, found.end()):
+            cleaned = validated.get(candidate)
+            if cleaned is None:
+                cleaned = validated[candidate] = validate_phone(candidate)
+            if cleaned:
+                phones[cleaned] = phones.get(cleaned, 0) + 1
+    
+    return emails, phones
+
+
+def extract_contacts(html_content: str) -> Tuple[Set[str], Set[str]]:
+    """
+    Unique emails and valid phone numbers of a page (see count_contacts)
+    
+    Args:
+        html_content: HTML source code as string
+        
+    Returns:
+        Tuple of (unique emails, unique valid phone numbers)
+    """
+    emails, phones = count_contacts(html_content)
+    return set(emails), set(phones)
+
+
+def compact_contacts(html_content: str) -> Tuple[Tuple[Tuple[str, int], ...], Tuple[Tuple[str, int], ...]]:
+    """
+    count_contacts() as tuples, cheap to send back from a worker process
+    """
+    emails, phones = count_contacts(html_content)
+    return tuple(emails.items()), tuple(phones.items())
+
+
 class DataHarvester:
     """
     Harvests sensitive data like emails and phone numbers from web pages
     """
     
     def __init__(self):
-        self.timeout = aiohttp.ClientTimeout(total=10)
-        self.email_pattern = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-        self.phone_pattern = re.compile(r"(\+?\d{1,4}?[-.\s]?\(?\d{1,3}?\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9})")
+        self.results: Dict[str, Dict[str, Set[str]]] = {}
+        # Scan-wide contacts with counts and the pages they were found on
+        self.index = ContactIndex()
+    
+    def extract(self, html_content: str) -> Tuple[Set[str], Set[str]]:
+        """
+        Extract emails and phone numbers in a single pass over the content
+        
+        Args:
+            html_content: HTML source code as string
+            
+        Returns:
+            Tuple of (unique emails, unique valid phone numbers)
+        """
+        return extract_contacts(html_content)
     
     def extract_emails(self, html_content: str) -> Set[str]:
         """
-        Extract email addresses from HTML content using regex
+        Extract email addresses from HTML content
         
         Args:
             html_content: HTML source code as string
@@ -32,15 +195,11 @@ class DataHarvester:
         Returns:
             Set of unique email addresses found
         """
-        if not html_content:
-            return set()
-        
-        emails = set(self.email_pattern.findall(html_content))
-        return emails
+        return self.extract(html_content)[0]
     
     def extract_phones(self, html_content: str) -> Set[str]:
         """
-        Extract phone numbers from HTML content using regex
+        Extract phone numbers from HTML content
         Filters out false positives like dates/timestamps/port numbers
         
         Args:
@@ -49,164 +208,52 @@ class DataHarvester:
         Returns:
             Set of unique phone numbers found
         """
-        if not html_content:
-            return set()
-        
-        # Find all potential phone matches
-        matches = self.phone_pattern.findall(html_content)
-        
-        # Filter out false positives
-        valid_phones = set()
-        for match in matches:
-            # Remove all non-digit characters to count digits
-            digits_only = re.sub(r'\D', '', match)
-            
-            # Phone numbers should be 7-15 digits
-            if len(digits_only) < 7 or len(digits_only) > 15:
-                continue
-            
-            # Skip if it looks like a port number or range (e.g., +8080-8081, +2000-206)
-            # Pattern: +DIGITS-DIGITS where both parts are short (< 5 digits each)
-            if re.match(r'^\+?\d{1,5}-\d{1,5}$', match.strip()):
-                continue
-            
-            # Skip patterns that look like: +12345-123 (likely port/range)
-            if re.match(r'^\+?\d{4,6}-\d{1,4}$', match.strip()):
-                continue
-            
-            # Skip if it looks like a date (YYYY-MM-DD or DD-MM-YYYY or similar)
-            if re.match(r'^\d{4}[-./]\d{1,2}[-./]\d{1,2}$', match.strip()):
-                continue
-            if re.match(r'^\d{1,2}[-./]\d{1,2}[-./]\d{2,4}$', match.strip()):
-                continue
-            
-            # Skip if it looks like a time (HH:MM:SS or HH:MM)
-            if re.match(r'^\d{1,2}:\d{2}(:\d{2})?$', match.strip()):
-                continue
-            
-            # Skip version numbers (1.0.0, 2.3.4, etc.)
-            if re.match(r'^\d+\.\d+\.\d+', match.strip()):
-                continue
-            
-            # Skip decimal numbers (123.456, 1.234, etc.)
-            if re.match(r'^\d+\.\d+$', match.strip()) and '.' in match:
-                continue
-            
-            # Skip IP addresses or similar patterns
-            if re.match(r'^\d+\.\d+\.\d+\.\d+', match.strip()):
-                continue
-            
-            # Skip if it's all the same digit repeated (000-000-0000)
-            if len(set(digits_only)) == 1:
-                continue
-            
-            # Skip numbers with too few digit groups for a phone (e.g., just two groups)
-            # Valid phone: (123) 456-7890, +1-234-567-8900
-            # Invalid: +1234-567 (only 2 groups)
-            groups = re.findall(r'\d+', match)
-            if len(groups) < 2:
-                continue
-            
-            # If it starts with +, ensure the country code looks reasonable (1-3 digits)
-            if match.strip().startswith('+'):
-                country_code_match = re.match(r'^\+(\d+)', match.strip())
-                if country_code_match:
-                    country_code = country_code_match.group(1)
-                    # Country codes are typically 1-3 digits
-                    # But the total should still form a valid phone structure
-                    if len(country_code) > 3:
-                        # If "country code" is > 3 digits, it's suspicious
-                        # Check if remaining part makes sense
-                        remaining = match.strip()[len(country_code)+1:]
-                        if not remaining or len(re.sub(r'\D', '', remaining)) < 6:
-                            continue
-            
-            # Additional check: if the number has only 2 parts separated by dash
-            # and both parts are short, skip it (likely not a phone)
-            parts = match.strip().replace('+', '').split('-')
-            if len(parts) == 2:
-                part1_digits = re.sub(r'\D', '', parts[0])
-                part2_digits = re.sub(r'\D', '', parts[1])
-                # Both parts very short = suspicious (e.g., 2000-206)
-                if len(part1_digits) <= 4 and len(part2_digits) <= 4:
-                    continue
-            
-            # Clean up the phone number (remove extra spaces)
-            cleaned = re.sub(r'\s+', ' ', match.strip())
-            valid_phones.add(cleaned)
-        
-        return valid_phones
+        return self.extract(html_content)[1]
     
-    async def harvest_single(self, url: str) -> Dict[str, Set[str]]:
+    async def harvest_page(self, site_url: str, document: Document):
         """
-        Harvest emails and phone numbers from a single URL
+        Crawl consumer: extract contact data from one page of a site
+        
+        Large pages are parsed in the shared process pool.
         
         Args:
-            url: Target URL to harvest data from
-            
-        Returns:
-            Dictionary containing emails and phones found
+            site_url: Site the page belongs to
+            document: The fetched page
         """
-        result = {
-            'url': url,
-            'emails': set(),
-            'phones': set()
-        }
-        
-        try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(url, ssl=False, allow_redirects=True) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        result['emails'] = self.extract_emails(html)
-                        result['phones'] = self.extract_phones(html)
-                        
-                        if result['emails'] or result['phones']:
-                            console.print(f"[+] [cyan]{url}[/cyan]")
-                            if result['emails']:
-                                console.print(f"    📧 Emails: {len(result['emails'])} found")
-                            if result['phones']:
-                                console.print(f"    📞 Phones: {len(result['phones'])} found")
-        
-        except asyncio.TimeoutError:
-            pass
-        except Exception:
-            pass
-        
-        return result
-    
-    async def harvest_multiple(self, urls: List[str]) -> Dict[str, Dict[str, Set[str]]]:
+        page_url = document.url
+        # Pages may be served by another host than the site was crawled as
+        self.index.add_alias(site_url, page_url)
+        emails, phones = await parse_executor.run(compact_contacts, document.text)
+        entry = self.results.setdefault(site_url, {'emails': set(), 'phones': set()})
+        for email, count in emails:
+            entry['emails'].add(email)
+            self.index.add_email(email, page_url, count)
+        for phone, count in phones:
+            entry['phones'].add(phone)
+            self.index.add_phone(phone, page_url, count)
+    
+    def collect(self, urls: List[str] = None) -> Dict[str, Dict[str, Set[str]]]:
         """
-        Harvest data from multiple URLs concurrently
+        Report and return what harvest_page() gathered
         
         Args:
-            urls: List of URLs to harvest from
+            urls: Sites to report in order (default: all harvested sites)
             
         Returns:
             Dictionary mapping URLs to their harvested data
         """
-        console.print(f"[*] Harvesting emails and phone numbers from [cyan]{len(urls)}[/cyan] URLs...")
-        
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(50)
-        
-        async def harvest_with_limit(url):
-            async with semaphore:
-                return await self.harvest_single(url)
-        
-        # Execute all harvesting tasks concurrently
-        tasks = [harvest_with_limit(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Organize results by URL
         harvest_data = {}
-        for result in results:
-            if isinstance(result, dict) and not isinstance(result, Exception):
-                url = result['url']
-                harvest_data[url] = {
-                    'emails': result['emails'],
-                    'phones': result['phones']
-                }
+        for url in (urls if urls is not None else list(self.results)):
+            if url not in self.results:
+                continue
+            harvest_data[url] = self.results[url]
+            
+            if harvest_data[url]['emails'] or harvest_data[url]['phones']:
+                console.print(f"[+] [cyan]{url}[/cyan]")
+                if harvest_data[url]['emails']:
+                    console.print(f"    📧 Emails: {len(harvest_data[url]['emails'])} found")
+                if harvest_data[url]['phones']:
+                    console.print(f"    📞 Phones: {len(harvest_data[url]['phones'])} found")
         
         # Print summary
         total_emails = sum(len(data['emails']) for data in harvest_data.values())
@@ -218,3 +265,21 @@ class DataHarvester:
             console.print(f"[!] No emails or phones found")
         
         return harvest_data
+    
+    async def harvest_multiple(self, urls: List[str], crawler: SiteCrawler = None) -> Dict[str, Dict[str, Set[str]]]:
+        """
+        Crawl multiple sites and harvest data from their pages
+        
+        Args:
+            urls: List of site URLs to harvest from
+            crawler: Crawler to use (default: SiteCrawler with default budget)
+            
+        Returns:
+            Dictionary mapping URLs to their harvested data
+        """
+        console.print(f"[*] Harvesting emails and phone numbers from [cyan]{len(urls)}[/cyan] URLs...")
+        
+        self.results = {}
+        self.index = ContactIndex()
+        await (crawler or SiteCrawler()).crawl_multiple(urls, [self.harvest_page])
+        return self.collect(urls)
@@ -0,0 +1,252 @@
+"""
+EYE - ICMP Echo Engine Module
+In-process ping sweeper: one socket, all targets, TTL read from replies
+"""
+
+import asyncio
+import os
+import socket
+import struct
+import sys
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+# Linux value; Python does not always export socket.IP_RECVTTL
+IP_RECVTTL = getattr(socket, 'IP_RECVTTL', 12)
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+
+# Payload carried in every echo request (tag + send timestamp)
+PAYLOAD_TAG = b'EYE-PING'
+
+# Receive buffer size, large enough to queue replies from big sweeps
+RECV_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Requests sent before yielding so replies can be drained
+SEND_BATCH = 64
+
+
+def icmp_checksum(data: bytes) -> int:
+    """
+    Internet checksum (RFC 1071)
+
+    Args:
+        data: Bytes to checksum
+
+    Returns:
+        16-bit checksum
+    """
+    if len(data) % 2:
+        data += b'\x00'
+    total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def build_echo_request(identifier: int, sequence: int) -> bytes:
+    """
+    Build an ICMP echo request packet
+
+    Args:
+        identifier: ICMP identifier (ignored/overwritten on ping sockets)
+        sequence: ICMP sequence number
+
+    Returns:
+        Raw ICMP packet
+    """
+    payload = PAYLOAD_TAG + struct.pack('!d', time.time())
+    header = struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, 0, identifier, sequence)
+    checksum = icmp_checksum(header + payload)
+    header = struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, checksum, identifier, sequence)
+    return header + payload
+
+
+class ICMPPinger:
+    """
+    Sends ICMP echo requests to many hosts from a single socket
+
+    Uses an unprivileged ping socket (SOCK_DGRAM/IPPROTO_ICMP) when the
+    kernel allows it and falls back to a raw socket. Replies are matched
+    by source address and sequence number, and the reply TTL is read from
+    IP_RECVTTL ancillary data (ping socket) or the IP header (raw socket).
+    """
+
+    def __init__(self, timeout: float = 1.0, retries: int = 1):
+        """
+        Initialize pinger
+
+        Args:
+            timeout: Seconds to wait for replies after each send round
+            retries: Extra send rounds for hosts that did not answer
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.sock = None
+        self.raw = False
+        self.identifier = os.getpid() & 0xFFFF
+        self._pending: Dict[Tuple[str, int], str] = {}
+        self._ttls: Dict[str, int] = {}
+        self._done: Optional[asyncio.Event] = None
+        self._sending = False
+
+    @staticmethod
+    def is_supported() -> bool:
+        """
+        Whether an in-process ICMP socket can be used on this platform
+
+        Reply parsing follows Linux ping sockets (no IP header, IP_TTL
+        control message); macOS datagram ICMP sockets differ, so other
+        platforms use the ping command instead.
+        """
+        return sys.platform.startswith('linux')
+
+    def open(self):
+        """
+        Open the ICMP socket
+
+        Raises:
+            OSError: If neither a ping socket nor a raw socket is permitted
+        """
+        try:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+            self.raw = False
+            self.sock.setsockopt(socket.IPPROTO_IP, IP_RECVTTL, 1)
+        except OSError:
+            if self.sock:
+                self.sock.close()
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+            self.raw = True
+        try:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_SIZE)
+        except OSError:
+            pass
+        self.sock.setblocking(False)
+
+    def close(self):
+        """
+        Close the ICMP socket
+        """
+        if self.sock:
+            self.sock.close()
+            self.sock = None
+
+    def _parse_reply(self, data: bytes, ancdata) -> Optional[Tuple[int, int]]:
+        """
+        Extract (sequence, ttl) from a received echo reply
+
+        Returns:
+            Tuple or None if the packet is not one of our replies
+        """
+        ttl = None
+        if self.raw:
+            if len(data) < 20:
+                return None
+            header_length = (data[0] & 0x0F) * 4
+            ttl = data[8]
+            data = data[header_length:]
+        else:
+            for level, kind, value in ancdata:
+                if level == socket.IPPROTO_IP and kind == socket.IP_TTL and len(value) >= 4:
+                    ttl = struct.unpack('i', value[:4])[0]
+
+        if len(data) < 8:
+            return None
+        icmp_type, _, _, identifier, sequence = struct.unpack('!BBHHH', data[:8])
+        if icmp_type != ICMP_ECHO_REPLY or not data[8:].startswith(PAYLOAD_TAG):
+            return None
+        # Ping sockets rewrite the identifier, so only raw replies are checked
+        if self.raw and identifier != self.identifier:
+            return None
+        return sequence, ttl
+
+    def _on_readable(self):
+        """
+        Drain every datagram currently queued on the socket
+        """
+        while True:
+            try:
+                data, ancdata, _, address = self.sock.recvmsg(2048, socket.CMSG_SPACE(4))
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return
+
+            parsed = self._parse_reply(data, ancdata)
+            if not parsed:
+                continue
+            sequence, ttl = parsed
+            ip = self._pending.pop((address[0], sequence), None)
+            if ip is not None and ttl is not None:
+                self._ttls[ip] = ttl
+                if not self._pending and not self._sending and self._done:
+                    self._done.set()
+
+    async def _send(self, packet: bytes, ip: str):
+        """
+        Send one packet, yielding to the loop while the socket buffer is full
+        """
+        for _ in range(100):
+            try:
+                self.sock.sendto(packet, (ip, 0))
+                return
+            except (BlockingIOError, InterruptedError):
+                await asyncio.sleep(0.001)
+            except OSError:
+                return
+
+    async def ping_many(self, ip_addresses: Iterable[str]) -> Dict[str, Optional[int]]:
+        """
+        Ping every address and collect reply TTLs
+
+        Args:
+            ip_addresses: IPv4 addresses to probe
+
+        Returns:
+            Dictionary mapping IP -> reply TTL (None if no reply)
+        """
+        targets = list(dict.fromkeys(ip_addresses))
+        results: Dict[str, Optional[int]] = {ip: None for ip in targets}
+        if not targets:
+            return results
+
+        if self.sock is None:
+            self.open()
+
+        loop = asyncio.get_running_loop()
+        loop.add_reader(self.sock.fileno(), self._on_readable)
+        self._ttls = {}
+        sequence = 0
+
+        try:
+            for _ in range(self.retries + 1):
+                remaining = [ip for ip in targets if ip not in self._ttls]
+                if not remaining:
+                    break
+
+                self._pending = {}
+                self._done = asyncio.Event()
+                self._sending = True
+                for count, ip in enumerate(remaining, 1):
+                    sequence = (sequence + 1) & 0xFFFF
+                    self._pending[(ip, sequence)] = ip
+                    await self._send(build_echo_request(self.identifier, sequence), ip)
+                    if count % SEND_BATCH == 0:
+                        # Let the reader drain replies before the buffer fills
+                        await asyncio.sleep(0)
+
+                self._sending = False
+                if not self._pending:
+                    continue
+
+                try:
+                    await asyncio.wait_for(self._done.wait(), timeout=self.timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            loop.remove_reader(self.sock.fileno())
+            self._pending = {}
+
+        results.update(self._ttls)
+        return results
@@ -0,0 +1,181 @@
+"""
+EYE - JavaScript Asset Fingerprinting Module
+Version detection from the first kilobytes of referenced script bundles
+"""
+
+import asyncio
+import hashlib
+import re
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+import aiohttp
+from modules.packs import register_pack, get_pack
+
+# Bytes read from each script (license banners sit at the top)
+SCRIPT_MAX_BYTES = 64 * 1024
+
+# Scripts fetched per page and concurrent script downloads overall
+MAX_SCRIPTS_PER_PAGE = 10
+SCRIPT_CONCURRENCY = 20
+
+# Detection: (library name, result category, version)
+Detection = Tuple[str, str, str]
+
+
+def compile_js_signatures(data: dict) -> List[Tuple[str, str, List[re.Pattern]]]:
+    """
+    Compile the 'js_versions' pack
+
+    Args:
+        data: Merged pack data
+
+    Returns:
+        List of (name, category, compiled patterns)
+    """
+    return [
+        (library['name'], library.get('category', 'js_libraries'),
+         [re.compile(pattern, re.IGNORECASE) for pattern in library.get('patterns', [])])
+        for library in data.get('libraries', [])
+    ]
+
+
+# Library version signatures
+register_pack('js_versions', 'js_versions.json', compile_js_signatures)
+
+# Process-wide caches, so CDN bundles shared by many hosts are read once:
+# script URL -> detections, sha1(first bytes) -> detections
+_URL_CACHE: Dict[str, List[Detection]] = {}
+_CONTENT_CACHE: Dict[bytes, List[Detection]] = {}
+
+# Signatures the caches were filled with (cleared when the pack reloads)
+_cache_signatures = None
+
+
+def match_versions(text: str, signatures=None) -> List[Detection]:
+    """
+    Run version signatures over a script URL or script content
+
+    Args:
+        text: Text to search
+        signatures: Compiled signatures (default: the 'js_versions' pack)
+
+    Returns:
+        List of detections, at most one per library
+    """
+    detections = []
+    for name, category, patterns in (get_pack('js_versions') if signatures is None else signatures):
+        for pattern in patterns:
+            found = pattern.search(text)
+            if found:
+                detections.append((name, category, found.group(1)))
+                break
+    return detections
+
+
+class ScriptFingerprinter:
+    """
+    Fetches referenced scripts (byte-capped, bounded concurrency) and
+    extracts library versions, sharing results across hosts
+    """
+
+    def __init__(self, concurrency: int = SCRIPT_CONCURRENCY, max_bytes: int = SCRIPT_MAX_BYTES,
+                 max_scripts: int = MAX_SCRIPTS_PER_PAGE):
+        """
+        Initialize fingerprinter
+
+        Args:
+            concurrency: Maximum concurrent script downloads
+            max_bytes: Bytes read from each script
+            max_scripts: Scripts fetched per page
+        """
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.max_bytes = max_bytes
+        self.max_scripts = max_scripts
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.fetched = 0
+
+        global _cache_signatures
+        signatures = get_pack('js_versions')
+        if signatures is not _cache_signatures:
+            _URL_CACHE.clear()
+            _CONTENT_CACHE.clear()
+            _cache_signatures = signatures
+
+    async def _download(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+        """
+        Read the first max_bytes of a script
+        """
+        async with self.semaphore:
+            try:
+                headers = {'Range': f'bytes=0-{self.max_bytes - 1}'}
+                async with session.get(url, ssl=False, allow_redirects=True, headers=headers) as response:
+                    if response.status not in (200, 206):
+                        return None
+                    content = bytearray()
+                    async for chunk in response.content.iter_chunked(16 * 1024):
+                        content.extend(chunk)
+                        if len(content) >= self.max_bytes:
+                            break
+                    self.fetched += 1
+                    return bytes(content[:self.max_bytes])
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                return None
+
+    async def _fingerprint_script(self, session: aiohttp.ClientSession, url: str) -> List[Detection]:
+        """
+        Detections for one script URL (URL cache, then content cache)
+        """
+        if url in _URL_CACHE:
+            return _URL_CACHE[url]
+
+        content = await self._download(session, url)
+        if content is None:
+            detections = match_versions(url)
+        else:
+            digest = hashlib.sha1(content).digest()
+            detections = _CONTENT_CACHE.get(digest)
+            if detections is None:
+                detections = _CONTENT_CACHE[digest] = match_versions(content.decode('utf-8', errors='replace'))
+            if not detections:
+                detections = match_versions(url)
+
+        _URL_CACHE[url] = detections
+        return detections
+
+    async def fingerprint(self, session: aiohttp.ClientSession, page_url: str,
+                          script_srcs: List[str]) -> Dict[str, List[Detection]]:
+        """
+        Fingerprint the scripts referenced by a page
+
+        Concurrent requests for the same script URL (from different hosts)
+        share one download.
+
+        Args:
+            session: Shared client session
+            page_url: URL of the page the scripts belong to
+            script_srcs: src attributes of the page's <script> tags
+
+        Returns:
+            Dictionary mapping script URL -> detections (scripts with none omitted)
+        """
+        urls = []
+        for src in script_srcs:
+            url = urljoin(page_url, src.strip())
+            if urlparse(url).scheme in ('http', 'https') and url not in urls:
+                urls.append(url)
+        urls = urls[:self.max_scripts]
+
+        tasks = []
+        for url in urls:
+            task = self._inflight.get(url)
+            if task is None:
+                task = self._inflight[url] = asyncio.ensure_future(self._fingerprint_script(session, url))
+                task.add_done_callback(lambda _, url=url: self._inflight.pop(url, None))
+            # Shielded: one host timing out must not cancel a download others await
+            tasks.append(asyncio.shield(task))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return {
+            url: detections for url, detections in zip(urls, results)
+            if detections and not isinstance(detections, Exception)
+        }
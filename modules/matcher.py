@@ -0,0 +1,83 @@
+"""
+EYE - Multi-Pattern Matcher Module
+Finds which of many literal patterns occur in a text, including streamed text
+"""
+
+from typing import Dict, FrozenSet, Hashable, Iterable, Set, Tuple
+import ahocorasick
+
+
+class AhoCorasick:
+    """
+    Finds which of many literal patterns occur in a text in a single scan
+
+    Each pattern carries a payload (e.g. a signature index); search()
+    returns the set of payloads whose patterns occur. Matching runs in the
+    pyahocorasick C automaton.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Hashable]]):
+        """
+        Build the automaton
+
+        Args:
+            patterns: (pattern, payload) pairs; a pattern may map to several payloads
+        """
+        payloads: Dict[str, Set[Hashable]] = {}
+        for pattern, payload in patterns:
+            if pattern:
+                payloads.setdefault(pattern, set()).add(payload)
+
+        self.patterns: Dict[str, FrozenSet[Hashable]] = {
+            pattern: frozenset(values) for pattern, values in payloads.items()
+        }
+        self.pattern_count = len(self.patterns)
+        self.all_payloads = frozenset().union(*self.patterns.values()) if self.patterns else frozenset()
+        # Characters carried between chunks so patterns spanning a boundary are seen
+        self.overlap = max(map(len, self.patterns), default=1) - 1
+        self._automaton = None
+
+        if self.patterns:
+            automaton = ahocorasick.Automaton()
+            for pattern, values in self.patterns.items():
+                automaton.add_word(pattern, values)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def feed(self, text: str, state: str = '') -> Tuple[Set[Hashable], str]:
+        """
+        Scan a chunk of text, continuing from a previous chunk
+
+        The tail of the previous chunk is searched again together with
+        the new one, so patterns spanning chunk boundaries are found and
+        a body can be matched while it streams in.
+
+        Args:
+            text: Text chunk
+            state: State returned by the previous call ('' to start)
+
+        Returns:
+            Tuple of (payloads found, state to resume from)
+        """
+        window = state + text if state else text
+        tail = window[max(0, len(window) - self.overlap):] if self.overlap else ''
+        return self.search(window), tail
+
+    def search(self, text: str) -> Set[Hashable]:
+        """
+        Find the payloads of every pattern occurring in a text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of payloads
+        """
+        found = set()
+        if self._automaton is None:
+            return found
+        for _, values in self._automaton.iter(text):
+            found |= values
+            if len(found) == len(self.all_payloads):
+                break
+        return found
@@ -0,0 +1,256 @@
+"""
+EYE - Name Trie Module
+Reversed-label trie for normalizing, scoping and querying discovered hostnames
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Valid DNS label after IDNA encoding (underscores appear in real CT data)
+LABEL_PATTERN = re.compile(r'^[a-z0-9_](?:[a-z0-9_-]{0,61}[a-z0-9_])?$')
+
+
+def normalize_name(name: str) -> Optional[str]:
+    """
+    Normalize a hostname for deduplication
+
+    Lowercases, strips whitespace and trailing dots, converts Unicode
+    labels to their IDNA (punycode) form and rejects wildcards and
+    malformed names.
+
+    Args:
+        name: Raw hostname
+
+    Returns:
+        Normalized ASCII hostname, or None if it is not a usable host
+    """
+    if not name:
+        return None
+
+    name = name.strip().rstrip('.').lower()
+    if not name or name.startswith('*'):
+        return None
+
+    if not name.isascii():
+        try:
+            name = name.encode('idna').decode('ascii')
+        except UnicodeError:
+            return None
+
+    if len(name) > 253:
+        return None
+
+    for label in name.split('.'):
+        if not LABEL_PATTERN.match(label):
+            return None
+
+    return name
+
+
+class _Node:
+    """
+    Trie node: one DNS label, with the number of names at or below it
+    """
+
+    __slots__ = ('children', 'terminal', 'count')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.terminal = False
+        self.count = 0
+
+
+class NameTrie:
+    """
+    Stores hostnames keyed by reversed labels (com -> example -> www)
+
+    Every node counts the names in its subtree, so "how many names live
+    under api.example.com" and "which subtrees are densest" are answered
+    without scanning the whole namespace.
+    """
+
+    def __init__(self, apex: Optional[str] = None):
+        """
+        Initialize the trie
+
+        Args:
+            apex: Target apex domain; names outside it are rejected
+        """
+        self.apex = normalize_name(apex) if apex else None
+        self.root = _Node()
+        self.rejected = 0
+
+    def in_scope(self, name: str) -> bool:
+        """
+        Check whether a normalized name is the apex or below it
+
+        Args:
+            name: Normalized hostname
+
+        Returns:
+            True if in scope (always True without an apex)
+        """
+        if not self.apex:
+            return True
+        return name == self.apex or name.endswith('.' + self.apex)
+
+    def _find(self, name: str) -> Optional[_Node]:
+        node = self.root
+        for label in reversed(name.split('.')):
+            node = node.children.get(label)
+            if node is None:
+                return None
+        return node
+
+    def _suffix_node(self, suffix: str) -> Optional[_Node]:
+        """
+        Node of a domain suffix, the root for "" and None if absent or invalid
+        """
+        if not suffix:
+            return self.root
+        suffix = normalize_name(suffix)
+        return self._find(suffix) if suffix else None
+
+    def add(self, name: str) -> Optional[str]:
+        """
+        Normalize and insert a hostname
+
+        Args:
+            name: Raw hostname
+
+        Returns:
+            The normalized name if it was newly added, otherwise None
+        """
+        name = normalize_name(name)
+        if not name or not self.in_scope(name):
+            self.rejected += 1
+            return None
+
+        labels = name.split('.')
+        node = self.root
+        path = [node]
+        for label in reversed(labels):
+            child = node.children.get(label)
+            if child is None:
+                child = node.children[label] = _Node()
+            node = child
+            path.append(node)
+
+        if node.terminal:
+            return None
+
+        node.terminal = True
+        for visited in path:
+            visited.count += 1
+        return name
+
+    def __contains__(self, name: str) -> bool:
+        name = normalize_name(name)
+        if not name:
+            return False
+        node = self._find(name)
+        return bool(node and node.terminal)
+
+    def __len__(self) -> int:
+        return self.root.count
+
+    def __iter__(self) -> Iterator[str]:
+        return self.under('')
+
+    def under(self, suffix: str) -> Iterator[str]:
+        """
+        Iterate over every stored name equal to or below a suffix
+
+        Args:
+            suffix: Domain suffix such as "api.example.com" ("" for all)
+
+        Yields:
+            Matching hostnames
+        """
+        node = self._suffix_node(suffix)
+        if node is None:
+            return
+        suffix = normalize_name(suffix) if suffix else ''
+
+        stack = [(node, suffix)]
+        while stack:
+            current, name = stack.pop()
+            if current.terminal:
+                yield name
+            for label, child in current.children.items():
+                stack.append((child, f"{label}.{name}" if name else label))
+
+    def count(self, suffix: str) -> int:
+        """
+        Number of stored names equal to or below a suffix
+
+        Args:
+            suffix: Domain suffix ("" for the whole trie)
+
+        Returns:
+            Name count
+        """
+        node = self._suffix_node(suffix)
+        return node.count if node else 0
+
+    def child_labels(self, suffix: str) -> List[str]:
+        """
+        Labels directly below a suffix (e.g. ["www", "api"] under example.com)
+
+        Args:
+            suffix: Domain suffix ("" for the top-level labels)
+
+        Returns:
+            List of child labels
+        """
+        node = self._suffix_node(suffix)
+        return list(node.children) if node else []
+
+    def dense_subtrees(self, limit: int = 10, min_count: int = 2) -> List[Tuple[str, int]]:
+        """
+        Find the subtrees below the apex holding the most names
+
+        Args:
+            limit: Maximum number of subtrees to return
+            min_count: Ignore subtrees smaller than this
+
+        Returns:
+            List of (suffix, count), densest first
+        """
+        start = self.apex or ''
+        node = self._find(start) if start else self.root
+        if node is None:
+            return []
+
+        subtrees = []
+        stack = [(child, f"{label}.{start}" if start else label) for label, child in node.children.items()]
+        while stack:
+            current, name = stack.pop()
+            if current.count >= min_count and current.children:
+                subtrees.append((name, current.count))
+                stack.extend((child, f"{label}.{name}") for label, child in current.children.items())
+
+        subtrees.sort(key=lambda item: (-item[1], item[0]))
+        return subtrees[:limit]
+
+    def prioritized(self) -> List[str]:
+        """
+        All names ordered so that hosts in denser subtrees come first
+
+        Hosts are grouped by the subtree directly below the apex (e.g. all
+        of *.api.example.com), largest group first.
+
+        Returns:
+            List of hostnames
+        """
+        apex_depth = len(self.apex.split('.')) if self.apex else 0
+
+        def branch_density(name: str) -> int:
+            labels = name.split('.')
+            if len(labels) <= apex_depth:
+                return 0
+            branch = '.'.join(labels[-(apex_depth + 1):])
+            node = self._find(branch)
+            return node.count if node else 0
+
+        return sorted(self, key=lambda name: (-branch_density(name), name.count('.'), name))
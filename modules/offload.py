@@ -0,0 +1,85 @@
+"""
+EYE - Parse Offload Module
+Runs CPU-heavy HTML parsing and extraction in a process pool, off the event loop
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+# Pages smaller than this are parsed inline (pickling costs more than parsing)
+OFFLOAD_THRESHOLD = 64 * 1024
+
+# Parse worker processes (default: one per core)
+OFFLOAD_WORKERS = os.cpu_count() or 1
+
+
+class ParseExecutor:
+    """
+    Sends large parse jobs to a lazily started ProcessPoolExecutor
+
+    Jobs are module-level functions taking the content as their first
+    argument; they should return compact, cheaply pickled results
+    (tuples of strings rather than sets or parse trees).
+    """
+
+    def __init__(self, workers: int = OFFLOAD_WORKERS, threshold: int = OFFLOAD_THRESHOLD):
+        """
+        Initialize executor
+
+        Args:
+            workers: Worker processes (0 parses everything inline)
+            threshold: Content length from which jobs are offloaded
+        """
+        self.workers = workers
+        self.threshold = threshold
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.offloaded = 0
+        self.inline = 0
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self._pool is None and self.workers > 0:
+            try:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            except (OSError, NotImplementedError, ValueError):
+                # No process support here; parse inline from now on
+                self.workers = 0
+        return self._pool
+
+    async def run(self, func: Callable[..., Any], content: str, *args) -> Any:
+        """
+        Run a parse job, in the pool for large content and inline otherwise
+
+        Args:
+            func: Picklable module-level function
+            content: Page content (first argument of func)
+            *args: Further picklable arguments
+
+        Returns:
+            Whatever func returns
+        """
+        pool = self._get_pool() if len(content) >= self.threshold else None
+        if pool is not None:
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(pool, func, content, *args)
+                self.offloaded += 1
+                return result
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); start a fresh pool next time
+                self._pool = None
+        self.inline += 1
+        return func(content, *args)
+
+    def shutdown(self):
+        """
+        Stop the worker processes (a later job starts a new pool)
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Process-wide executor shared by the harvester, social hunter and bypass module
+parse_executor = ParseExecutor()
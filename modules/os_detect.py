@@ -8,9 +8,220 @@ import subprocess
 import re
 import platform
 from rich.console import Console
+from modules.icmp import ICMPPinger
 
 console = Console()
 
+# Concurrent ping processes when the in-process ICMP engine is unavailable
+PING_CONCURRENCY = 50
+
+# Default initial TTLs of common stacks; observed TTLs round up to one of these
+INITIAL_TTLS = (32, 64, 128, 255)
+
+# Observed TTL (0-255) -> initial TTL, precomputed once
+INITIAL_TTL_TABLE = [next(initial for initial in INITIAL_TTLS if ttl <= initial) for ttl in range(256)]
+
+# Label used when the evidence cannot separate the families sharing a TTL
+TTL_LABELS = {
+    32: 'Windows (legacy)',
+    64: 'Linux/Unix/macOS',
+    128: 'Windows',
+    255: 'Cisco IOS/Solaris'
+}
+
+# Signal tables: key -> {os family: weight}
+TTL_SIGNATURES = {
+    32: {'Windows': 1.0},
+    64: {'Linux': 0.5, 'macOS/BSD': 0.5},
+    128: {'Windows': 1.0},
+    255: {'Cisco IOS': 0.5, 'Solaris': 0.5}
+}
+
+# (initial TTL, SYN-ACK window size)
+WINDOW_SIGNATURES = {
+    (64, 5840): {'Linux': 1.0},
+    (64, 14600): {'Linux': 1.0},
+    (64, 28960): {'Linux': 1.0},
+    (64, 29200): {'Linux': 1.0},
+    (64, 43690): {'Linux': 1.0},
+    (64, 64240): {'Linux': 1.0},
+    (64, 65160): {'Linux': 1.0},
+    (64, 65483): {'Linux': 1.0},
+    (64, 65535): {'macOS/BSD': 1.0},
+    (128, 8192): {'Windows': 1.0},
+    (128, 16384): {'Windows': 1.0},
+    (128, 64240): {'Windows': 1.0},
+    (128, 65535): {'Windows': 1.0},
+    (255, 4128): {'Cisco IOS': 1.0},
+    (255, 8760): {'Solaris': 1.0},
+    (255, 49640): {'Solaris': 1.0}
+}
+
+# SYN-ACK TCP option order (see ttl_capture.TCP_OPTION_CODES)
+OPTION_SIGNATURES = {
+    'MSTNW': {'Linux': 1.0},
+    'MNNSNW': {'Linux': 1.0},
+    'MNNS': {'Linux': 0.5, 'Windows': 0.5},
+    'MNWNNS': {'Windows': 1.0},
+    'MNWST': {'Windows': 0.5, 'macOS/BSD': 0.5},
+    'MNWNNTSE': {'macOS/BSD': 1.0},
+    'MNWSTE': {'macOS/BSD': 1.0},
+    'NNTNWM': {'Solaris': 1.0},
+    'M': {'Cisco IOS': 1.0}
+}
+
+# Tokens found in HTTP Server headers
+SERVER_SIGNATURES = {
+    'microsoft-iis': {'Windows': 1.5},
+    'microsoft-httpapi': {'Windows': 1.5},
+    'win32': {'Windows': 1.5},
+    'win64': {'Windows': 1.5},
+    'ubuntu': {'Linux': 1.5},
+    'debian': {'Linux': 1.5},
+    'centos': {'Linux': 1.5},
+    'red hat': {'Linux': 1.5},
+    'fedora': {'Linux': 1.5},
+    'amazon linux': {'Linux': 1.5},
+    'freebsd': {'macOS/BSD': 1.5},
+    'openbsd': {'macOS/BSD': 1.5},
+    'darwin': {'macOS/BSD': 1.5},
+    'sunos': {'Solaris': 1.5},
+    'solaris': {'Solaris': 1.5},
+    'cisco': {'Cisco IOS': 1.5}
+}
+
+SERVER_PATTERN = re.compile('|'.join(re.escape(token) for token in SERVER_SIGNATURES))
+
+# Total evidence weight needed before the score can reach 1.0
+FULL_EVIDENCE = 3.0
+
+# Score thresholds for the High/Medium confidence labels
+CONFIDENCE_LEVELS = ((0.6, 'High'), (0.3, 'Medium'), (0.0, 'Low'))
+
+
+def fingerprint_os(ttl: int = None, window: int = None, options: str = None,
+                   server: str = None) -> dict:
+    """
+    Classify an operating system from every available signal
+    
+    Each signal is a lookup into one of the signature tables; the weights
+    of all matches are summed per OS family.
+    
+    Args:
+        ttl: Observed TTL (ICMP reply or SYN-ACK)
+        window: SYN-ACK window size
+        options: SYN-ACK TCP option order (e.g. "MSTNW")
+        server: HTTP Server header
+        
+    Returns:
+        Dictionary with os_guess, confidence, score, initial_ttl and signals
+    """
+    votes = {}
+    signals = []
+    initial = INITIAL_TTL_TABLE[ttl] if ttl is not None and 0 <= ttl <= 255 else None
+    
+    matches = []
+    if initial is not None:
+        matches.append((f"ttl:{ttl}/{initial}", TTL_SIGNATURES.get(initial)))
+        if window is not None:
+            matches.append((f"window:{window}", WINDOW_SIGNATURES.get((initial, window))))
+    if options:
+        matches.append((f"options:{options}", OPTION_SIGNATURES.get(options)))
+    if server:
+        for token in set(SERVER_PATTERN.findall(server.lower())):
+            matches.append((f"server:{token}", SERVER_SIGNATURES[token]))
+    
+    for signal, weights in matches:
+        if not weights:
+            continue
+        signals.append(signal)
+        for family, weight in weights.items():
+            votes[family] = votes.get(family, 0.0) + weight
+    
+    if not votes:
+        return {
+            'os_guess': 'Unknown',
+            'confidence': 'Low',
+            'score': 0.0,
+            'initial_ttl': initial,
+            'signals': signals
+        }
+    
+    ranked = sorted(votes.items(), key=lambda item: -item[1])
+    best_family, best = ranked[0]
+    total = sum(votes.values())
+    
+    tied = len(ranked) > 1 and ranked[1][1] == best
+    if tied and initial is not None:
+        os_guess = TTL_LABELS[initial]
+    elif tied:
+        os_guess = '/'.join(family for family, weight in ranked if weight == best)
+    else:
+        os_guess = best_family
+    
+    score = round(best / total * min(1.0, total / FULL_EVIDENCE), 2)
+    confidence = next(label for threshold, label in CONFIDENCE_LEVELS if score >= threshold)
+    
+    return {
+        'os_guess': os_guess,
+        'confidence': confidence,
+        'score': score,
+        'initial_ttl': initial,
+        'signals': signals
+    }
+
+
+def classify_ttl(ttl: int) -> tuple:
+    """
+    Guess the operating system from an observed TTL alone
+    
+    Args:
+        ttl: TTL of a reply packet
+        
+    Returns:
+        Tuple of (os_guess, confidence)
+    """
+    result = fingerprint_os(ttl=ttl)
+    return result['os_guess'], result['confidence']
+
+
+def classify_hosts(os_map: dict, fingerprints: dict = None, servers: dict = None) -> dict:
+    """
+    Re-classify every host in one pass with all collected signals
+    
+    Args:
+        os_map: Key (host or IP) -> OS detection result holding 'ttl'
+        fingerprints: Same keys -> SYN-ACK fingerprint from the port scan
+        servers: Same keys -> HTTP Server header from Phase 3
+        
+    Returns:
+        The updated os_map
+    """
+    fingerprints = fingerprints or {}
+    servers = servers or {}
+    
+    for key in set(os_map) | set(servers):
+        result = os_map.setdefault(key, {'ttl': None, 'method': 'HTTP Server header'})
+        fingerprint = fingerprints.get(key) or {}
+        ttl = result.get('ttl') or fingerprint.get('ttl')
+        window = fingerprint.get('window', result.get('tcp_window'))
+        options = fingerprint.get('options', result.get('tcp_options'))
+        server = servers.get(key)
+        
+        classified = fingerprint_os(ttl=ttl, window=window, options=options, server=server)
+        if classified['os_guess'] == 'Unknown' and result.get('os_guess'):
+            # Keep the "(No response)"/"(Error)" detail when nothing matched
+            continue
+        result.update(classified)
+        if window is not None:
+            result['tcp_window'] = window
+        if options:
+            result['tcp_options'] = options
+        if server:
+            result['server'] = server
+    
+    return os_map
+
 
 async def detect_os(ip_address: str) -> dict:
     """
@@ -55,28 +266,7 @@ async def detect_os(ip_address: str) -> dict:
             }
         
         ttl = int(ttl_match.group(1))
-        
-        # OS Detection based on TTL
-        if ttl <= 64:
-            os_guess = "Linux/Unix"
-            confidence = "High" if ttl in [64, 63, 62] else "Medium"
-        elif ttl <= 128:
-            os_guess = "Windows"
-            confidence = "High" if ttl in [128, 127, 126] else "Medium"
-        elif ttl <= 255:
-            os_guess = "Cisco/Solaris/Network Device"
-            confidence = "High" if ttl in [255, 254, 253] else "Medium"
-        else:
-            os_guess = "Unknown"
-            confidence = "Low"
-        
-        # Additional heuristics
-        if ttl == 64:
-            os_guess = "Linux/Unix/macOS"
-        elif ttl == 128:
-            os_guess = "Windows"
-        elif ttl == 255:
-            os_guess = "Cisco IOS/Solaris"
+        os_guess, confidence = classify_ttl(ttl)
         
         return {
             'os_guess': os_guess,
@@ -103,9 +293,9 @@ async def detect_os(ip_address: str) -> dict:
         }
 
 
-async def detect_os_multiple(ip_addresses: list) -> dict:
+async def _ping_all_icmp(ip_addresses: list) -> dict:
     """
-    Detect OS for multiple IP addresses
+    Probe all addresses with the in-process ICMP engine
     
     Args:
         ip_addresses: List of IP addresses
@@ -113,9 +303,49 @@ async def detect_os_multiple(ip_addresses: list) -> dict:
     Returns:
         Dictionary mapping IP -> OS detection results
     """
-    console.print(f"[*] Running OS detection on [cyan]{len(ip_addresses)}[/cyan] hosts...")
+    pinger = ICMPPinger()
+    try:
+        ttls = await pinger.ping_many(ip_addresses)
+    finally:
+        pinger.close()
+    
+    os_map = {}
+    for ip, ttl in ttls.items():
+        if ttl is None:
+            os_map[ip] = {
+                'os_guess': 'Unknown (No response)',
+                'ttl': None,
+                'confidence': 'Low',
+                'method': 'TTL Fingerprinting'
+            }
+        else:
+            os_guess, confidence = classify_ttl(ttl)
+            os_map[ip] = {
+                'os_guess': os_guess,
+                'ttl': ttl,
+                'confidence': confidence,
+                'method': 'TTL Fingerprinting'
+            }
+    return os_map
+
+
+async def _ping_all_subprocess(ip_addresses: list) -> dict:
+    """
+    Probe all addresses with the system ping command, a bounded number at a time
+    
+    Args:
+        ip_addresses: List of IP addresses
+        
+    Returns:
+        Dictionary mapping IP -> OS detection results
+    """
+    semaphore = asyncio.Semaphore(PING_CONCURRENCY)
     
-    tasks = [detect_os(ip) for ip in ip_addresses]
+    async def detect_with_limit(ip):
+        async with semaphore:
+            return await detect_os(ip)
+    
+    tasks = [detect_with_limit(ip) for ip in ip_addresses]
     results = await asyncio.gather(*tasks, return_exceptions=True)
     
     os_map = {}
@@ -128,12 +358,71 @@ async def detect_os_multiple(ip_addresses: list) -> dict:
             }
         else:
             os_map[ip] = result
-            
-            # Display result
-            if result.get('ttl'):
-                console.print(f"  [{ip}] TTL={result['ttl']} → [cyan]{result['os_guess']}[/cyan] ({result['confidence']} confidence)")
-            else:
-                console.print(f"  [{ip}] [dim]{result['os_guess']}[/dim]")
+    return os_map
+
+
+async def detect_os_multiple(ip_addresses: list, fingerprints: dict = None, host_map: dict = None) -> dict:
+    """
+    Detect OS for multiple IP addresses
+    
+    Each unique address is handled once. Addresses with a SYN-ACK
+    fingerprint captured during the port scan are classified from it
+    directly and not probed again. The rest are pinged from one ICMP
+    socket when possible; otherwise the system ping command is used with
+    a concurrency limit.
+    
+    Args:
+        ip_addresses: List of IP addresses
+        fingerprints: Optional IP -> passive fingerprint (from PortScanner)
+        host_map: Optional hostname -> IP; results are also keyed by hostname
+        
+    Returns:
+        Dictionary mapping IP (and hostname, if host_map given) -> OS detection results
+    """
+    ip_addresses = list(dict.fromkeys(list(ip_addresses) + list((host_map or {}).values())))
+    console.print(f"[*] Running OS detection on [cyan]{len(ip_addresses)}[/cyan] hosts...")
+    
+    fingerprints = fingerprints or {}
+    os_map = {}
+    for ip in ip_addresses:
+        fingerprint = fingerprints.get(ip)
+        if fingerprint and fingerprint.get('ttl'):
+            os_map[ip] = {
+                'ttl': fingerprint['ttl'],
+                'method': 'Passive TTL (port scan SYN-ACK)'
+            }
+    
+    to_probe = [ip for ip in ip_addresses if ip not in os_map]
+    if os_map:
+        console.print(f"[*] [dim]{len(os_map)} hosts classified from captured SYN-ACKs, probing {len(to_probe)}[/dim]")
+    
+    if to_probe:
+        probed = None
+        if ICMPPinger.is_supported():
+            try:
+                probed = await _ping_all_icmp(to_probe)
+            except OSError as e:
+                console.print(f"[*] [dim]ICMP socket unavailable ({str(e)}), using system ping[/dim]")
+        
+        if probed is None:
+            probed = await _ping_all_subprocess(to_probe)
+        os_map.update(probed)
+    
+    # Classify all hosts in one batch (TTL + window + options)
+    classify_hosts(os_map, fingerprints)
+    
+    for ip in ip_addresses:
+        result = os_map[ip]
+        # Display result
+        if result.get('ttl'):
+            console.print(f"  [{ip}] TTL={result['ttl']} → [cyan]{result['os_guess']}[/cyan] ({result['confidence']} confidence, score {result['score']})")
+        else:
+            console.print(f"  [{ip}] [dim]{result['os_guess']}[/dim]")
+    
+    # Copies, so per-host refinement (e.g. Server headers) stays per host
+    for host, ip in (host_map or {}).items():
+        if host != ip and ip in os_map:
+            os_map[host] = dict(os_map[ip], ip=ip)
     
     return os_map
 
@@ -0,0 +1,179 @@
+"""
+EYE - Signature Pack Module
+Loads JSON signature packs, caches the merged data on disk and compiles it into matcher objects
+"""
+
+import glob
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, List, Tuple
+from rich.console import Console
+import config
+
+console = Console()
+
+# User packs (config.py files created before signature packs lack the setting)
+SIGNATURE_PACK_DIR = getattr(config, 'SIGNATURE_PACK_DIR', "packs")
+
+# Merged pack data cached as JSON (plain data only: nothing executable is loaded)
+PACK_CACHE_DIR = getattr(config, 'PACK_CACHE_DIR', ".cache/packs")
+
+# Bumped whenever the cached form changes; part of every cache key
+PACK_CACHE_VERSION = 2
+
+# Packs shipped with EYE
+BUILTIN_PACK_DIR = os.path.join(os.path.dirname(__file__), 'signatures')
+
+# kind -> (file name, compiler)
+_REGISTRY: Dict[str, Tuple[str, Callable[[dict], Any]]] = {}
+
+# kind -> (pack hash, compiled object)
+_LOADED: Dict[str, Tuple[str, Any]] = {}
+
+
+def register_pack(kind: str, filename: str, compiler: Callable[[dict], Any]):
+    """
+    Register a pack kind and the function compiling it
+
+    Args:
+        kind: Pack name (e.g. "tech")
+        filename: JSON file name looked up in the built-in and user pack dirs
+        compiler: Callable turning the merged pack dict into a matcher object
+    """
+    _REGISTRY[kind] = (filename, compiler)
+
+
+def merge_packs(base: dict, extra: dict) -> dict:
+    """
+    Merge a user pack into a built-in one (lists are extended, other keys replaced)
+
+    Args:
+        base: Built-in pack data
+        extra: User pack data
+
+    Returns:
+        Merged pack data
+    """
+    merged = dict(base)
+    for key, value in extra.items():
+        if isinstance(value, list) and isinstance(merged.get(key), list):
+            merged[key] = merged[key] + value
+        elif isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = {**merged[key], **value}
+        else:
+            merged[key] = value
+    return merged
+
+
+def _pack_files(filename: str) -> List[str]:
+    """
+    Built-in pack file followed by the user's pack file, if present
+    """
+    candidates = [os.path.join(BUILTIN_PACK_DIR, filename), os.path.join(SIGNATURE_PACK_DIR, filename)]
+    return [path for path in candidates if os.path.isfile(path)]
+
+
+def _read_pack(kind: str) -> Tuple[str, List[bytes]]:
+    """
+    Read the raw pack files and hash them with the cache format and merge code
+
+    Returns:
+        Tuple of (hex digest, raw file contents)
+    """
+    filename, _ = _REGISTRY[kind]
+    digest = hashlib.sha256(f"{kind}:{PACK_CACHE_VERSION}".encode())
+    # Cached data depends on how packs are merged as well
+    with open(__file__, 'rb') as f:
+        digest.update(f.read())
+    raw = []
+    for path in _pack_files(filename):
+        with open(path, 'rb') as f:
+            content = f.read()
+        raw.append(content)
+        digest.update(content)
+    return digest.hexdigest()[:16], raw
+
+
+def _cache_path(kind: str, pack_hash: str) -> str:
+    return os.path.join(PACK_CACHE_DIR, f"{kind}-{pack_hash}.json")
+
+
+def _merged_data(kind: str, pack_hash: str, raw: List[bytes]) -> dict:
+    """
+    Merged pack data from the disk cache, or merged from the raw files and cached
+    """
+    path = _cache_path(kind, pack_hash)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data
+    except (OSError, ValueError):
+        pass
+
+    data = {}
+    for content in raw:
+        try:
+            data = merge_packs(data, json.loads(content.decode('utf-8')))
+        except ValueError as e:
+            console.print(f"[!] [yellow]Skipping invalid '{kind}' pack file: {str(e)}[/yellow]")
+
+    try:
+        os.makedirs(PACK_CACHE_DIR, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        # Drop data of older versions of this pack
+        for stale in glob.glob(os.path.join(PACK_CACHE_DIR, f"{kind}-*.json")):
+            if stale != path:
+                os.remove(stale)
+    except (OSError, TypeError, ValueError):
+        pass
+
+    return data
+
+
+def _compile(kind: str, pack_hash: str, raw: List[bytes]) -> Any:
+    """
+    Compile a pack from its (cached) merged data
+    """
+    return _REGISTRY[kind][1](_merged_data(kind, pack_hash, raw))
+
+
+def get_pack(kind: str) -> Any:
+    """
+    Return the compiled matcher object for a pack kind
+
+    Args:
+        kind: Registered pack name
+
+    Returns:
+        Compiled pack (loaded on first use)
+    """
+    loaded = _LOADED.get(kind)
+    if loaded is None:
+        pack_hash, raw = _read_pack(kind)
+        loaded = _LOADED[kind] = (pack_hash, _compile(kind, pack_hash, raw))
+    return loaded[1]
+
+
+def reload_packs() -> List[str]:
+    """
+    Recompile every loaded pack whose files changed since it was loaded
+
+    Returns:
+        Names of the packs that were reloaded
+    """
+    reloaded = []
+    for kind, (old_hash, _) in list(_LOADED.items()):
+        try:
+            pack_hash, raw = _read_pack(kind)
+            if pack_hash == old_hash:
+                continue
+            _LOADED[kind] = (pack_hash, _compile(kind, pack_hash, raw))
+            reloaded.append(kind)
+        except (OSError, ValueError) as e:
+            console.print(f"[!] [yellow]Keeping previous '{kind}' pack: {str(e)}[/yellow]")
+    return reloaded
@@ -0,0 +1,274 @@
+"""
+EYE - Subdomain Permutation Module
+Derives candidate hostnames from discovered names and resolves them in bulk
+"""
+
+import asyncio
+import re
+import secrets
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+from rich.console import Console
+from modules.bloom import BloomFilter
+from modules.nametrie import NameTrie, normalize_name
+
+console = Console()
+
+
+# Environment words used as prefixes/suffixes and swapped with each other
+ENV_WORDS = [
+    'dev', 'development', 'stage', 'staging', 'prod', 'production',
+    'test', 'qa', 'uat', 'beta', 'preprod', 'int', 'sandbox', 'demo'
+]
+
+# How far numeric labels are incremented/decremented (web01 -> web00..web04)
+NUMBER_SPREAD = 3
+
+# Most common observed label tokens used for word swaps
+MAX_SWAP_WORDS = 50
+
+# Upper bound on candidates generated per run
+DEFAULT_LIMIT = 50000
+
+# Concurrent DNS lookups and per-lookup timeout (seconds)
+DNS_CONCURRENCY = 200
+DNS_TIMEOUT = 3
+
+_DIGITS = re.compile(r'\d+')
+
+
+class SubdomainPermutator:
+    """
+    Lazily generates permutation candidates from a NameTrie
+
+    Candidates are produced one at a time (dense subtrees first) and
+    deduplicated with a Bloom filter, so memory stays fixed no matter how
+    many combinations the rules could produce.
+    """
+
+    def __init__(self, trie: NameTrie, env_words: Optional[List[str]] = None,
+                 spread: int = NUMBER_SPREAD, max_swap_words: int = MAX_SWAP_WORDS,
+                 limit: int = DEFAULT_LIMIT):
+        """
+        Initialize permutator
+
+        Args:
+            trie: Trie holding the discovered names
+            env_words: Environment words (default: ENV_WORDS)
+            spread: Numeric increment range
+            max_swap_words: Vocabulary size for word swaps
+            limit: Maximum number of candidates to generate
+        """
+        self.trie = trie
+        self.env_words = env_words or ENV_WORDS
+        self.spread = spread
+        self.max_swap_words = max_swap_words
+        self.limit = limit
+        self.generated = 0
+        self.bloom = BloomFilter(capacity=limit + len(trie))
+        for name in trie:
+            self.bloom.add(name)
+
+    def _vocabulary(self) -> List[str]:
+        """
+        Most common '-'-separated tokens among the leftmost labels
+        """
+        counts = Counter()
+        for name in self.trie:
+            if name == self.trie.apex:
+                continue
+            for token in name.split('.', 1)[0].split('-'):
+                if token and not token.isdigit():
+                    counts[token] += 1
+        return [token for token, _ in counts.most_common(self.max_swap_words)]
+
+    def numeric_increments(self, name: str) -> Iterator[str]:
+        """
+        web01.example.com -> web00, web02, web03, ... (zero padding kept)
+        """
+        label, _, parent = name.partition('.')
+        for match in _DIGITS.finditer(label):
+            number = int(match.group())
+            width = len(match.group())
+            for delta in range(-self.spread, self.spread + 1):
+                if delta == 0 or number + delta < 0:
+                    continue
+                new_label = label[:match.start()] + str(number + delta).zfill(width) + label[match.end():]
+                yield f"{new_label}.{parent}"
+
+    def env_variants(self, name: str) -> Iterator[str]:
+        """
+        api.example.com -> dev-api, api-dev, dev.api (and env word swaps)
+        """
+        if name == self.trie.apex:
+            for word in self.env_words:
+                yield f"{word}.{name}"
+            return
+
+        label, _, parent = name.partition('.')
+        tokens = label.split('-')
+        env_positions = [i for i, token in enumerate(tokens) if token in self.env_words]
+
+        for word in self.env_words:
+            if env_positions:
+                # Label already names an environment: swap it for the others
+                for i in env_positions:
+                    swapped = tokens[:i] + [word] + tokens[i + 1:]
+                    yield f"{'-'.join(swapped)}.{parent}"
+            else:
+                yield f"{word}-{label}.{parent}"
+                yield f"{label}-{word}.{parent}"
+            yield f"{word}.{name}"
+
+    def word_swaps(self, name: str, vocabulary: List[str]) -> Iterator[str]:
+        """
+        api-v2.example.com -> auth-v2, api-mail, ... using observed tokens
+        """
+        if name == self.trie.apex:
+            return
+
+        label, _, parent = name.partition('.')
+        tokens = label.split('-')
+        for i, token in enumerate(tokens):
+            for word in vocabulary:
+                if word != token:
+                    yield f"{'-'.join(tokens[:i] + [word] + tokens[i + 1:])}.{parent}"
+
+    def candidates(self) -> Iterator[str]:
+        """
+        Yield unique, in-scope candidates that are not already known
+
+        Yields:
+            Candidate hostname
+        """
+        vocabulary = self._vocabulary()
+
+        for name in self.trie.prioritized():
+            generators = (
+                self.numeric_increments(name),
+                self.env_variants(name),
+                self.word_swaps(name, vocabulary)
+            )
+            for generator in generators:
+                for candidate in generator:
+                    candidate = normalize_name(candidate)
+                    if not candidate or not self.trie.in_scope(candidate):
+                        continue
+                    if not self.bloom.add(candidate):
+                        continue
+                    yield candidate
+                    self.generated += 1
+                    if self.generated >= self.limit:
+                        return
+
+
+def _make_resolver(timeout: int):
+    """
+    Build a dnspython async resolver, or None to fall back to getaddrinfo
+    """
+    try:
+        import dns.asyncresolver
+    except ImportError:
+        return None
+
+    resolver = dns.asyncresolver.Resolver()
+    resolver.lifetime = timeout
+    return resolver
+
+
+async def _lookup(resolver, name: str, timeout: int) -> Set[str]:
+    """
+    Resolve A records for a name, returning an empty set on any failure
+    """
+    try:
+        if resolver is not None:
+            answer = await resolver.resolve(name, 'A')
+            return {record.to_text() for record in answer}
+
+        loop = asyncio.get_running_loop()
+        infos = await asyncio.wait_for(loop.getaddrinfo(name, None), timeout=timeout)
+        return {info[4][0] for info in infos}
+    except Exception:
+        return set()
+
+
+async def resolve_bulk(names: Iterable[str], concurrency: int = DNS_CONCURRENCY,
+                       timeout: int = DNS_TIMEOUT, ignore_ips: Optional[Set[str]] = None) -> Dict[str, List[str]]:
+    """
+    Resolve a (possibly lazy) stream of names with a fixed pool of workers
+
+    Workers pull from the iterator on demand, so only `concurrency`
+    names are in flight at any time.
+
+    Args:
+        names: Iterable of hostnames
+        concurrency: Number of concurrent lookups
+        timeout: Per-lookup timeout in seconds
+        ignore_ips: Answers made up only of these IPs are discarded (wildcard DNS)
+
+    Returns:
+        Dictionary mapping resolving names to their IPs
+    """
+    resolver = _make_resolver(timeout)
+    iterator = iter(names)
+    resolved = {}
+    attempted = 0
+
+    async def worker():
+        nonlocal attempted
+        for name in iterator:
+            attempted += 1
+            ips = await _lookup(resolver, name, timeout)
+            if ips and not (ignore_ips and ips <= ignore_ips):
+                resolved[name] = sorted(ips)
+                console.print(f"  [+] [green]{name}[/green] → {', '.join(sorted(ips))}")
+            if attempted % 5000 == 0:
+                console.print(f"  [dim]... {attempted} candidates resolved, {len(resolved)} live[/dim]")
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return resolved
+
+
+async def detect_wildcard(apex: str, timeout: int = DNS_TIMEOUT) -> Set[str]:
+    """
+    Detect wildcard DNS by resolving random labels under the apex
+
+    Args:
+        apex: Target apex domain
+
+    Returns:
+        IPs returned for non-existent names (empty if no wildcard)
+    """
+    resolver = _make_resolver(timeout)
+    probes = [f"{secrets.token_hex(8)}.{apex}" for _ in range(2)]
+    results = await asyncio.gather(*(_lookup(resolver, probe, timeout) for probe in probes))
+    return set().union(*results)
+
+
+async def find_permutations(trie: NameTrie, limit: int = DEFAULT_LIMIT,
+                            concurrency: int = DNS_CONCURRENCY) -> Dict[str, List[str]]:
+    """
+    Generate permutations of discovered names and keep the ones that resolve
+
+    Args:
+        trie: Trie holding discovered names (must have an apex)
+        limit: Maximum number of candidates to try
+        concurrency: Number of concurrent DNS lookups
+
+    Returns:
+        Dictionary mapping newly found hostnames to their IPs
+    """
+    if not trie.apex or not len(trie):
+        return {}
+
+    console.print(f"[*] Generating permutations from [cyan]{len(trie)}[/cyan] known names (limit {limit})...")
+
+    wildcard_ips = await detect_wildcard(trie.apex)
+    if wildcard_ips:
+        console.print(f"[!] [yellow]Wildcard DNS detected ({', '.join(sorted(wildcard_ips))}); matching answers are ignored[/yellow]")
+
+    permutator = SubdomainPermutator(trie, limit=limit)
+    found = await resolve_bulk(permutator.candidates(), concurrency=concurrency, ignore_ips=wildcard_ips)
+
+    console.print(f"[+] Permutations: [green]{len(found)}[/green] live hosts from {permutator.generated} candidates")
+    return found
@@ -0,0 +1,305 @@
+"""
+EYE - Social Profile Verification Module
+Batched, rate-limited existence checks of social profile links with a disk cache
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List
+from urllib.parse import urlparse
+import aiohttp
+from rich.console import Console
+import config
+from config import USER_AGENT
+
+console = Console()
+
+# Verdict cache (config.py files created before profile verification lack the setting)
+SOCIAL_CACHE_FILE = getattr(config, 'SOCIAL_CACHE_FILE', "output/social_profiles_cache.json")
+
+# Profiles checked per batch (the cache is saved after each one)
+PROFILE_BATCH_SIZE = 20
+
+# Requests per second allowed to each platform; others use the default
+PLATFORM_RATE_LIMITS = {
+    'Facebook': 0.5,
+    'Instagram': 0.5,
+    'LinkedIn': 0.5,
+    'Twitter': 1.0,
+    'TikTok': 1.0,
+}
+DEFAULT_RATE_LIMIT = 2.0
+
+# Seconds a platform is left alone after it answers 429 (rate limited)
+PROFILE_BACKOFF = 60
+
+# Per-request timeout and how long cached verdicts stay valid (seconds)
+PROFILE_TIMEOUT = 10
+PROFILE_CACHE_TTL = 7 * 24 * 3600
+
+# Verdicts: the profile exists, it does not, or the platform would not say
+LIVE, DEAD, UNKNOWN = 'live', 'dead', 'unknown'
+
+# Paths a platform redirects to instead of showing a profile to anonymous clients
+LOGIN_PATHS = ('/login', '/accounts/login', '/authwall', '/checkpoint', '/i/flow/login', '/signin')
+
+
+class RateLimiter:
+    """
+    Spaces out requests to one platform at a fixed rate
+    """
+
+    def __init__(self, per_second: float):
+        """
+        Initialize limiter
+
+        Args:
+            per_second: Requests allowed per second
+        """
+        self.interval = 1.0 / per_second if per_second > 0 else 0.0
+        self._next = 0.0
+        self._paused_until = 0.0
+
+    async def wait(self):
+        """
+        Wait for the next free slot
+
+        A pause starting while the caller sleeps (another request got a
+        429) sends it back for a new slot after the pause.
+        """
+        while True:
+            now = time.monotonic()
+            slot = max(now, self._next, self._paused_until)
+            self._next = slot + self.interval
+            if slot > now:
+                await asyncio.sleep(slot - now)
+            if self._paused_until <= time.monotonic():
+                return
+
+    def pause(self, seconds: float):
+        """
+        Hold every request back for a while, including those already
+        waiting for a slot (e.g. after a 429)
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def classify(status: int, requested_url: str, final_url: str) -> str:
+    """
+    Verdict for one profile response
+
+    Args:
+        status: HTTP status after redirects
+        requested_url: Profile URL that was requested
+        final_url: URL the redirects ended at
+
+    Returns:
+        LIVE, DEAD or UNKNOWN
+    """
+    if status in (404, 410):
+        return DEAD
+    if status >= 400:
+        # 401/403/429/999 and server errors say nothing about the profile
+        return UNKNOWN
+    requested = urlparse(requested_url).path.rstrip('/')
+    final = urlparse(final_url).path.rstrip('/')
+    if final != requested:
+        if final.lower().startswith(LOGIN_PATHS):
+            return UNKNOWN
+        if not final:
+            # Missing profiles are commonly sent to the platform homepage
+            return DEAD
+    return LIVE
+
+
+class ProfileVerifier:
+    """
+    Checks social profile links once per scan, however many hosts link them
+
+    Links are deduplicated across hosts and checked in batches. Within a
+    batch each platform is held to its own request rate, and platforms are
+    interleaved so a slow one does not hold up the rest. Live and dead
+    verdicts are cached on disk until they expire; unknown ones are retried
+    on the next scan.
+    """
+
+    def __init__(self, cache_file: str = SOCIAL_CACHE_FILE, ttl: int = PROFILE_CACHE_TTL,
+                 batch_size: int = PROFILE_BATCH_SIZE):
+        """
+        Initialize verifier and load the cache
+
+        Args:
+            cache_file: JSON file holding cached verdicts
+            ttl: Seconds a cached verdict stays valid
+            batch_size: Profiles checked per batch
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.batch_size = max(1, batch_size)
+        self.cache: Dict[str, dict] = {}
+        self.limiters: Dict[str, RateLimiter] = {}
+        self.checked = 0
+        self.cached = 0
+        self.load()
+
+    def load(self):
+        """
+        Load cached verdicts, dropping expired ones (unreadable files start empty)
+        """
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                entries = json.load(f)
+        except Exception as e:
+            console.print(f"[!] [yellow]Ignoring unreadable profile cache {self.cache_file}: {str(e)}[/yellow]")
+            return
+        now = time.time()
+        self.cache = {
+            url: entry for url, entry in entries.items()
+            if isinstance(entry, dict) and now - entry.get('checked', 0) < self.ttl
+        }
+
+    def save(self):
+        """
+        Persist the cache atomically
+        """
+        try:
+            directory = os.path.dirname(self.cache_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_file = self.cache_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(self.cache, f)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            console.print(f"[!] [yellow]Could not save profile cache: {str(e)}[/yellow]")
+
+    def _limiter(self, platform: str) -> RateLimiter:
+        limiter = self.limiters.get(platform)
+        if limiter is None:
+            limiter = self.limiters[platform] = RateLimiter(PLATFORM_RATE_LIMITS.get(platform, DEFAULT_RATE_LIMIT))
+        return limiter
+
+    async def _check(self, session: aiohttp.ClientSession, url: str, platform: str) -> str:
+        """
+        Request one profile (within its platform's rate) and classify it
+        """
+        limiter = self._limiter(platform)
+        await limiter.wait()
+        try:
+            async with session.get(url, ssl=False, allow_redirects=True) as response:
+                if response.status == 429:
+                    limiter.pause(PROFILE_BACKOFF)
+                return classify(response.status, url, str(response.url))
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError, ValueError):
+            return UNKNOWN
+
+    @staticmethod
+    def _interleave(profiles: Dict[str, str]) -> List[str]:
+        """
+        Order URLs round-robin across platforms
+        """
+        by_platform: Dict[str, List[str]] = {}
+        for url, platform in profiles.items():
+            by_platform.setdefault(platform, []).append(url)
+        queues = [sorted(urls) for _, urls in sorted(by_platform.items())]
+        ordered = []
+        for position in range(max((len(queue) for queue in queues), default=0)):
+            ordered.extend(queue[position] for queue in queues if position < len(queue))
+        return ordered
+
+    async def verify(self, profiles: Dict[str, str]) -> Dict[str, str]:
+        """
+        Verify profile URLs, answering from the cache where possible
+
+        Args:
+            profiles: Dictionary mapping profile URL -> platform name
+
+        Returns:
+            Dictionary mapping profile URL -> LIVE, DEAD or UNKNOWN
+        """
+        verdicts = {}
+        pending = {}
+        for url, platform in profiles.items():
+            entry = self.cache.get(url)
+            if entry:
+                verdicts[url] = entry['status']
+                self.cached += 1
+            else:
+                pending[url] = platform
+
+        if not pending:
+            return verdicts
+
+        ordered = self._interleave(pending)
+        timeout = aiohttp.ClientTimeout(total=PROFILE_TIMEOUT)
+        connector = aiohttp.TCPConnector(limit=self.batch_size, ssl=False)
+        headers = {'User-Agent': USER_AGENT}
+
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector, headers=headers) as session:
+            for start in range(0, len(ordered), self.batch_size):
+                batch = ordered[start:start + self.batch_size]
+                results = await asyncio.gather(*(self._check(session, url, pending[url]) for url in batch))
+                now = time.time()
+                for url, status in zip(batch, results):
+                    verdicts[url] = status
+                    if status != UNKNOWN:
+                        self.cache[url] = {'status': status, 'checked': now}
+                self.checked += len(batch)
+                self.save()
+                console.print(f"[*] Verified [cyan]{self.checked}[/cyan]/{len(ordered)} profiles")
+
+        return verdicts
+
+    async def verify_hunt(self, hunt_data: Dict[str, Dict[str, set]]) -> Dict[str, str]:
+        """
+        Verify every distinct profile found by SocialHunter
+
+        Args:
+            hunt_data: Dictionary mapping site URLs to {platform: links}
+
+        Returns:
+            Dictionary mapping profile URL -> LIVE, DEAD or UNKNOWN
+        """
+        profiles = {}
+        for social_links in hunt_data.values():
+            for platform, links in social_links.items():
+                for link in links:
+                    profiles.setdefault(link, platform)
+
+        console.print(f"[*] Verifying [cyan]{len(profiles)}[/cyan] distinct social profiles...")
+        verdicts = await self.verify(profiles)
+
+        counts = {status: 0 for status in (LIVE, DEAD, UNKNOWN)}
+        for status in verdicts.values():
+            counts[status] = counts.get(status, 0) + 1
+        console.print(f"[✓] Verification complete: [green]{counts[LIVE]} live[/green], "
+                      f"[red]{counts[DEAD]} dead[/red], [yellow]{counts[UNKNOWN]} unknown[/yellow] "
+                      f"({self.cached} from cache)")
+        return verdicts
+
+    @staticmethod
+    def prune(hunt_data: Dict[str, Dict[str, set]], verdicts: Dict[str, str]) -> Dict[str, Dict[str, set]]:
+        """
+        Hunt results without the profiles verified as dead
+
+        Args:
+            hunt_data: Dictionary mapping site URLs to {platform: links}
+            verdicts: Output of verify()/verify_hunt()
+
+        Returns:
+            Dictionary of the same shape (emptied platforms and sites removed)
+        """
+        pruned = {}
+        for url, social_links in hunt_data.items():
+            kept = {}
+            for platform, links in social_links.items():
+                live = {link for link in links if verdicts.get(link) != DEAD}
+                if live:
+                    kept[platform] = live
+            if kept:
+                pruned[url] = kept
+        return pruned
@@ -0,0 +1,128 @@
+"""
+EYE - Host Resolver Module
+Resolves hostnames to IPv4 addresses once per run, with a cache shared across watcher cycles
+"""
+
+import asyncio
+import ipaddress
+import socket
+import time
+from typing import Dict, Iterable, Optional
+
+# Seconds a resolution is reused before it is looked up again
+RESOLVE_CACHE_TTL = 3600
+
+# Concurrent getaddrinfo lookups
+RESOLVE_CONCURRENCY = 50
+
+# Per-lookup timeout in seconds
+RESOLVE_TIMEOUT = 5
+
+
+def is_ipv4(value: str) -> bool:
+    """
+    Check whether a string is an IPv4 address literal
+    """
+    try:
+        return isinstance(ipaddress.ip_address(value), ipaddress.IPv4Address)
+    except ValueError:
+        return False
+
+
+class HostResolver:
+    """
+    Maps hostnames to IPv4 addresses using the event loop's getaddrinfo
+
+    Addresses already known (e.g. the peer address of a port scan
+    connection) can be recorded with remember() so they are never looked
+    up. Entries expire after `ttl` seconds.
+    """
+
+    def __init__(self, ttl: int = RESOLVE_CACHE_TTL, concurrency: int = RESOLVE_CONCURRENCY):
+        """
+        Initialize resolver
+
+        Args:
+            ttl: Cache lifetime in seconds
+            concurrency: Maximum concurrent lookups
+        """
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.cache: Dict[str, tuple] = {}
+        self.lookups = 0
+
+    def remember(self, host: str, ip: str):
+        """
+        Record a known host -> IP mapping
+
+        Args:
+            host: Hostname
+            ip: IPv4 address (other values are ignored)
+        """
+        if is_ipv4(ip):
+            self.cache[host] = (ip, time.monotonic() + self.ttl)
+
+    def cached(self, host: str) -> Optional[str]:
+        """
+        Return a cached, unexpired IP for a host
+        """
+        if is_ipv4(host):
+            return host
+        entry = self.cache.get(host)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+        return None
+
+    async def resolve(self, host: str) -> Optional[str]:
+        """
+        Resolve a single host, using the cache when possible
+
+        Args:
+            host: Hostname or IP
+
+        Returns:
+            IPv4 address or None
+        """
+        ip = self.cached(host)
+        if ip:
+            return ip
+
+        self.lookups += 1
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await asyncio.wait_for(
+                loop.getaddrinfo(host, None, family=socket.AF_INET, type=socket.SOCK_STREAM),
+                timeout=RESOLVE_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError):
+            return None
+        if not infos:
+            return None
+
+        ip = infos[0][4][0]
+        self.remember(host, ip)
+        return ip
+
+    async def resolve_many(self, hosts: Iterable[str]) -> Dict[str, str]:
+        """
+        Resolve many hosts with bounded concurrency
+
+        Args:
+            hosts: Hostnames or IPs
+
+        Returns:
+            Dictionary mapping host -> IPv4 address (unresolvable hosts omitted)
+        """
+        hosts = list(dict.fromkeys(hosts))
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def resolve_with_limit(host):
+            async with semaphore:
+                return await self.resolve(host)
+
+        ips = await asyncio.gather(*(resolve_with_limit(host) for host in hosts))
+        return {host: ip for host, ip in zip(hosts, ips) if ip}
+
+
+# Shared instance so watcher cycles reuse earlier resolutions
+host_resolver = HostResolver()
@@ -7,6 +7,7 @@ import asyncio
 from rich.console import Console
 from rich.table import Table
 from config import PORT_LIST, PORT_TIMEOUT, MAX_CONCURRENT
+from modules.ttl_capture import SynAckSniffer
 
 console = Console()
 
@@ -16,18 +17,23 @@ class PortScanner:
     Asynchronous port scanner using asyncio
     """
     
-    def __init__(self, ports=None, timeout=PORT_TIMEOUT):
+    def __init__(self, ports=None, timeout=PORT_TIMEOUT, capture_ttl=False):
         """
         Initialize port scanner
         
         Args:
             ports (list): List of ports to scan (default: from config)
             timeout (int): Connection timeout in seconds
+            capture_ttl (bool): Passively record TTL/window/options of the
+                SYN-ACKs our connects receive (needs raw socket privileges)
         """
         self.ports = ports or PORT_LIST
         self.timeout = timeout
+        self.capture_ttl = capture_ttl
         self.semaphore = asyncio.Semaphore(MAX_CONCURRENT)
         self.results = []
+        # (host, port) -> (peer ip, local port) for every open port
+        self.connections = {}
     
     async def scan_port(self, host, port):
         """
@@ -47,6 +53,10 @@ class PortScanner:
                     asyncio.open_connection(host, port),
                     timeout=self.timeout
                 )
+                peername = writer.get_extra_info('peername')
+                sockname = writer.get_extra_info('sockname')
+                if peername and sockname:
+                    self.connections[(host, port)] = (peername[0], sockname[1])
                 writer.close()
                 await writer.wait_closed()
                 return (host, port, True)
@@ -73,8 +83,10 @@ class PortScanner:
         open_ports = [port for (h, port, is_open) in results if is_open]
         
         if open_ports:
+            connection = self.connections.get((host, open_ports[0]))
             return {
                 'host': host,
+                'ip': connection[0] if connection else None,
                 'open_ports': open_ports,
                 'status': 'active'
             }
@@ -104,9 +116,27 @@ class PortScanner:
         # Convert set to list if needed
         host_list = list(hosts)
         
+        sniffer = None
+        if self.capture_ttl:
+            sniffer = SynAckSniffer()
+            if sniffer.start():
+                console.print("[*] Passive TTL capture enabled (SYN-ACKs of open ports)")
+            else:
+                console.print("[dim]Passive TTL capture unavailable (no raw socket access)[/dim]")
+                sniffer = None
+        
         # Scan all hosts
         tasks = [self.scan_host(host) for host in host_list]
-        results = await asyncio.gather(*tasks)
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            if sniffer:
+                # Pick up SYN-ACKs still queued when the last connect returned
+                sniffer.drain()
+                sniffer.stop()
+        
+        if sniffer:
+            self._attach_fingerprints(results, sniffer)
         
         self.results = results
         
@@ -115,6 +145,24 @@ class PortScanner:
         
         return results
     
+    def _attach_fingerprints(self, results, sniffer):
+        """
+        Add the captured SYN-ACK fingerprint to each active host
+        
+        Args:
+            results (list): Scan results from scan_host
+            sniffer (SynAckSniffer): Sniffer that ran during the scan
+        """
+        for result in results:
+            for port in result['open_ports']:
+                connection = self.connections.get((result['host'], port))
+                if not connection:
+                    continue
+                fingerprint = sniffer.lookup(connection[0], port, connection[1])
+                if fingerprint:
+                    result['fingerprint'] = dict(fingerprint, port=port)
+                    break
+    
     def _display_results(self, results):
         """
         Display scan results in a formatted table
@@ -3,13 +3,12 @@ EYE - Social Media Hunter Module
 Extracts social media profile links from web pages
 """
 
-import re
-import aiohttp
-import asyncio
-from typing import List, Dict, Set
-from bs4 import BeautifulSoup
+from typing import Iterable, List, Dict, Optional, Set, Tuple
 from urllib.parse import urlparse, urlunparse
 from rich.console import Console
+from modules.crawler import SiteCrawler
+from modules.document import Document, iter_hrefs
+from modules.offload import parse_executor
 
 console = Console()
 
@@ -41,13 +40,40 @@ class SocialHunter:
         'whatsapp.com': 'WhatsApp'
     }
     
+    # First path segments of share buttons, intents and embeds rather than profiles
+    NON_PROFILE_SEGMENTS = frozenset((
+        'share', 'sharer', 'sharer.php', 'sharearticle', 'sharing', 'intent', 'dialog',
+        'plugins', 'embed', 'hashtag', 'search', 'submit', 'send', 'pin', 'cws'
+    ))
+    
     def __init__(self):
-        self.timeout = aiohttp.ClientTimeout(total=10)
+        self.results: Dict[str, Dict[str, Set[str]]] = {}
+    
+    @classmethod
+    def platform_for_host(cls, host: str) -> Optional[str]:
+        """
+        Resolve a host to a platform by suffix lookup (www.facebook.com -> Facebook)
+        
+        Args:
+            host: Lowercase host name
+            
+        Returns:
+            Platform name, or None if the host is not a known platform
+        """
+        while host:
+            platform = cls.PLATFORMS.get(host)
+            if platform is not None:
+                return platform
+            host = host.partition('.')[2]
+        return None
     
     def extract_links(self, html_content: str) -> Dict[str, Set[str]]:
         """
         Extract social media links from HTML content
         
+        Hrefs are streamed from the markup (no DOM is built) and each link's
+        host is parsed once and looked up by suffix in PLATFORMS.
+        
         Args:
             html_content: HTML source code as string
             
@@ -56,35 +82,43 @@ class SocialHunter:
         """
         if not html_content:
             return {}
+        return self.links_from_hrefs(iter_hrefs(html_content))
+    
+    def links_from_hrefs(self, hrefs: Iterable[str]) -> Dict[str, Set[str]]:
+        """
+        Group the social media links among a page's href values
         
+        Args:
+            hrefs: href values (e.g. Document.hrefs)
+            
+        Returns:
+            Dictionary grouping links by platform
+        """
         social_links = {}
         
-        try:
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+        for href in hrefs:
+            href = href.lower()
             
-            # Find all anchor tags with href
-            for link in soup.find_all('a', href=True):
-                href = link.get('href', '').lower()
-                
-                # Skip empty or invalid links
-                if not href or href.startswith('#') or href.startswith('javascript:'):
-                    continue
-                
-                # Check if link contains any target platform
-                for domain, platform_name in self.PLATFORMS.items():
-                    if domain in href:
-                        # Clean the URL
-                        cleaned_url = self.clean_url(href)
-                        
-                        if cleaned_url:
-                            # Add to the appropriate platform list
-                            if platform_name not in social_links:
-                                social_links[platform_name] = set()
-                            social_links[platform_name].add(cleaned_url)
-        
-        except Exception:
-            pass
+            # Only absolute and protocol-relative links can point off-site
+            if href.startswith('//'):
+                href = 'https:' + href
+            elif not href.startswith('http'):
+                continue
+            
+            try:
+                parsed = urlparse(href)
+                host = parsed.hostname
+            except ValueError:
+                continue
+            
+            platform_name = self.platform_for_host(host or '')
+            if platform_name is None:
+                continue
+            
+            # Clean the URL
+            cleaned_url = self._clean_parsed(parsed)
+            if cleaned_url:
+                social_links.setdefault(platform_name, set()).add(cleaned_url)
         
         return social_links
     
@@ -106,108 +140,90 @@ class SocialHunter:
                 else:
                     return None
             
-            # Parse URL
-            parsed = urlparse(url)
-            
-            # Reconstruct without query parameters and fragments
-            cleaned = urlunparse((
-                parsed.scheme,
-                parsed.netloc,
-                parsed.path,
-                '', '', ''
-            ))
-            
-            # Remove trailing slashes
-            cleaned = cleaned.rstrip('/')
-            
-            # Filter out generic/homepage links
-            path = parsed.path.rstrip('/')
-            if not path or path in ['/', '/home', '/login', '/signin', '/signup']:
-                return None
-            
-            return cleaned
+            return self._clean_parsed(urlparse(url))
         
         except Exception:
             return None
     
-    async def hunt_single(self, url: str) -> Dict[str, Dict[str, Set[str]]]:
+    @staticmethod
+    def _clean_parsed(parsed) -> Optional[str]:
+        """
+        Rebuild a parsed URL without query and fragment, dropping generic pages
         """
-        Hunt for social media links on a single URL
+        # Reconstruct without query parameters and fragments
+        cleaned = urlunparse((
+            parsed.scheme,
+            parsed.netloc,
+            parsed.path,
+            '', '', ''
+        ))
         
-        Args:
-            url: Target URL to scan
-            
-        Returns:
-            Dictionary containing URL and found social links
+        # Remove trailing slashes
+        cleaned = cleaned.rstrip('/')
+        
+        # Filter out generic/homepage links
+        path = parsed.path.rstrip('/')
+        if not path or path in ['/', '/home', '/login', '/signin', '/signup']:
+            return None
+        
+        # Filter out share intents (e.g. /sharer/sharer.php, /intent/tweet)
+        if path.split('/', 2)[1].lower() in SocialHunter.NON_PROFILE_SEGMENTS:
+            return None
+        
+        return cleaned
+    
+    async def hunt_page(self, site_url: str, document: Document):
         """
-        result = {
-            'url': url,
-            'social_links': {}
-        }
+        Crawl consumer: collect social media links from one page of a site
         
-        try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(url, ssl=False, allow_redirects=True) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        result['social_links'] = self.extract_links(html)
-                        
-                        if result['social_links']:
-                            console.print(f"[+] [cyan]{url}[/cyan]")
-                            for platform, links in sorted(result['social_links'].items()):
-                                console.print(f"    🔗 {platform}: [green]{len(links)} profile(s)[/green]")
-                                for link in sorted(links)[:3]:  # Show first 3
-                                    console.print(f"       - {link}")
-                                if len(links) > 3:
-                                    console.print(f"       ... and {len(links) - 3} more")
-        
-        except asyncio.TimeoutError:
-            pass
-        except Exception:
-            pass
+        Reuses the document's hrefs when the crawler already extracted them;
+        otherwise large pages are parsed in the shared process pool.
         
-        return result
+        Args:
+            site_url: Site the page belongs to
+            document: The fetched page
+        """
+        if document.is_cached('hrefs') or len(document) < parse_executor.threshold:
+            social_links = self.links_from_hrefs(document.hrefs).items()
+        else:
+            social_links = await parse_executor.run(compact_social_links, document.text)
+        if not social_links:
+            return
+        entry = self.results.setdefault(site_url, {})
+        for platform, links in social_links:
+            entry.setdefault(platform, set()).update(links)
     
-    async def hunt_multiple(self, urls: List[str]) -> Dict[str, Dict[str, Set[str]]]:
+    def collect(self, urls: List[str] = None) -> Dict[str, Dict[str, Set[str]]]:
         """
-        Hunt for social media links across multiple URLs concurrently
+        Report and return what hunt_page() gathered
         
         Args:
-            urls: List of URLs to scan
+            urls: Sites to report in order (default: all sites with findings)
             
         Returns:
             Dictionary mapping URLs to their social media findings
         """
-        console.print(f"[*] Hunting social media profiles on [cyan]{len(urls)}[/cyan] URLs...")
-        
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(50)
-        
-        async def hunt_with_limit(url):
-            async with semaphore:
-                return await self.hunt_single(url)
-        
-        # Execute all hunting tasks concurrently
-        tasks = [hunt_with_limit(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Organize results by URL
         hunt_data = {}
         total_profiles = 0
         platforms_found = set()
         
-        for result in results:
-            if isinstance(result, dict) and not isinstance(result, Exception):
-                url = result['url']
-                social_links = result['social_links']
+        for url in (urls if urls is not None else list(self.results)):
+            social_links = self.results.get(url)
+            if not social_links:
+                continue
+            hunt_data[url] = social_links
+            
+            console.print(f"[+] [cyan]{url}[/cyan]")
+            for platform, links in sorted(social_links.items()):
+                console.print(f"    🔗 {platform}: [green]{len(links)} profile(s)[/green]")
+                for link in sorted(links)[:3]:  # Show first 3
+                    console.print(f"       - {link}")
+                if len(links) > 3:
+                    console.print(f"       ... and {len(links) - 3} more")
                 
-                if social_links:
-                    hunt_data[url] = social_links
-                    
-                    # Count totals
-                    for platform, links in social_links.items():
-                        total_profiles += len(links)
-                        platforms_found.add(platform)
+                # Count totals
+                total_profiles += len(links)
+                platforms_found.add(platform)
         
         # Print summary
         if hunt_data:
@@ -218,6 +234,23 @@ class SocialHunter:
         
         return hunt_data
     
+    async def hunt_multiple(self, urls: List[str], crawler: SiteCrawler = None) -> Dict[str, Dict[str, Set[str]]]:
+        """
+        Crawl multiple sites and hunt for social media links on their pages
+        
+        Args:
+            urls: List of site URLs to scan
+            crawler: Crawler to use (default: SiteCrawler with default budget)
+            
+        Returns:
+            Dictionary mapping URLs to their social media findings
+        """
+        console.print(f"[*] Hunting social media profiles on [cyan]{len(urls)}[/cyan] URLs...")
+        
+        self.results = {}
+        await (crawler or SiteCrawler()).crawl_multiple(urls, [self.hunt_page])
+        return self.collect(urls)
+    
     def get_platform_stats(self, hunt_data: Dict[str, Dict[str, Set[str]]]) -> Dict[str, int]:
         """
         Calculate statistics for social media platforms found
@@ -237,3 +270,18 @@ class SocialHunter:
                 stats[platform] += len(links)
         
         return stats
+
+
+def compact_social_links(html_content: str) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """
+    SocialHunter.extract_links() as tuples, cheap to send back from a worker process
+    
+    Args:
+        html_content: HTML source code as string
+        
+    Returns:
+        Tuple of (platform, links) pairs
+    """
+    return tuple(
+        (platform, tuple(links)) for platform, links in SocialHunter().extract_links(html_content).items()
+    )
@@ -0,0 +1,311 @@
+"""
+EYE - Passive Subdomain Sources Module
+Pluggable name sources (online and offline) for subdomain discovery
+"""
+
+import aiohttp
+import asyncio
+import codecs
+import json
+from typing import AsyncIterator, Dict, List
+from rich.console import Console
+from config import CRT_SH_URL, REQUEST_TIMEOUT
+from modules.nametrie import normalize_name
+
+console = Console()
+
+# Bytes read per iteration from streamed responses and files
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\r\n'
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator:
+    """
+    Incrementally parse a top-level JSON array, yielding one element at a time
+
+    Only the current partial element is buffered, so memory stays flat no
+    matter how large the array is.
+
+    Args:
+        chunks: Async iterator of raw UTF-8 bytes
+
+    Yields:
+        Decoded array elements in order
+
+    Raises:
+        ValueError: If the stream is not a well-formed JSON array
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    buffer = ''
+    started = False
+    finished = False
+
+    async for chunk in chunks:
+        buffer += text_decoder.decode(chunk)
+        pos = 0
+
+        while not finished:
+            # Skip separators between elements
+            while pos < len(buffer) and (buffer[pos] in _WHITESPACE or (started and buffer[pos] == ',')):
+                pos += 1
+            if pos >= len(buffer):
+                break
+
+            if not started:
+                if buffer[pos] != '[':
+                    raise ValueError("Response is not a JSON array")
+                started = True
+                pos += 1
+                continue
+
+            if buffer[pos] == ']':
+                finished = True
+                break
+
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Element continues in the next chunk
+                break
+            if end == len(buffer) and isinstance(element, (int, float)):
+                # A number at the buffer edge may still have digits to come
+                break
+            pos = end
+            yield element
+
+        buffer = buffer[pos:]
+        if finished:
+            return
+
+    buffer += text_decoder.decode(b'', final=True)
+    if not started or buffer.strip(_WHITESPACE):
+        raise ValueError("Truncated JSON array")
+
+
+async def iter_file_chunks(path: str, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Read a local file in chunks without blocking the event loop
+
+    Args:
+        path: File to read
+        chunk_size: Bytes per chunk
+
+    Yields:
+        Raw byte chunks
+    """
+    loop = asyncio.get_running_loop()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = await loop.run_in_executor(None, f.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+class SubdomainSource:
+    """
+    Base class for passive subdomain sources
+
+    Subclasses implement names() as an async generator of raw hostnames.
+    """
+
+    name = 'source'
+
+    def __init__(self, timeout: int = REQUEST_TIMEOUT):
+        """
+        Initialize source
+
+        Args:
+            timeout: Seconds the source may run before it is cut off
+        """
+        self.timeout = timeout
+        self.completed = False
+
+    async def names(self, domain: str) -> AsyncIterator[str]:
+        """
+        Yield hostnames discovered for the domain
+
+        Args:
+            domain: Target domain
+        """
+        raise NotImplementedError
+        yield  # pragma: no cover
+
+
+class CTSource(SubdomainSource):
+    """
+    Base class for Certificate Transparency sources yielding crt.sh-style entries
+
+    Entries at or below the attached CTIndex high-water mark are skipped
+    before their names are touched.
+    """
+
+    # Set when the backend can filter entries by ID server-side
+    supports_since_id = False
+
+    def __init__(self, timeout: int = REQUEST_TIMEOUT, index=None):
+        """
+        Initialize CT source
+
+        Args:
+            timeout: Seconds the source may run before it is cut off
+            index: Optional CTIndex shared by all CT sources
+        """
+        super().__init__(timeout)
+        self.index = index
+
+    async def entries(self, domain: str, since_id: int = 0) -> AsyncIterator[Dict]:
+        """
+        Yield raw CT entries for the domain
+
+        Args:
+            domain: Target domain
+            since_id: Only entries above this ID are needed (if supported)
+        """
+        raise NotImplementedError
+        yield  # pragma: no cover
+
+    async def names(self, domain: str) -> AsyncIterator[str]:
+        since_id = self.index.last_id if (self.index and self.supports_since_id) else 0
+
+        async for entry in self.entries(domain, since_id):
+            if not isinstance(entry, dict):
+                continue
+
+            entry_id = entry.get('id')
+            if self.index and not self.index.is_new_entry(entry_id):
+                continue
+
+            # Handle multi-line entries (certificate can have multiple names)
+            names = set()
+            for name in (entry.get('name_value') or '').split('\n'):
+                name = normalize_name(name)
+                if name:
+                    names.add(name)
+
+            if self.index:
+                self.index.record(entry_id, names)
+            for name in names:
+                yield name
+
+
+class CrtShSource(CTSource):
+    """
+    crt.sh Certificate Transparency search (streamed JSON)
+    """
+
+    name = 'crt.sh'
+
+    async def entries(self, domain: str, since_id: int = 0) -> AsyncIterator[Dict]:
+        url = CRT_SH_URL.format(domain=domain)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    console.print(f"[!] [yellow]crt.sh returned status code: {response.status}[/yellow]")
+                    console.print(f"[*] [cyan]Service may be temporarily unavailable[/cyan]")
+                    return
+
+                try:
+                    # Parse entries as they stream in instead of buffering the whole body
+                    async for entry in iter_json_array(response.content.iter_chunked(STREAM_CHUNK_SIZE)):
+                        yield entry
+                except ValueError:
+                    console.print("[!] [yellow]No valid JSON response from crt.sh[/yellow]")
+
+
+class CTDumpSource(CTSource):
+    """
+    Local Certificate Transparency dump (a saved crt.sh JSON response)
+    """
+
+    name = 'ct-dump'
+
+    def __init__(self, path: str, timeout: int = REQUEST_TIMEOUT, index=None):
+        super().__init__(timeout, index)
+        self.path = path
+
+    async def entries(self, domain: str, since_id: int = 0) -> AsyncIterator[Dict]:
+        async for entry in iter_json_array(iter_file_chunks(self.path)):
+            yield entry
+
+
+class ZoneFileSource(SubdomainSource):
+    """
+    Owner names from a DNS zone file (e.g. an AXFR dump)
+    """
+
+    name = 'zone-file'
+
+    def __init__(self, path: str, timeout: int = REQUEST_TIMEOUT):
+        super().__init__(timeout)
+        self.path = path
+
+    def _read_zone(self, domain: str) -> List[str]:
+        import dns.zone
+
+        zone = dns.zone.from_file(self.path, origin=domain, relativize=False, check_origin=False)
+        return [node_name.to_text() for node_name in zone.nodes.keys()]
+
+    async def names(self, domain: str) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        for name in await loop.run_in_executor(None, self._read_zone, domain):
+            yield name
+
+
+class ScanExportSource(SubdomainSource):
+    """
+    Subdomains from a previous EYE JSON export or watcher state file
+    """
+
+    name = 'previous-scan'
+
+    def __init__(self, path: str, timeout: int = REQUEST_TIMEOUT):
+        super().__init__(timeout)
+        self.path = path
+
+    def _read_export(self) -> List[str]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        # scan_results.json wraps results; watcher state files do not
+        results = data.get('results', data)
+        return list(results.get('subdomains', []))
+
+    async def names(self, domain: str) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        for name in await loop.run_in_executor(None, self._read_export):
+            yield name
+
+
+def build_sources(index=None, offline: bool = False, zone_files=None,
+                  scan_exports=None, ct_dumps=None) -> List[SubdomainSource]:
+    """
+    Build the list of enabled subdomain sources
+
+    Args:
+        index: Optional CTIndex shared by CT sources
+        offline: Skip network sources
+        zone_files: Paths to zone files
+        scan_exports: Paths to previous EYE exports or watcher state files
+        ct_dumps: Paths to saved crt.sh JSON responses
+
+    Returns:
+        List of source instances
+    """
+    sources = []
+
+    if not offline:
+        sources.append(CrtShSource(index=index))
+
+    for path in ct_dumps or []:
+        sources.append(CTDumpSource(path, index=index))
+    for path in zone_files or []:
+        sources.append(ZoneFileSource(path))
+    for path in scan_exports or []:
+        sources.append(ScanExportSource(path))
+
+    return sources
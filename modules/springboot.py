@@ -3,49 +3,51 @@ EYE - Spring Boot Actuator Hunter Module
 Discovers exposed Spring Boot actuator endpoints
 """
 
+import re
 import aiohttp
 import asyncio
 from typing import List, Dict, Set
 from rich.console import Console
+from modules.matcher import AhoCorasick
+from modules.packs import register_pack, get_pack
 
 console = Console()
 
 
+class ActuatorSignatures:
+    """
+    Compiled 'actuators' pack: endpoints to probe plus response classifiers
+    """
+    
+    def __init__(self, endpoints: List[str], critical: List[str], keywords: List[str]):
+        """
+        Compile actuator signatures
+        
+        Args:
+            endpoints: Endpoint paths to probe
+            critical: Substrings marking an endpoint as CRITICAL
+            keywords: Body keywords confirming an actuator response
+        """
+        self.endpoints = list(dict.fromkeys(endpoints))
+        self.critical_pattern = re.compile('|'.join(map(re.escape, critical))) if critical else None
+        self.keyword_matcher = AhoCorasick((keyword.lower(), keyword) for keyword in keywords)
+    
+    @classmethod
+    def from_pack(cls, data: dict) -> 'ActuatorSignatures':
+        """
+        Compile the 'actuators' pack (modules/signatures/actuators.json)
+        """
+        return cls(data.get('endpoints', []), data.get('critical', []), data.get('keywords', []))
+    
+    def is_critical(self, endpoint: str) -> bool:
+        return bool(self.critical_pattern and self.critical_pattern.search(endpoint))
+    
+    def has_actuator_data(self, content: str) -> bool:
+        return bool(self.keyword_matcher.search(content.lower()))
+
+
 # Critical Spring Boot actuator endpoints
-ACTUATOR_ENDPOINTS = [
-    '/actuator',
-    '/actuator/env',
-    '/actuator/health',
-    '/actuator/info',
-    '/actuator/metrics',
-    '/actuator/heapdump',
-    '/actuator/threaddump',
-    '/actuator/mappings',
-    '/actuator/configprops',
-    '/actuator/beans',
-    '/actuator/trace',
-    '/actuator/httptrace',
-    '/actuator/dump',
-    '/actuator/sessions',
-    '/actuator/shutdown',
-    '/actuator/loggers',
-    '/actuator/auditevents',
-    '/actuator/scheduledtasks',
-    '/actuator/conditions',
-    '/actuator/caches',
-    # Legacy Spring Boot 1.x endpoints
-    '/env',
-    '/health',
-    '/info',
-    '/metrics',
-    '/heapdump',
-    '/threaddump',
-    '/mappings',
-    '/configprops',
-    '/beans',
-    '/trace',
-    '/dump'
-]
+register_pack('actuators', 'actuators.json', ActuatorSignatures.from_pack)
 
 
 async def check_actuator(url: str) -> Dict:
@@ -71,7 +73,7 @@ async def check_actuator(url: str) -> Dict:
         async with aiohttp.ClientSession(timeout=timeout) as session:
             # Create tasks for all endpoints
             tasks = []
-            for endpoint in ACTUATOR_ENDPOINTS:
+            for endpoint in get_pack('actuators').endpoints:
                 test_url = url.rstrip('/') + endpoint
                 tasks.append(check_single_endpoint(session, test_url, endpoint))
             
@@ -129,18 +131,14 @@ async def check_single_endpoint(session: aiohttp.ClientSession, test_url: str, e
                 # Verify it's actually an actuator endpoint
                 is_json = 'application/json' in result['content_type']
                 is_octet = 'application/octet-stream' in result['content_type']
-                has_actuator_data = any(keyword in content.lower() for keyword in ['actuator', 'spring', 'boot'])
+                signatures = get_pack('actuators')
+                has_actuator_data = signatures.has_actuator_data(content)
                 
                 if is_json or is_octet or has_actuator_data:
                     result['exposed'] = True
                     
                     # Determine severity
-                    critical_endpoints = [
-                        'heapdump', 'threaddump', 'env', 'configprops', 
-                        'beans', 'shutdown', 'trace', 'httptrace', 'dump'
-                    ]
-                    
-                    if any(critical in endpoint for critical in critical_endpoints):
+                    if signatures.is_critical(endpoint):
                         result['severity'] = 'CRITICAL'
     
     except Exception:
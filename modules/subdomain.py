@@ -1,27 +1,118 @@
 """
 EYE - Subdomain Discovery Module
-Enumerates subdomains using Certificate Transparency logs
+Enumerates subdomains from passive sources such as Certificate Transparency logs
 """
 
 import aiohttp
 import asyncio
+import ipaddress
+from typing import AsyncIterator, List, Optional
 from rich.console import Console
-from config import CRT_SH_URL, REQUEST_TIMEOUT
+from modules.sources import SubdomainSource, CTSource, build_sources
+from modules.nametrie import NameTrie
 
 console = Console()
 
+# Names buffered between sources and the merger before sources are paused
+QUEUE_SIZE = 10000
+
 
 class SubdomainHunter:
     """
-    Discovers subdomains for a given domain using crt.sh API
+    Discovers subdomains for a given domain from one or more passive sources
     """
     
-    def __init__(self):
+    def __init__(self, index=None, sources: Optional[List[SubdomainSource]] = None):
+        """
+        Initialize subdomain hunter
+        
+        Args:
+            index (CTIndex): Optional local CT index for incremental sync
+            sources (list): Sources to query (default: crt.sh only)
+        """
         self.subdomains = set()
+        self.new_subdomains = set()
+        self.trie = None
+        self.index = index
+        self.sources = sources if sources is not None else build_sources(index=index)
+        self.source_counts = {}
+    
+    async def _drain_source(self, source: SubdomainSource, domain: str, queue: asyncio.Queue):
+        """
+        Push raw names from one source into the shared queue
+        """
+        async for name in source.names(domain):
+            self.source_counts[source.name] = self.source_counts.get(source.name, 0) + 1
+            await queue.put(name)
+    
+    async def _run_source(self, source: SubdomainSource, domain: str, queue: asyncio.Queue):
+        """
+        Run one source under its own timeout, reporting failures without raising
+        """
+        try:
+            await asyncio.wait_for(self._drain_source(source, domain, queue), timeout=source.timeout)
+            source.completed = True
+        except asyncio.TimeoutError:
+            console.print(f"[!] [red]{source.name} timed out after {source.timeout} seconds[/red]")
+        except aiohttp.ClientError as e:
+            console.print(f"[!] [red]{source.name} connection error: {str(e)}[/red]")
+        except Exception as e:
+            console.print(f"[!] [red]{source.name} failed: {str(e)}[/red]")
+        finally:
+            await queue.put(None)
+    
+    def _ensure_trie(self, domain: str) -> NameTrie:
+        """
+        Create the name trie, scoped to the target apex unless it is an IP
+        """
+        if self.trie is None:
+            try:
+                ipaddress.ip_address(domain)
+                apex = None
+            except ValueError:
+                apex = domain
+            self.trie = NameTrie(apex=apex)
+        return self.trie
+    
+    async def stream_subdomains(self, domain: str) -> AsyncIterator[str]:
+        """
+        Run all sources concurrently and yield each unique name once, as soon as any source finds it
+        
+        Names are normalized (IDNA, trailing dots, wildcards) and names
+        outside the target apex are dropped by the name trie.
+        
+        Args:
+            domain (str): Target domain to enumerate
+            
+        Yields:
+            str: Newly discovered subdomain
+        """
+        trie = self._ensure_trie(domain)
+        queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        tasks = [asyncio.create_task(self._run_source(source, domain, queue)) for source in self.sources]
+        remaining = len(tasks)
+        
+        try:
+            while remaining:
+                name = await queue.get()
+                if name is None:
+                    remaining -= 1
+                    continue
+                name = trie.add(name)
+                if name:
+                    self.subdomains.add(name)
+                    yield name
+        finally:
+            for task in tasks:
+                task.cancel()
     
     async def find_subdomains(self, domain):
         """
-        Query crt.sh for subdomains via Certificate Transparency logs
+        Query all enabled sources for subdomains
+        
+        When a CT index is attached, entries at or below its last seen ID
+        are skipped without touching their names, and only new names end
+        up in self.new_subdomains.
         
         Args:
             domain (str): Target domain to enumerate
@@ -29,52 +120,39 @@ class SubdomainHunter:
         Returns:
             set: Unique set of discovered subdomains
         """
-        self.domain = domain  # Store domain for fallback
-        url = CRT_SH_URL.format(domain=domain)
-        console.print(f"[*] Querying Certificate Transparency logs for [cyan]{domain}[/cyan]...")
+        self.domain = domain
+        source_names = ', '.join(source.name for source in self.sources) or 'none'
+        console.print(f"[*] Querying passive sources for [cyan]{domain}[/cyan] ({source_names})...")
         
-        try:
-            timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        try:
-                            data = await response.json()
-                            
-                            # Extract subdomains from the response
-                            for entry in data:
-                                name_value = entry.get('name_value', '')
-                                
-                                # Handle multi-line entries (certificate can have multiple names)
-                                names = name_value.split('\n')
-                                for name in names:
-                                    name = name.strip()
-                                    
-                                    # Skip wildcards and empty entries
-                                    if name and not name.startswith('*'):
-                                        self.subdomains.add(name.lower())
-                            
-                            console.print(f"[+] Found [green]{len(self.subdomains)}[/green] unique subdomains")
-                            return self.subdomains
-                            
-                        except aiohttp.ContentTypeError:
-                            console.print("[!] [yellow]No valid JSON response from crt.sh[/yellow]")
-                            return set()
-                    else:
-                        console.print(f"[!] [yellow]crt.sh returned status code: {response.status}[/yellow]")
-                        console.print(f"[*] [cyan]Service may be temporarily unavailable. Continuing with main domain...[/cyan]")
-                        # Return at least the main domain to continue scanning
-                        return {self.domain}
-                        
-        except asyncio.TimeoutError:
-            console.print(f"[!] [red]Request to crt.sh timed out after {REQUEST_TIMEOUT} seconds[/red]")
-            console.print(f"[*] [cyan]Continuing with main domain only...[/cyan]")
-            return {self.domain}
-        except aiohttp.ClientError as e:
-            console.print(f"[!] [red]Connection error: {str(e)}[/red]")
-            console.print(f"[*] [cyan]Continuing with main domain only...[/cyan]")
-            return {self.domain}
-        except Exception as e:
-            console.print(f"[!] [red]Unexpected error during subdomain discovery: {str(e)}[/red]")
-            console.print(f"[*] [cyan]Continuing with main domain only...[/cyan]")
-            return {self.domain}
+        trie = self._ensure_trie(domain)
+        if self.index:
+            for name in self.index.names:
+                name = trie.add(name)
+                if name:
+                    self.subdomains.add(name)
+            self.index.begin_sync()
+            if self.index.last_id:
+                console.print(f"[*] CT index: [cyan]{len(self.index.names)}[/cyan] known names, last entry ID [cyan]{self.index.last_id}[/cyan]")
+        
+        async for name in self.stream_subdomains(domain):
+            self.new_subdomains.add(name)
+        
+        for source in self.sources:
+            status = '[green]ok[/green]' if source.completed else '[red]incomplete[/red]'
+            console.print(f"    {source.name}: {self.source_counts.get(source.name, 0)} names ({status})")
+        
+        if self.index:
+            ct_sources = [source for source in self.sources if isinstance(source, CTSource)]
+            # Only advance the high-water mark if no CT source stopped part-way
+            if ct_sources and all(source.completed for source in ct_sources):
+                self.index.commit_sync()
+                console.print(f"[+] CT sync: [green]{self.index.entries_new}[/green] new of {self.index.entries_seen} certificates, [green]{len(self.index.new_names)}[/green] new names")
+        
+        if trie.rejected:
+            console.print(f"[*] [dim]Dropped {trie.rejected} malformed or out-of-scope names[/dim]")
+        console.print(f"[+] Found [green]{len(self.subdomains)}[/green] unique subdomains")
+        
+        dense = trie.dense_subtrees(limit=5)
+        if dense:
+            console.print(f"[*] Densest subtrees: " + ', '.join(f"[cyan]{suffix}[/cyan] ({count})" for suffix, count in dense))
+        return self.subdomains
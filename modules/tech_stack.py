@@ -4,23 +4,390 @@ CMS, Framework, and Server fingerprinting
 """
 
 import re
+import codecs
 import asyncio
 import aiohttp
 from rich.console import Console
+from modules.matcher import AhoCorasick
+from modules.favicon import FaviconHasher
+from modules.js_assets import ScriptFingerprinter
+from modules.packs import register_pack, get_pack
+from modules.document import Document
 
 console = Console()
 
+# Result fields holding lists; other categories (cdn, waf) hold one value
+LIST_CATEGORIES = ('cms', 'frameworks', 'languages', 'js_libraries')
 
-async def identify_tech(url: str) -> dict:
+# Structural captures shared by every signature set (each follows a '<')
+META_PATTERN = r'meta[^>]+name=["\']([^"\']+)["\'][^>]+content=["\']([^"\']+)'
+SCRIPT_SRC_PATTERN = r'script[^>]+src=["\']([^"\']+)'
+ICON_LINK_PATTERN = r'link(?=[^>]*rel=["\'][^"\']*icon)[^>]+href=["\']([^"\']+)'
+
+# Detection modes: headers/cookies only, headers then body until decided, whole body
+TECH_MODES = ('headers', 'tiered', 'full')
+
+# Body bytes read per chunk and at most per response
+TECH_CHUNK_SIZE = 16 * 1024
+TECH_BODY_LIMIT = 512 * 1024
+
+# Characters re-scanned by the regex pass so tags split across chunks are seen
+REGEX_OVERLAP = 4096
+
+# Fetch referenced scripts for library versions (see js_assets)
+FETCH_SCRIPT_ASSETS = True
+
+# Concurrent fingerprinting workers, per-request timeout (seconds), progress interval
+TECH_CONCURRENCY = 50
+TECH_TIMEOUT = 10
+TECH_PROGRESS_EVERY = 100
+
+
+class TechSignatures:
+    """
+    Technology signatures compiled for single-pass matching
+    
+    All body patterns go into one Aho-Corasick automaton and all tag
+    captures (meta tags, script srcs, icons) into one pattern anchored on
+    '<', and the version regexes into one more, so each body is scanned
+    three times at most regardless of how many signatures exist.
+    """
+    
+    def __init__(self, technologies: list):
+        """
+        Compile signatures
+        
+        Args:
+            technologies: Signature entries (see modules/signatures/tech.json)
+        """
+        self.technologies = technologies
+        self.body_matcher = AhoCorasick(
+            (pattern.lower(), index)
+            for index, tech in enumerate(technologies)
+            for pattern in tech.get('body', [])
+        )
+        self.script_matcher = AhoCorasick(
+            (pattern.lower(), index)
+            for index, tech in enumerate(technologies)
+            for pattern in tech.get('scripts', [])
+        )
+        self.header_rules = [
+            (header, needle.lower(), index)
+            for index, tech in enumerate(technologies)
+            for header, needle in tech.get('headers', {}).items()
+        ]
+        self.cookie_rules = [
+            (cookie.lower(), index)
+            for index, tech in enumerate(technologies)
+            for cookie in tech.get('cookies', [])
+        ]
+        self.meta_rules = [
+            (name.lower(), needle.lower(), index)
+            for index, tech in enumerate(technologies)
+            for name, needle in tech.get('meta', {}).items()
+        ]
+        self.header_versions = {
+            index: [(header, re.compile(pattern, re.IGNORECASE)) for header, pattern in tech['header_version'].items()]
+            for index, tech in enumerate(technologies) if tech.get('header_version')
+        }
+        self.meta_versions = {
+            index: re.compile(tech['meta_version'])
+            for index, tech in enumerate(technologies) if tech.get('meta_version')
+        }
+        # Signatures that can only be decided by reading the body
+        self.body_indices = {
+            index for index, tech in enumerate(technologies)
+            if tech.get('body') or tech.get('scripts') or tech.get('meta')
+        }
+        self.body_versions = {index for index, tech in enumerate(technologies) if tech.get('version')}
+        
+        # One pattern for every tag capture, anchored on '<' so the regex
+        # engine skips straight from tag to tag
+        self.tag_pattern = re.compile(
+            f'<(?:(?P<meta>{META_PATTERN})|(?P<script>{SCRIPT_SRC_PATTERN})|(?P<icon>{ICON_LINK_PATTERN}))',
+            re.IGNORECASE
+        )
+        # Version patterns in one alternation of their own (they may sit inside a tag)
+        versions = [
+            f"(?P<v{index}>{tech['version']})"
+            for index, tech in enumerate(technologies) if tech.get('version')
+        ]
+        self.version_pattern = re.compile('|'.join(versions), re.IGNORECASE) if versions else None
+    
+    @classmethod
+    def from_pack(cls, data: dict) -> 'TechSignatures':
+        """
+        Compile the 'tech' signature pack (modules/signatures/tech.json)
+        
+        Args:
+            data: Merged pack data
+            
+        Returns:
+            Compiled TechSignatures
+        """
+        return cls(data.get('technologies', []))
+    
+    def match_headers(self, headers, cookie_names) -> set:
+        """
+        Match header and cookie signatures (no body needed)
+        
+        Args:
+            headers: Response headers (case-insensitive mapping)
+            cookie_names: Names of cookies set by the response
+            
+        Returns:
+            Set of matched signature indices
+        """
+        matched = set()
+        for header, needle, index in self.header_rules:
+            value = headers.get(header)
+            if value is not None and needle in value.lower():
+                matched.add(index)
+        
+        lowered_cookies = [name.lower() for name in cookie_names]
+        for prefix, index in self.cookie_rules:
+            if any(name.startswith(prefix) for name in lowered_cookies):
+                matched.add(index)
+        return matched
+    
+    def body_scan(self, matched: set, url: str = '') -> 'BodyScan':
+        """
+        Start an incremental body scan for what headers left undecided
+        
+        Args:
+            matched: Indices already matched from headers/cookies
+            url: URL of the response (kept on the scan's document)
+            
+        Returns:
+            BodyScan whose `pending` set lists the signatures still open
+        """
+        pending = (self.body_indices - matched) | (matched & self.body_versions)
+        return BodyScan(self, pending, url)
+    
+    def match(self, headers, cookie_names, body: str) -> tuple:
+        """
+        Match every signature against one complete response
+        
+        Args:
+            headers: Response headers (case-insensitive mapping)
+            cookie_names: Names of cookies set by the response
+            body: Response body
+            
+        Returns:
+            Tuple of (matched signature indices in file order, versions, meta dict)
+        """
+        matched = self.match_headers(headers, cookie_names)
+        scan = self.body_scan(matched)
+        scan.feed(body, whole=True)
+        return self.resolve(headers, matched, scan)
+    
+    def resolve(self, headers, matched: set, scan: 'BodyScan') -> tuple:
+        """
+        Combine header matches with a (possibly partial) body scan
+        
+        Returns:
+            Tuple of (matched signature indices in file order, versions, meta dict)
+        """
+        matched = matched | scan.matched
+        versions = dict(scan.versions)
+        metas = scan.metas
+        
+        for index in matched:
+            if index in versions:
+                continue
+            for header, pattern in self.header_versions.get(index, []):
+                found = pattern.search(headers.get(header, ''))
+                if found:
+                    versions[index] = found.group(1)
+                    break
+            else:
+                meta_pattern = self.meta_versions.get(index)
+                generator = metas.get('generator')
+                if meta_pattern and generator:
+                    found = meta_pattern.search(generator)
+                    if found:
+                        versions[index] = found.group(1)
+        
+        return sorted(matched), versions, metas
+    
+    def apply(self, result: dict, headers, matched: list, versions: dict, metas: dict):
+        """
+        Fill a tech result dict with matched technologies
+        
+        Args:
+            result: Result dict from identify_tech
+            headers: Response headers
+            matched: Matched signature indices from match()/resolve()
+            versions: Signature index -> version string
+            metas: Meta tag name -> content
+        """
+        for index in matched:
+            tech = self.technologies[index]
+            category = tech['category']
+            version = (versions.get(index) or '').rstrip('.')
+            name = f"{tech['name']} {version}" if version else tech['name']
+            
+            if category in LIST_CATEGORIES:
+                entries = result.setdefault(category, [])
+                if name not in entries:
+                    entries.append(name)
+            elif not result.get(category):
+                report_header = tech.get('report_header')
+                result[category] = headers.get(report_header, name) if report_header else name
+        
+        if 'generator' in metas:
+            result['generator'] = metas['generator']
+
+
+class BodyScan:
+    """
+    Incremental body matcher fed one decoded chunk at a time
+    
+    Carries the matcher state across chunks and re-runs the regexes
+    only over new text (plus a small overlap). The body accumulates
+    in a Document, whose lowercased view is extended chunk by chunk rather
+    than recomputed. `pending` shrinks as signatures match; once it is
+    empty the rest of the body is irrelevant.
+    """
+    
+    def __init__(self, signatures: TechSignatures, pending: set, url: str = ''):
+        self.signatures = signatures
+        self.pending = set(pending)
+        self.matched = set()
+        self.versions = {}
+        self.metas = {}
+        self.scripts = {}
+        self.icons = []
+        self.document = Document(url=url)
+        self._state = ''
+    
+    @property
+    def text(self) -> str:
+        return self.document.text
+    
+    def feed(self, chunk: str, whole: bool = False) -> bool:
+        """
+        Scan the next chunk of the body
+        
+        Args:
+            chunk: Decoded text
+            whole: Chunk is the entire body (nothing to carry over to a next chunk)
+            
+        Returns:
+            True once every pending signature is decided
+        """
+        signatures = self.signatures
+        start = max(0, len(self.text) - REGEX_OVERLAP)
+        lowered = self.document.append(chunk)
+        if whole:
+            found = signatures.body_matcher.search(lowered)
+        else:
+            found, self._state = signatures.body_matcher.feed(lowered, self._state)
+        self.matched |= found
+        
+        new_scripts = []
+        groups = signatures.tag_pattern.groupindex
+        for match in signatures.tag_pattern.finditer(self.text, start):
+            group = match.lastgroup
+            if group == 'meta':
+                self.metas.setdefault(match.group(groups['meta'] + 1).lower(), match.group(groups['meta'] + 2))
+            elif group == 'script':
+                src = match.group(groups['script'] + 1)
+                if src not in self.scripts:
+                    self.scripts[src] = True
+                    new_scripts.append(src)
+            elif group == 'icon':
+                href = match.group(groups['icon'] + 1)
+                if href not in self.icons:
+                    self.icons.append(href)
+        
+        if signatures.version_pattern is not None and len(self.versions) < len(signatures.body_versions):
+            groups = signatures.version_pattern.groupindex
+            for match in signatures.version_pattern.finditer(self.text, start):
+                group = match.lastgroup
+                # Version patterns carry exactly one capturing group
+                self.versions.setdefault(int(group[1:]), match.group(groups[group] + 1))
+        
+        if new_scripts:
+            self.matched |= signatures.script_matcher.search('\n'.join(new_scripts).lower())
+        
+        for name, needle, index in signatures.meta_rules:
+            if needle in self.metas.get(name, '').lower():
+                self.matched.add(index)
+        
+        self.pending = {
+            index for index in self.pending
+            if index not in self.matched or (index in signatures.body_versions and index not in self.versions)
+        }
+        return not self.pending
+
+
+# Signature database (headers, cookies, body, meta tags, script srcs)
+register_pack('tech', 'tech.json', TechSignatures.from_pack)
+
+
+async def _read_body(response, scan: BodyScan, stop_when_decided: bool) -> int:
+    """
+    Stream a response body into a BodyScan
+    
+    Args:
+        response: aiohttp response
+        scan: Body scan to feed
+        stop_when_decided: Stop as soon as no signature is pending
+        
+    Returns:
+        Number of body bytes read
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+    except LookupError:
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    read = 0
+    async for chunk in response.content.iter_chunked(TECH_CHUNK_SIZE):
+        read += len(chunk)
+        decided = scan.feed(decoder.decode(chunk))
+        if (decided and stop_when_decided) or read >= TECH_BODY_LIMIT:
+            break
+    return read
+
+
+def _merge_version(result: dict, category: str, name: str, version: str):
+    """
+    Add "name version" to a list category, upgrading an unversioned entry
+    """
+    entries = result.setdefault(category, [])
+    labelled = f"{name} {version}"
+    for i, entry in enumerate(entries):
+        if entry == name:
+            entries[i] = labelled
+            return
+        if entry.startswith(name + ' '):
+            return
+    entries.append(labelled)
+
+
+async def identify_tech(url: str, mode: str = 'tiered', favicons: FaviconHasher = None,
+                        session: aiohttp.ClientSession = None, assets: ScriptFingerprinter = None) -> dict:
     """
     Identify technology stack for a given URL
     
     Args:
         url: Target URL (with protocol)
+        mode: 'headers' (headers/cookies only), 'tiered' (headers first,
+            then the body only while signatures are undecided) or 'full'
+        favicons: Shared favicon hasher (bounds favicon downloads across hosts)
+        session: Shared client session (a private one is opened if omitted)
+        assets: Script fingerprinter; when given, referenced scripts are
+            fetched (byte-capped) and checked for library versions
         
     Returns:
         Dictionary with technology detection results
     """
+    if session is None:
+        timeout = aiohttp.ClientTimeout(total=TECH_TIMEOUT)
+        async with aiohttp.ClientSession(timeout=timeout) as own_session:
+            return await identify_tech(url, mode, favicons, own_session, assets)
+    
     result = {
         'url': url,
         'server': None,
@@ -34,139 +401,66 @@ async def identify_tech(url: str) -> dict:
     }
     
     try:
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url, ssl=False, allow_redirects=True) as response:
-                # Get headers
-                headers = response.headers
-                body = await response.text()
-                
-                # Server detection
-                if 'Server' in headers:
-                    server = headers['Server']
-                    result['server'] = server
-                    result['headers']['Server'] = server
-                    
-                    # Detect WAF from server header
-                    if any(waf in server.lower() for waf in ['cloudflare', 'akamai', 'incapsula', 'sucuri']):
-                        result['waf'] = server
-                
-                # Powered-By detection
-                if 'X-Powered-By' in headers:
-                    powered_by = headers['X-Powered-By']
-                    result['powered_by'] = powered_by
-                    result['headers']['X-Powered-By'] = powered_by
-                    
-                    # Language detection from X-Powered-By
-                    if 'PHP' in powered_by:
-                        result['languages'].append(f"PHP {re.search(r'PHP/([0-9.]+)', powered_by).group(1) if re.search(r'PHP/([0-9.]+)', powered_by) else ''}")
-                    elif 'ASP.NET' in powered_by:
-                        result['languages'].append('ASP.NET')
-                
-                # CDN detection
-                if 'CF-RAY' in headers or 'cf-cache-status' in headers:
-                    result['cdn'] = 'Cloudflare'
-                elif 'X-Amz-Cf-Id' in headers:
-                    result['cdn'] = 'AWS CloudFront'
-                elif 'X-Cache' in headers and 'akamai' in headers['X-Cache'].lower():
-                    result['cdn'] = 'Akamai'
-                
-                # Additional security headers
-                security_headers = ['X-Frame-Options', 'X-Content-Type-Options', 'Content-Security-Policy', 
-                                   'Strict-Transport-Security', 'X-XSS-Protection']
-                for header in security_headers:
-                    if header in headers:
-                        result['headers'][header] = headers[header]
-                
-                # Body-based detection
-                body_lower = body.lower()
-                
-                # CMS Detection
-                if 'wp-content' in body_lower or 'wp-includes' in body_lower:
-                    result['cms'].append('WordPress')
-                    # Try to get WordPress version
-                    wp_version = re.search(r'wordpress["\s]+([0-9.]+)', body_lower)
-                    if wp_version:
-                        result['cms'][-1] = f"WordPress {wp_version.group(1)}"
-                
-                if 'joomla' in body_lower:
-                    result['cms'].append('Joomla')
-                
-                if 'drupal' in body_lower or '/sites/default/' in body_lower:
-                    result['cms'].append('Drupal')
-                
-                if 'magento' in body_lower or 'mage/cookies' in body_lower:
-                    result['cms'].append('Magento')
-                
-                if 'shopify' in body_lower or 'cdn.shopify.com' in body_lower:
-                    result['cms'].append('Shopify')
-                
-                if 'wix.com' in body_lower or 'wixstatic.com' in body_lower:
-                    result['cms'].append('Wix')
-                
-                # Framework Detection
-                if 'laravel_session' in body_lower or 'laravel' in body_lower:
-                    result['frameworks'].append('Laravel')
-                
-                if 'django' in body_lower or 'csrfmiddlewaretoken' in body_lower:
-                    result['frameworks'].append('Django')
-                
-                if 'react' in body_lower or 'react-root' in body_lower or '__react' in body_lower:
-                    result['frameworks'].append('React')
-                
-                if 'vue' in body_lower or 'vue.js' in body_lower or '__vue' in body_lower:
-                    result['frameworks'].append('Vue.js')
-                
-                if 'angular' in body_lower or 'ng-version' in body_lower:
-                    result['frameworks'].append('Angular')
-                
-                if 'next.js' in body_lower or '_next/' in body_lower:
-                    result['frameworks'].append('Next.js')
-                
-                if 'nuxt' in body_lower or '__nuxt' in body_lower:
-                    result['frameworks'].append('Nuxt.js')
-                
-                if 'express' in body_lower or 'x-powered-by: express' in body_lower:
-                    result['frameworks'].append('Express.js')
-                
-                if 'strapi' in body_lower:
-                    result['frameworks'].append('Strapi')
-                
-                # Additional language detection from body
-                if '<jsp:' in body or '<%@' in body:
-                    result['languages'].append('JSP/Java')
-                
-                if '<?php' in body or '<?=' in body:
-                    if not any('PHP' in lang for lang in result['languages']):
-                        result['languages'].append('PHP')
-                
-                # JavaScript libraries
-                js_libs = []
-                if 'jquery' in body_lower:
-                    jquery_version = re.search(r'jquery[/-]([0-9.]+)', body_lower)
-                    js_libs.append(f"jQuery {jquery_version.group(1) if jquery_version else ''}")
-                
-                if 'bootstrap' in body_lower:
-                    js_libs.append('Bootstrap')
-                
-                if 'tailwind' in body_lower:
-                    js_libs.append('Tailwind CSS')
-                
-                if js_libs:
-                    result['js_libraries'] = js_libs
-                
-                # Check for common meta tags
-                generator = re.search(r'<meta[^>]+name=["\']generator["\'][^>]+content=["\']([^"\']+)', body, re.IGNORECASE)
-                if generator:
-                    result['generator'] = generator.group(1)
-                    
-                    # Parse generator for CMS/Framework info
-                    gen_lower = generator.group(1).lower()
-                    if 'wordpress' in gen_lower and 'WordPress' not in ' '.join(result['cms']):
-                        result['cms'].append(f"WordPress {re.search(r'([0-9.]+)', generator.group(1)).group(1) if re.search(r'([0-9.]+)', generator.group(1)) else ''}")
-                
-                return result
-                
+        async with session.get(url, ssl=False, allow_redirects=True) as response:
+            # Get headers
+            headers = response.headers
+            
+            if 'Server' in headers:
+                result['server'] = headers['Server']
+                result['headers']['Server'] = headers['Server']
+            
+            if 'X-Powered-By' in headers:
+                result['powered_by'] = headers['X-Powered-By']
+                result['headers']['X-Powered-By'] = headers['X-Powered-By']
+            
+            # Additional security headers
+            security_headers = ['X-Frame-Options', 'X-Content-Type-Options', 'Content-Security-Policy', 
+                               'Strict-Transport-Security', 'X-XSS-Protection']
+            for header in security_headers:
+                if header in headers:
+                    result['headers'][header] = headers[header]
+            
+            # Tier 1: headers and cookies
+            signatures = get_pack('tech')
+            matched = signatures.match_headers(headers, list(response.cookies.keys()))
+            scan = signatures.body_scan(matched, str(response.url))
+            
+            # Tier 2: body, streamed only while something is undecided
+            if mode != 'headers' and scan.pending:
+                await _read_body(response, scan, stop_when_decided=(mode == 'tiered'))
+            
+            signatures.apply(result, headers, *signatures.resolve(headers, matched, scan))
+            final_url = str(response.url)
+        
+        # Library versions from external bundles
+        if assets and scan.scripts:
+            js_assets = await assets.fingerprint(session, final_url, list(scan.scripts))
+            for detections in js_assets.values():
+                for name, category, version in detections:
+                    if category in LIST_CATEGORIES:
+                        _merge_version(result, category, name, version)
+            if js_assets:
+                result['js_assets'] = {
+                    script: [f"{name} {version}" for name, _, version in detections]
+                    for script, detections in js_assets.items()
+                }
+        
+        # Favicon hash (<link rel="icon"> target, else /favicon.ico)
+        favicons = favicons or FaviconHasher()
+        favicon = await favicons.fingerprint(session, final_url, scan.icons[0] if scan.icons else None)
+        if favicon:
+            result['favicon'] = favicon
+            category = favicon.get('category')
+            if favicon['product'] and category in LIST_CATEGORIES:
+                entries = result.setdefault(category, [])
+                if not any(entry.startswith(favicon['product']) for entry in entries):
+                    entries.append(favicon['product'])
+        
+        if not result.get('js_libraries'):
+            result.pop('js_libraries', None)
+        
+        return result
+            
     except asyncio.TimeoutError:
         result['error'] = 'Timeout'
         return result
@@ -175,12 +469,92 @@ async def identify_tech(url: str) -> dict:
         return result
 
 
-async def identify_tech_multiple(urls: list) -> dict:
+async def iter_tech(urls: list, mode: str = 'tiered', concurrency: int = TECH_CONCURRENCY,
+                    fetch_scripts: bool = FETCH_SCRIPT_ASSETS):
+    """
+    Fingerprint URLs with a fixed pool of workers, yielding results as they finish
+    
+    All workers share one ClientSession whose connector is capped at
+    `concurrency`, so sockets and file descriptors stay bounded no matter
+    how many URLs there are.
+    
+    Args:
+        urls: List of URLs
+        mode: Detection mode (see identify_tech)
+        concurrency: Number of workers
+        fetch_scripts: Fingerprint referenced script bundles
+        
+    Yields:
+        Tuple of (url, result dict or exception)
+    """
+    urls = list(urls)
+    if not urls:
+        return
+    
+    queue = asyncio.Queue()
+    iterator = iter(urls)
+    favicons = FaviconHasher()
+    assets = ScriptFingerprinter() if fetch_scripts else None
+    timeout = aiohttp.ClientTimeout(total=TECH_TIMEOUT)
+    connector = aiohttp.TCPConnector(limit=concurrency, ssl=False)
+    
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        async def worker():
+            for url in iterator:
+                try:
+                    result = await identify_tech(url, mode, favicons, session, assets)
+                except Exception as e:
+                    result = e
+                await queue.put((url, result))
+        
+        workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(urls)))]
+        try:
+            for _ in range(len(urls)):
+                yield await queue.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _display_tech(url: str, result: dict):
+    """
+    Print the fingerprint of one URL
+    """
+    tech_parts = []
+    if result.get('server'):
+        tech_parts.append(f"Server: [cyan]{result['server']}[/cyan]")
+    if result.get('cms'):
+        tech_parts.append(f"CMS: [yellow]{', '.join(result['cms'])}[/yellow]")
+    if result.get('frameworks'):
+        tech_parts.append(f"Framework: [magenta]{', '.join(result['frameworks'])}[/magenta]")
+    if result.get('languages'):
+        tech_parts.append(f"Language: [green]{', '.join(result['languages'])}[/green]")
+    if result.get('cdn'):
+        tech_parts.append(f"CDN: [blue]{result['cdn']}[/blue]")
+    if result.get('waf'):
+        tech_parts.append(f"WAF: [red]{result['waf']}[/red]")
+    if result.get('favicon', {}).get('product'):
+        tech_parts.append(f"Favicon: [cyan]{result['favicon']['product']}[/cyan] ({result['favicon']['hash']})")
+    
+    if tech_parts:
+        console.print(f"  [{url}]")
+        for part in tech_parts:
+            console.print(f"    {part}")
+    else:
+        console.print(f"  [{url}] [dim]No specific fingerprints detected[/dim]")
+
+
+async def identify_tech_multiple(urls: list, mode: str = 'tiered', concurrency: int = TECH_CONCURRENCY,
+                                 fetch_scripts: bool = FETCH_SCRIPT_ASSETS) -> dict:
     """
     Identify technology stack for multiple URLs
     
     Args:
         urls: List of URLs
+        mode: Detection mode (see identify_tech)
+        concurrency: Number of concurrent fingerprinting workers
+        fetch_scripts: Fingerprint referenced script bundles
         
     Returns:
         Dictionary mapping URL -> tech results
@@ -190,40 +564,22 @@ async def identify_tech_multiple(urls: list) -> dict:
     
     console.print(f"[*] Running technology fingerprinting on [cyan]{len(urls)}[/cyan] services...")
     
-    tasks = [identify_tech(url) for url in urls]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    
     tech_map = {}
-    for url, result in zip(urls, results):
+    completed = 0
+    async for url, result in iter_tech(urls, mode, concurrency, fetch_scripts):
+        completed += 1
         if isinstance(result, Exception):
             console.print(f"  [{url}] [red]Error: {str(result)}[/red]")
             tech_map[url] = {'error': str(result)}
         else:
             tech_map[url] = result
-            
-            # Display results
-            tech_parts = []
-            if result.get('server'):
-                tech_parts.append(f"Server: [cyan]{result['server']}[/cyan]")
-            if result.get('cms'):
-                tech_parts.append(f"CMS: [yellow]{', '.join(result['cms'])}[/yellow]")
-            if result.get('frameworks'):
-                tech_parts.append(f"Framework: [magenta]{', '.join(result['frameworks'])}[/magenta]")
-            if result.get('languages'):
-                tech_parts.append(f"Language: [green]{', '.join(result['languages'])}[/green]")
-            if result.get('cdn'):
-                tech_parts.append(f"CDN: [blue]{result['cdn']}[/blue]")
-            if result.get('waf'):
-                tech_parts.append(f"WAF: [red]{result['waf']}[/red]")
-            
-            if tech_parts:
-                console.print(f"  [{url}]")
-                for part in tech_parts:
-                    console.print(f"    {part}")
-            else:
-                console.print(f"  [{url}] [dim]No specific fingerprints detected[/dim]")
+            _display_tech(url, result)
+        
+        if completed % TECH_PROGRESS_EVERY == 0 and completed < len(urls):
+            console.print(f"  [dim]... {completed}/{len(urls)} services fingerprinted[/dim]")
     
-    return tech_map
+    # Same key order as the input
+    return {url: tech_map[url] for url in urls if url in tech_map}
 
 
 def get_tech_summary(tech_data: dict) -> str:
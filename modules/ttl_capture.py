@@ -0,0 +1,184 @@
+"""
+EYE - Passive TTL Capture Module
+Records TTL, window and TCP options of SYN-ACKs answering our own connects
+"""
+
+import asyncio
+import socket
+import struct
+from typing import Dict, Optional, Tuple
+
+# TCP flag bits
+TCP_SYN = 0x02
+TCP_ACK = 0x10
+
+# Short option codes used in fingerprints (p0f style)
+TCP_OPTION_CODES = {
+    0: 'E',   # End of options
+    1: 'N',   # NOP
+    2: 'M',   # Maximum segment size
+    3: 'W',   # Window scale
+    4: 'S',   # SACK permitted
+    8: 'T'    # Timestamps
+}
+
+RECV_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def parse_tcp_options(options: bytes) -> Tuple[str, Optional[int], Optional[int]]:
+    """
+    Parse raw TCP options
+
+    Args:
+        options: Option bytes following the fixed TCP header
+
+    Returns:
+        Tuple of (option order string such as "MNWNNTS", mss, window scale)
+    """
+    order = []
+    mss = None
+    wscale = None
+    i = 0
+    while i < len(options):
+        kind = options[i]
+        if kind == 0:
+            order.append('E')
+            break
+        if kind == 1:
+            order.append('N')
+            i += 1
+            continue
+        if i + 1 >= len(options):
+            break
+        length = options[i + 1]
+        if length < 2:
+            break
+        value = options[i + 2:i + length]
+        if kind == 2 and len(value) == 2:
+            mss = struct.unpack('!H', value)[0]
+        elif kind == 3 and len(value) == 1:
+            wscale = value[0]
+        order.append(TCP_OPTION_CODES.get(kind, '?'))
+        i += length
+    return ''.join(order), mss, wscale
+
+
+def parse_syn_ack(packet: bytes) -> Optional[Tuple[Tuple[str, int, int], Dict]]:
+    """
+    Parse an IPv4 packet and return SYN-ACK details
+
+    Args:
+        packet: Raw IPv4 packet as read from a raw TCP socket
+
+    Returns:
+        ((src_ip, src_port, dst_port), fingerprint) or None if not a SYN-ACK
+    """
+    if len(packet) < 40 or packet[0] >> 4 != 4:
+        return None
+
+    ip_header_length = (packet[0] & 0x0F) * 4
+    ttl = packet[8]
+    src_ip = socket.inet_ntoa(packet[12:16])
+
+    tcp = packet[ip_header_length:]
+    if len(tcp) < 20:
+        return None
+
+    src_port, dst_port = struct.unpack('!HH', tcp[:4])
+    data_offset = (tcp[12] >> 4) * 4
+    flags = tcp[13]
+    if flags & (TCP_SYN | TCP_ACK) != (TCP_SYN | TCP_ACK):
+        return None
+
+    window = struct.unpack('!H', tcp[14:16])[0]
+    options, mss, wscale = parse_tcp_options(tcp[20:data_offset])
+
+    return (src_ip, src_port, dst_port), {
+        'ttl': ttl,
+        'window': window,
+        'options': options,
+        'mss': mss,
+        'wscale': wscale
+    }
+
+
+class SynAckSniffer:
+    """
+    Listens on a raw TCP socket while the connect scan runs
+
+    Only SYN-ACKs are kept, keyed by (remote IP, remote port, local port),
+    so each open port found by the scanner can be matched to the packet
+    that opened it. No packets are sent.
+    """
+
+    def __init__(self):
+        self.sock = None
+        self.captured: Dict[Tuple[str, int, int], Dict] = {}
+        self._loop = None
+
+    def start(self) -> bool:
+        """
+        Open the raw socket and start reading
+
+        Returns:
+            True if capture is running (needs CAP_NET_RAW / root on Linux)
+        """
+        try:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP)
+            try:
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_SIZE)
+            except OSError:
+                pass
+            self.sock.setblocking(False)
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(self.sock.fileno(), self.drain)
+            return True
+        except (OSError, NotImplementedError, AttributeError):
+            self.stop()
+            return False
+
+    def drain(self):
+        """
+        Read every packet currently queued on the socket
+        """
+        if not self.sock:
+            return
+        while True:
+            try:
+                packet = self.sock.recv(65535)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return
+
+            parsed = parse_syn_ack(packet)
+            if parsed:
+                key, fingerprint = parsed
+                self.captured.setdefault(key, fingerprint)
+
+    def lookup(self, ip: str, port: int, local_port: int) -> Optional[Dict]:
+        """
+        Find the SYN-ACK that answered a specific connection
+
+        Args:
+            ip: Remote IP
+            port: Remote port
+            local_port: Our ephemeral port for the connection
+
+        Returns:
+            Fingerprint dict or None
+        """
+        return self.captured.get((ip, port, local_port))
+
+    def stop(self):
+        """
+        Stop reading and close the socket
+        """
+        if self.sock:
+            if self._loop:
+                try:
+                    self._loop.remove_reader(self.sock.fileno())
+                except Exception:
+                    pass
+            self.sock.close()
+            self.sock = None
@@ -9,6 +9,7 @@ import asyncio
 from datetime import datetime
 from typing import Dict, Any, Callable
 from rich.console import Console
+from modules.packs import reload_packs
 
 console = Console()
 
@@ -262,6 +263,12 @@ class AssetWatcher:
                 console.print(f"[bold yellow]🔄 SCAN #{self.scan_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/bold yellow]")
                 console.print(f"[bold yellow]{'='*60}[/bold yellow]\n")
                 
+                # Pick up signature packs edited since the last scan
+                if self.scan_count > 1:
+                    reloaded = reload_packs()
+                    if reloaded:
+                        console.print(f"[*] Reloaded signature packs: [cyan]{', '.join(reloaded)}[/cyan]")
+                
                 # Run the scan
                 scan_data = await scan_func(domain, False, skip_fuzz)
                 
@@ -0,0 +1,133 @@
+"""
+EYE - Worker Sharding Module
+Splits the host list across processes, each running its own event loop
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List
+from rich.console import Console
+from modules.offload import OFFLOAD_WORKERS, parse_executor
+
+console = Console()
+
+
+# Phase result sections and how shards are combined
+LIST_SECTIONS = ['scan_results', 'sensitive_files', 'cors_vulnerabilities']
+DICT_SECTIONS = [
+    'os_detection',
+    'technology_stack',
+    'harvest_results',
+    'security_audit',
+    'social_profiles',
+    'redteam_actuators',
+    'redteam_bypasses'
+]
+# Index objects combined with their merge() method
+MERGE_SECTIONS = ['contact_index']
+
+
+def shard_hosts(hosts, workers: int) -> List[List[str]]:
+    """
+    Split hosts into round-robin shards
+
+    Lists keep their order (so prioritized hosts lead every shard);
+    other collections are sorted for stable shards.
+
+    Args:
+        hosts: Collection of hostnames
+        workers: Number of shards wanted
+
+    Returns:
+        List of non-empty host lists
+    """
+    host_list = list(hosts) if isinstance(hosts, list) else sorted(hosts)
+    workers = max(1, min(workers, len(host_list)))
+    return [host_list[i::workers] for i in range(workers) if host_list[i::workers]]
+
+
+def merge_results(shard_results: List[Dict]) -> Dict:
+    """
+    Merge per-shard phase results into a single result dictionary
+
+    Args:
+        shard_results: Phase result dicts returned by each shard
+
+    Returns:
+        Combined phase results
+    """
+    merged = {section: [] for section in LIST_SECTIONS}
+    merged.update({section: {} for section in DICT_SECTIONS})
+    merged.update({section: None for section in MERGE_SECTIONS})
+
+    for result in shard_results:
+        for section in LIST_SECTIONS:
+            merged[section].extend(result.get(section) or [])
+        for section in DICT_SECTIONS:
+            merged[section].update(result.get(section) or {})
+        for section in MERGE_SECTIONS:
+            part = result.get(section)
+            if part is None:
+                continue
+            if merged[section] is None:
+                merged[section] = part
+            else:
+                merged[section].merge(part)
+
+    return merged
+
+
+def _run_shard(scan_func: Callable, hosts: List[str], skip_fuzz: bool, parse_workers: int) -> Dict:
+    """
+    Process entry point: run one shard on a fresh event loop
+
+    Args:
+        scan_func: Async scan function taking (hosts, skip_fuzz)
+        hosts: Hosts assigned to this shard
+        skip_fuzz: Skip sensitive file fuzzing
+        parse_workers: Size of this shard's parse offload pool
+
+    Returns:
+        Phase results for the shard
+    """
+    # Shards split the cores between them instead of each starting one parser per core
+    parse_executor.workers = parse_workers
+    return asyncio.run(scan_func(hosts, skip_fuzz))
+
+
+async def scan_sharded(scan_func: Callable, hosts, workers: int, skip_fuzz: bool = False) -> Dict:
+    """
+    Run scan_func over host shards in separate processes and merge the results
+
+    Each process gets its own event loop and therefore its own connection
+    pools, so CPU-heavy parsing in one shard does not stall the others.
+
+    Args:
+        scan_func: Module-level async function taking (hosts, skip_fuzz)
+        hosts: Collection of hostnames to scan
+        workers: Number of worker processes
+        skip_fuzz: Skip sensitive file fuzzing
+
+    Returns:
+        Merged phase results
+    """
+    shards = shard_hosts(hosts, workers)
+    console.print(f"[*] Sharding [cyan]{len(hosts)}[/cyan] hosts across [cyan]{len(shards)}[/cyan] worker processes...")
+
+    parse_workers = max(1, OFFLOAD_WORKERS // len(shards))
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+        futures = [
+            loop.run_in_executor(pool, _run_shard, scan_func, shard, skip_fuzz, parse_workers)
+            for shard in shards
+        ]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+    shard_results = []
+    for index, result in enumerate(results):
+        if isinstance(result, Exception):
+            console.print(f"[!] [red]Worker {index + 1} failed: {str(result)}[/red]")
+        else:
+            shard_results.append(result)
+
+    return merge_results(shard_results)
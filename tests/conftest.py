@@ -0,0 +1,15 @@
+"""
+Test setup: import modules from the repository root, falling back to the
+config template when no config.py has been created yet (as main.py does)
+"""
+
+import importlib
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+if not os.path.exists(os.path.join(ROOT, 'config.py')):
+    sys.modules['config'] = importlib.import_module('config_template')
@@ -0,0 +1,94 @@
+"""
+Tests for response baselines used to reject bypass look-alikes
+"""
+
+import asyncio
+
+import aiohttp
+from aiohttp import web
+
+from modules.baseline import HostBaseline, fingerprint, similar
+
+HOMEPAGE = '<html><title>Example</title><body>' + 'Welcome to the example shop, browse our products. ' * 20 + '</body></html>'
+NOT_FOUND = '<html><title>Not Found</title><body>The page you requested could not be found.</body></html>'
+ADMIN = '<html><title>Admin</title><body>' + 'Dashboard users settings billing reports. ' * 20 + '</body></html>'
+
+
+def test_similar_pages_match_despite_reflected_path():
+    baseline = fingerprint(404, NOT_FOUND.replace('requested', 'requested /abc'), None, 'http://x/abc')
+    candidate = fingerprint(404, NOT_FOUND.replace('requested', 'requested /admin'), None, 'http://x/admin')
+    assert similar(candidate, baseline)
+
+
+def test_different_pages_do_not_match():
+    assert not similar(fingerprint(200, ADMIN), fingerprint(200, HOMEPAGE))
+
+
+def test_simhash_is_only_computed_past_the_cheap_checks():
+    baseline = fingerprint(200, HOMEPAGE, None, 'http://x/')
+    candidate = fingerprint(200, ADMIN, None, 'http://x/admin')
+    assert not similar(candidate, baseline)
+    assert 'simhash' not in vars(candidate) and 'simhash' not in vars(baseline)
+
+    fresh = fingerprint(200, HOMEPAGE, None, 'http://x/')
+    assert not similar(fingerprint(302, '', '/a', 'http://x/'), fresh)
+    assert not similar(fingerprint(200, NOT_FOUND, None, 'http://x/b'), fresh)
+    assert 'title' not in vars(fresh) and 'simhash' not in vars(fresh)
+
+
+def test_redirects_match_on_target():
+    assert similar(fingerprint(302, '', '/login', 'http://x/a'), fingerprint(301, '', 'http://x/login/', 'http://x/b'))
+    assert not similar(fingerprint(302, '', '/login', 'http://x/a'), fingerprint(302, '', '/home', 'http://x/b'))
+
+
+def test_match_rejects_redirects_to_root_and_homepage_hop():
+    baseline = HostBaseline(
+        {'homepage': fingerprint(200, HOMEPAGE, None, 'http://x/')},
+        {'x/': 'homepage', 'x/en': 'homepage'}
+    )
+    assert baseline.match(fingerprint(302, '', '/', 'http://x/admin..;/')) == 'homepage'
+    assert baseline.match(fingerprint(301, '', 'http://x/en/', 'http://x/admin')) == 'homepage'
+    assert baseline.match(fingerprint(200, HOMEPAGE, None, 'http://x/admin')) == 'homepage'
+    assert baseline.match(fingerprint(302, '', '/admin/dashboard', 'http://x/admin')) is None
+    assert baseline.match(fingerprint(200, ADMIN, None, 'http://x/admin')) is None
+    assert baseline.rejected['homepage'] == 3
+
+
+def test_build_records_homepage_redirect_and_soft_errors():
+    async def homepage(request):
+        raise web.HTTPFound('/en/')
+
+    async def localized(request):
+        return web.Response(text=HOMEPAGE, content_type='text/html')
+
+    async def admin(request):
+        return web.Response(status=403, text='Forbidden', content_type='text/html')
+
+    async def missing(request):
+        raise web.HTTPFound('/errors/404')
+
+    async def run():
+        app = web.Application()
+        app.router.add_get('/', homepage)
+        app.router.add_get('/en/', localized)
+        app.router.add_get('/admin', admin)
+        app.router.add_get('/{path:.*}', missing)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        origin = f'http://127.0.0.1:{port}'
+        try:
+            async with aiohttp.ClientSession() as session:
+                baseline = await HostBaseline.build(session, origin + '/admin', asyncio.Semaphore(5))
+        finally:
+            await runner.cleanup()
+        return origin, baseline
+
+    origin, baseline = asyncio.run(run())
+    assert set(baseline.fingerprints) == {'homepage', 'not_found', 'forbidden'}
+    assert baseline.match(fingerprint(302, '', '/en/', origin + '/admin%2f')) == 'homepage'
+    assert baseline.match(fingerprint(302, '', '/errors/404', origin + '/admin/.')) == 'not_found'
+    assert baseline.match(fingerprint(200, HOMEPAGE, None, origin + '/;/admin')) == 'homepage'
+    assert baseline.match(fingerprint(200, ADMIN, None, origin + '/;/admin')) is None
@@ -0,0 +1,10 @@
+"""
+Tests for link extraction
+"""
+
+from modules.document import extract_links
+
+
+def test_only_the_href_attribute_is_read():
+    html = '<a data-href="/data" href="/page">a</a><a xhref="/x">b</a><a class=nav HREF=/upper>c</a>'
+    assert extract_links('http://example.com/', html) == ['http://example.com/page', 'http://example.com/upper']
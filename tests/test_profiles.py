@@ -0,0 +1,29 @@
+"""
+Tests for profile verification rate limiting
+"""
+
+import asyncio
+import time
+
+from modules.profiles import RateLimiter
+
+
+def test_pause_holds_back_requests_already_waiting():
+    async def run():
+        limiter = RateLimiter(20)
+        start = time.monotonic()
+        fired = []
+
+        async def request(number):
+            await limiter.wait()
+            fired.append(time.monotonic() - start)
+            if number == 0:
+                limiter.pause(0.3)
+
+        await asyncio.gather(*(request(number) for number in range(4)))
+        return fired
+
+    fired = asyncio.run(run())
+    assert fired[0] < 0.1
+    assert all(moment >= 0.3 for moment in fired[1:])
+    assert all(later - earlier >= 0.04 for earlier, later in zip(fired[1:], fired[2:]))
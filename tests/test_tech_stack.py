@@ -0,0 +1,75 @@
+"""
+Tests for tiered tech detection
+"""
+
+import asyncio
+
+from modules.packs import get_pack
+from modules.tech_stack import TECH_BODY_LIMIT, TECH_CHUNK_SIZE, TechSignatures, _read_body
+
+HEAD = (
+    '<html><head><title>Blog</title>'
+    '<meta name="generator" content="WordPress 6.4.2">'
+    '<script src="/wp-includes/js/jquery/jquery-3.7.1.min.js"></script>'
+    '</head><body>'
+)
+FILLER = '<p>Lorem ipsum dolor sit amet.</p>' * 5000
+
+
+class FakeContent:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    async def iter_chunked(self, size: int):
+        for start in range(0, len(self.body), size):
+            yield self.body[start:start + size]
+
+
+class FakeResponse:
+    charset = 'utf-8'
+
+    def __init__(self, body: str):
+        self.content = FakeContent(body.encode('utf-8'))
+
+
+def scan_page(body: str, signatures=None, stop_when_decided: bool = True):
+    signatures = signatures or get_pack('tech')
+    scan = signatures.body_scan(set())
+    read = asyncio.run(_read_body(FakeResponse(body), scan, stop_when_decided))
+    return signatures, scan, read
+
+
+def names(signatures, scan):
+    return {signatures.technologies[index]['name'] for index in scan.matched}
+
+
+def test_late_body_signatures_are_detected():
+    body = HEAD + FILLER + '<div id="__nuxt"></div><input name="csrfmiddlewaretoken">' + \
+        '<footer><img src="/wp-content/uploads/logo.png"> Powered by Shopify</footer></body></html>'
+    assert len(body) < TECH_BODY_LIMIT
+
+    signatures, scan, read = scan_page(body)
+
+    assert read == len(body)
+    assert {'WordPress', 'jQuery', 'Nuxt.js', 'Django', 'Shopify'} <= names(signatures, scan)
+    assert scan.versions
+
+
+def test_stops_once_nothing_is_pending():
+    signatures = TechSignatures([
+        {'name': 'WordPress', 'category': 'cms', 'body': ['wp-content']},
+        {'name': 'jQuery', 'category': 'js_libraries', 'scripts': ['jquery'], 'version': 'jquery[/-]([0-9.]+)'},
+    ])
+    body = HEAD.replace('</head>', '<link href="/wp-content/style.css"></head>') + FILLER
+
+    _, scan, read = scan_page(body, signatures)
+
+    assert not scan.pending
+    assert read <= TECH_CHUNK_SIZE
+    assert names(signatures, scan) == {'WordPress', 'jQuery'}
+
+
+def test_full_mode_reads_whole_body():
+    body = HEAD + FILLER + '</body></html>'
+    _, _, read = scan_page(body, stop_when_decided=False)
+    assert read == len(body)